@@ -33,6 +33,8 @@ class ReviewQueueGenerator:
 
     Attributes:
         config: Classification pipeline configuration.
+        human_review_sources: Platforms from ``config`` that always need
+            review, as a set for constant-time lookup.
     """
 
     def __init__(self, config: ClassificationConfig | None = None) -> None:
@@ -42,6 +44,9 @@ class ReviewQueueGenerator:
             config: Classification configuration. If None, uses defaults.
         """
         self.config = config or ClassificationConfig()
+        self.human_review_sources: frozenset[str] = frozenset(
+            self.config.human_review_sources
+        )
 
     def needs_review(self, fragment: Fragment) -> bool:
         """Check whether a fragment should be flagged for human review.
@@ -61,7 +66,7 @@ class ReviewQueueGenerator:
         if fragment.frequency.primary == Frequency.UNCLASSIFIED:
             return True
 
-        if fragment.source.platform in self.config.human_review_sources:
+        if fragment.source.platform in self.human_review_sources:
             return True
 
         if fragment.voice.confidence is None:
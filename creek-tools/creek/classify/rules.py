@@ -63,7 +63,9 @@ class RuleClassifier:
 
         Scans the provided content string for keywords associated with
         each frequency, phase, and mode. The first match wins for each
-        classification dimension. The original fragment is not mutated.
+        classification dimension. The original fragment is not mutated;
+        the result is a :meth:`~pydantic.BaseModel.model_copy`, so the
+        already-validated fragment is not validated again.
 
         Args:
             fragment: The fragment to classify.
@@ -80,21 +82,16 @@ class RuleClassifier:
 
         updates: dict[str, object] = {}
 
-        if frequency != Frequency.UNCLASSIFIED:
+        if frequency is not Frequency.UNCLASSIFIED:
             updates["frequency"] = FrequencyClassification(primary=frequency)
             logger.info("Rule classifier matched frequency %s", frequency)
 
-        if phase != Phase.UNCLASSIFIED or mode != Mode.UNCLASSIFIED:
-            wl_phase = phase if phase != Phase.UNCLASSIFIED else Phase.UNCLASSIFIED
-            wl_mode = mode if mode != Mode.UNCLASSIFIED else Mode.UNCLASSIFIED
-            if phase != Phase.UNCLASSIFIED:
+        if phase is not Phase.UNCLASSIFIED or mode is not Mode.UNCLASSIFIED:
+            if phase is not Phase.UNCLASSIFIED:
                 logger.info("Rule classifier matched phase %s", phase)
-            if mode != Mode.UNCLASSIFIED:
+            if mode is not Mode.UNCLASSIFIED:
                 logger.info("Rule classifier matched mode %s", mode)
-            updates["wavelength"] = WavelengthClassification(
-                phase=wl_phase,
-                mode=wl_mode,
-            )
+            updates["wavelength"] = WavelengthClassification(phase=phase, mode=mode)
 
         if updates:
             return fragment.model_copy(update=updates)
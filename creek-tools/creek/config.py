@@ -104,6 +104,19 @@ class RedactionConfig(BaseModel):
     false_positive_allowlist: list[str] = Field(default_factory=list)
     """Strings that should never be flagged as PII."""
 
+    workers: int = Field(default=1, ge=1)
+    """Processes used to scan directories; ``1`` scans serially."""
+
+    max_scan_bytes: int | None = Field(default=None, ge=1)
+    """Files larger than this are skipped by the scanner; ``None`` scans all."""
+
+
+class IngestConfig(BaseModel):
+    """Ingestion stage configuration."""
+
+    workers: int = Field(default=1, ge=1)
+    """Processes used to parse source documents; ``1`` parses serially."""
+
 
 _READONLY_SCOPES: set[str] = {
     "https://www.googleapis.com/auth/drive.readonly",
@@ -219,6 +232,9 @@ class CreekConfig(BaseSettings):
     redaction: RedactionConfig = Field(default_factory=RedactionConfig)
     """PII redaction scanner settings."""
 
+    ingest: IngestConfig = Field(default_factory=IngestConfig)
+    """Ingestion stage settings."""
+
     google_drive: GoogleDriveConfig = Field(
         default_factory=GoogleDriveConfig,
     )
@@ -17,14 +17,20 @@ from __future__ import annotations
 import abc
 import hashlib
 import logging
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path  # noqa: TC003 — needed at runtime by Pydantic
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from zoneinfo import ZoneInfo
 
 import chardet
 from pydantic import BaseModel, ConfigDict, Field
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+    from concurrent.futures import Future
+
 logger = logging.getLogger(__name__)
 
 # ---- Constants ----
@@ -38,8 +44,8 @@ LA_TZ = ZoneInfo("America/Los_Angeles")
 class RawDocument(BaseModel):
     """A raw document discovered by an ingestor before parsing.
 
-    Holds the file path, raw byte content, arbitrary metadata, and the
-    detected character encoding.
+    Holds the file path, raw byte content, arbitrary metadata, the
+    detected character encoding, and optionally the already-decoded text.
     """
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -56,6 +62,9 @@ class RawDocument(BaseModel):
     detected_encoding: str
     """Character encoding detected or declared for this document."""
 
+    decoded_text: str | None = None
+    """Text decoded during discovery, if any, so ``parse`` can skip re-decoding."""
+
 
 class ParsedFragment(BaseModel):
     """A structured content fragment extracted from a raw document.
@@ -284,7 +293,10 @@ class Ingestor(abc.ABC):
     4. **generate_frontmatter** — produce YAML frontmatter metadata
 
     The concrete ``ingest()`` method orchestrates these stages and collects
-    results, provenance, and errors into an ``IngestResult``.
+    results, provenance, and errors into an ``IngestResult``. It consumes
+    documents through ``iter_discover()``, which defaults to iterating
+    ``discover()``; subclasses that can read sources lazily override it so
+    each document is parsed and released before the next one is read.
 
     Subclasses must implement all four abstract methods.
     """
@@ -300,6 +312,41 @@ class Ingestor(abc.ABC):
             A list of ``RawDocument`` objects found at the source.
         """
 
+    def iter_discover(self, source_path: Path) -> Iterator[RawDocument]:
+        """Yield documents at the given source path one at a time.
+
+        The default implementation iterates over ``discover()``. Subclasses
+        override this to read documents lazily so that only one document's
+        content needs to be held in memory at a time.
+
+        Args:
+            source_path: The directory or file path to search.
+
+        Yields:
+            ``RawDocument`` objects found at the source.
+        """
+        yield from self.discover(source_path)
+
+    def iter_discover_files(
+        self, source_path: Path, files: Sequence[Path]
+    ) -> Iterator[RawDocument]:
+        """Yield documents using a pre-built list of the files under *source_path*.
+
+        Callers that have already walked the source tree (such as the
+        pipeline) pass the file list here so that ingestors which would
+        otherwise walk the whole tree again can filter it in memory.  The
+        default implementation ignores *files* and delegates to
+        ``iter_discover()``.
+
+        Args:
+            source_path: The directory the file list was built from.
+            files: Every regular file beneath *source_path*.
+
+        Yields:
+            ``RawDocument`` objects found at the source.
+        """
+        yield from self.iter_discover(source_path)
+
     @abc.abstractmethod
     def parse(self, raw: RawDocument) -> list[ParsedFragment]:
         """Extract structured content from a raw document.
@@ -333,16 +380,30 @@ class Ingestor(abc.ABC):
             A dict of frontmatter key-value pairs.
         """
 
-    def ingest(self, source_path: Path) -> IngestResult:
+    def ingest(
+        self,
+        source_path: Path,
+        files: Sequence[Path] | None = None,
+        workers: int = 1,
+    ) -> IngestResult:
         """Orchestrate the full ingest pipeline: discover, parse, convert, frontmatter.
 
-        Calls ``discover()`` to find documents, then for each document calls
+        Calls ``iter_discover()`` (or ``iter_discover_files()`` when *files*
+        is given) to find documents, then for each document calls
         ``parse()`` to extract fragments. For each fragment, calls
         ``convert_to_markdown()`` and ``generate_frontmatter()``. Collects
         all results into an ``IngestResult``, handling errors gracefully.
 
+        With more than one worker, ``parse()`` runs in a process pool while
+        discovery and the remaining stages stay in this process; results
+        keep discovery order either way.
+
         Args:
             source_path: The directory or file path to ingest from.
+            files: Optional list of every file beneath *source_path*, from
+                a walk the caller has already done.
+            workers: Number of processes used to parse documents; ``1``
+                parses serially.
 
         Returns:
             An ``IngestResult`` containing fragments, provenance, and errors.
@@ -351,33 +412,46 @@ class Ingestor(abc.ABC):
         ingestor_name = type(self).__name__
         now = datetime.now(tz=LA_TZ)
 
-        # Stage 1: Discover
-        raw_docs = self._discover_safe(source_path, result)
-
+        # Stage 1: Discover (lazily, one document at a time)
         # Stages 2-4: Parse, Convert, Frontmatter
-        for raw_doc in raw_docs:
-            self._process_document(raw_doc, result, ingestor_name, now)
+        documents = self._discover_safe(source_path, result, files)
+        if workers > 1:
+            for fragments in self._parse_parallel(documents, result, workers):
+                for fragment in fragments:
+                    self._process_fragment(fragment, result, ingestor_name, now)
+        else:
+            for raw_doc in documents:
+                self._process_document(raw_doc, result, ingestor_name, now)
 
         return result
 
     def _discover_safe(
-        self, source_path: Path, result: IngestResult
-    ) -> list[RawDocument]:
-        """Safely call discover(), catching and logging errors.
+        self,
+        source_path: Path,
+        result: IngestResult,
+        files: Sequence[Path] | None = None,
+    ) -> Iterator[RawDocument]:
+        """Safely iterate discovered documents, catching and logging errors.
+
+        Documents yielded before an error are still processed; discovery
+        stops at the first error.
 
         Args:
             source_path: The path to discover documents at.
             result: The IngestResult to append errors to.
+            files: Optional pre-built file list for ``iter_discover_files()``.
 
-        Returns:
-            A list of discovered RawDocuments, or empty on error.
+        Yields:
+            Discovered RawDocuments until exhaustion or the first error.
         """
         try:
-            return self.discover(source_path)
+            if files is None:
+                yield from self.iter_discover(source_path)
+            else:
+                yield from self.iter_discover_files(source_path, files)
         except Exception as exc:
             result.errors.append(f"discover error: {exc}")
             logger.exception("Error during discover for %s", source_path)
-            return []
 
     def _process_document(
         self,
@@ -417,6 +491,39 @@ class Ingestor(abc.ABC):
             logger.exception("Error parsing %s", raw_doc.path)
             return []
 
+    def _parse_parallel(
+        self,
+        documents: Iterable[RawDocument],
+        result: IngestResult,
+        workers: int,
+    ) -> Iterator[list[ParsedFragment]]:
+        """Parse *documents* across a pool of worker processes.
+
+        Each worker receives a copy of this ingestor once, at start-up. At
+        most two documents per worker are in flight, so discovery stays
+        lazy and memory stays bounded however many documents there are.
+
+        Args:
+            documents: Documents to parse, in discovery order.
+            result: The IngestResult to append parse errors to.
+            workers: Number of worker processes.
+
+        Yields:
+            Each document's fragments (empty on error), in discovery order.
+        """
+        pending: deque[tuple[Path, Future[list[ParsedFragment]]]] = deque()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self,),
+        ) as pool:
+            for raw_doc in documents:
+                pending.append((raw_doc.path, pool.submit(_parse_one, raw_doc)))
+                if len(pending) >= workers * 2:
+                    yield _collect_parsed(*pending.popleft(), result)
+            while pending:
+                yield _collect_parsed(*pending.popleft(), result)
+
     def _process_fragment(
         self,
         fragment: ParsedFragment,
@@ -505,3 +612,59 @@ class Ingestor(abc.ABC):
                 "Error generating frontmatter for %s", fragment.source_path
             )
             return None
+
+
+# ---- Parallel parsing ----
+
+
+_worker_ingestor: Ingestor | None = None
+"""Ingestor owned by the current pool worker process."""
+
+
+def _init_worker(ingestor: Ingestor) -> None:
+    """Install the parent's ingestor in this worker process.
+
+    Args:
+        ingestor: The ingestor that started the pool.
+    """
+    global _worker_ingestor
+    _worker_ingestor = ingestor
+
+
+def _parse_one(raw_doc: RawDocument) -> list[ParsedFragment]:
+    """Parse *raw_doc* with the worker's ingestor.
+
+    Args:
+        raw_doc: The raw document to parse.
+
+    Returns:
+        The fragments extracted from the document.
+
+    Raises:
+        RuntimeError: If called outside an initialised worker.
+    """
+    if _worker_ingestor is None:
+        msg = "Ingest worker was not initialised"
+        raise RuntimeError(msg)
+    return _worker_ingestor.parse(raw_doc)
+
+
+def _collect_parsed(
+    path: Path, future: Future[list[ParsedFragment]], result: IngestResult
+) -> list[ParsedFragment]:
+    """Wait for a worker's parse result, recording a failure as an error.
+
+    Args:
+        path: Path of the document that was parsed.
+        future: The pending parse result.
+        result: The IngestResult to append errors to.
+
+    Returns:
+        The parsed fragments, or empty on error.
+    """
+    try:
+        return future.result()
+    except Exception as exc:
+        result.errors.append(f"parse error for {path}: {exc}")
+        logger.exception("Error parsing %s", path)
+        return []
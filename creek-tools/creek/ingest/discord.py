@@ -26,13 +26,16 @@ from __future__ import annotations
 import json
 import logging
 import re
-from datetime import datetime, timedelta
+import sys
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
 from creek.ingest.base import (
+    LA_TZ,
     Ingestor,
     ParsedFragment,
     RawDocument,
@@ -46,6 +49,12 @@ logger = logging.getLogger(__name__)
 TIME_PROXIMITY_MINUTES = 5
 """Maximum gap (minutes) between messages from the same author to group."""
 
+_PROXIMITY_WINDOW = timedelta(minutes=TIME_PROXIMITY_MINUTES)
+"""``TIME_PROXIMITY_MINUTES`` as a timedelta, built once for comparisons."""
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC).astimezone(LA_TZ)
+"""Fallback timestamp (the Unix epoch in the target timezone)."""
+
 _SPOILER_PATTERN = re.compile(r"\|\|(.+?)\|\|")
 """Regex pattern matching Discord spoiler tags ``||content||``."""
 
@@ -96,9 +105,11 @@ def _format_discord_content(content: str) -> str:
     Returns:
         The content with Discord formatting converted to Markdown.
     """
+    # Most messages carry no spoiler markup; skip the regex pass for them.
+    if "||" not in content:
+        return content
     # Convert spoiler tags: ||spoiler|| -> [SPOILER: spoiler]
-    result = _SPOILER_PATTERN.sub(r"[SPOILER: \1]", content)
-    return result
+    return _SPOILER_PATTERN.sub(r"[SPOILER: \1]", content)
 
 
 def _format_reply_context(parent_msg: dict[str, Any]) -> str:
@@ -124,10 +135,12 @@ def _safe_author_name(msg: dict[str, Any]) -> str:
     Returns:
         The author name, or ``"Unknown"`` if missing.
     """
-    author = msg.get("author")
-    if isinstance(author, dict):
-        return str(author.get("name", "Unknown"))
-    return "Unknown"
+    # Direct subscripts: a missing key or a non-dict author both fall out
+    # as exceptions, keeping the common well-formed case to two lookups.
+    try:
+        return str(msg["author"]["name"])
+    except (KeyError, TypeError):
+        return "Unknown"
 
 
 def _safe_timestamp(msg: dict[str, Any]) -> str:
@@ -184,12 +197,15 @@ def _get_reference_id(msg: dict[str, Any]) -> str | None:
     Returns:
         The referenced message ID string, or ``None``.
     """
+    # Most messages are not replies; answer that case without raising.
     ref = msg.get("reference")
-    if isinstance(ref, dict):
-        mid = ref.get("messageId")
-        if mid is not None:
-            return str(mid)
-    return None
+    if ref is None:
+        return None
+    try:
+        mid = ref["messageId"]
+    except (KeyError, TypeError):
+        return None
+    return None if mid is None else str(mid)
 
 
 def _group_messages(
@@ -216,71 +232,54 @@ def _group_messages(
         return []
 
     groups: list[list[dict[str, Any]]] = []
-    current_group: list[dict[str, Any]] = [messages[0]]
-    current_group_ids: set[str] = {str(messages[0].get("id", ""))}
-
-    for msg in messages[1:]:
-        if _should_join_group(msg, current_group, current_group_ids):
-            current_group.append(msg)
-            msg_id = str(msg.get("id", ""))
+    current_group: list[dict[str, Any]] = []
+    current_group_ids: set[str] = set()
+    last_author = ""
+    last_ts: datetime | None = None
+
+    # Single pass: each message's ID, reply reference, author and parsed
+    # timestamp are extracted exactly once and carried forward for the
+    # next comparison.
+    for msg in messages:
+        msg_id = str(msg.get("id", ""))
+        ref_id = _get_reference_id(msg)
+        author = _safe_author_name(msg)
+        ts = _parse_msg_timestamp(msg)
+
+        if not current_group:
+            current_group_ids.add(msg_id)
+        elif (ref_id is not None and ref_id in current_group_ids) or (
+            author == last_author and _is_within_window(ts, last_ts)
+        ):
+            # Reply to a message in the group, or same author within 5 minutes
             if msg_id:
                 current_group_ids.add(msg_id)
         else:
             groups.append(current_group)
-            current_group = [msg]
-            current_group_ids = {str(msg.get("id", ""))}
+            current_group = []
+            current_group_ids = {msg_id}
+
+        current_group.append(msg)
+        last_author = author
+        last_ts = ts
 
     groups.append(current_group)
     return groups
 
 
-def _should_join_group(
-    msg: dict[str, Any],
-    current_group: list[dict[str, Any]],
-    current_group_ids: set[str],
-) -> bool:
-    """Determine whether a message should join the current group.
-
-    Args:
-        msg: The message to evaluate.
-        current_group: The current group of messages.
-        current_group_ids: Set of message IDs in the current group.
-
-    Returns:
-        ``True`` if the message should join the current group.
-    """
-    # Check reply chain: does this message reply to one in the group?
-    ref_id = _get_reference_id(msg)
-    if ref_id is not None and ref_id in current_group_ids:
-        return True
-
-    # Check time proximity: same author within 5 minutes of last message
-    last_msg = current_group[-1]
-    return _is_time_proximate(msg, last_msg)
-
-
-def _is_time_proximate(msg: dict[str, Any], last_msg: dict[str, Any]) -> bool:
-    """Check if two messages are from the same author within time threshold.
+def _is_within_window(msg_ts: datetime | None, last_ts: datetime | None) -> bool:
+    """Check if two parsed timestamps fall within the time proximity threshold.
 
     Args:
-        msg: The candidate message.
-        last_msg: The last message in the current group.
+        msg_ts: The candidate message's timestamp, if it parsed.
+        last_ts: The previous message's timestamp, if it parsed.
 
     Returns:
-        ``True`` if same author and within the time proximity threshold.
+        ``True`` if both timestamps are present and within the threshold.
     """
-    msg_author = _safe_author_name(msg)
-    last_author = _safe_author_name(last_msg)
-    if msg_author != last_author:
-        return False
-
-    msg_ts = _parse_msg_timestamp(msg)
-    last_ts = _parse_msg_timestamp(last_msg)
     if msg_ts is None or last_ts is None:
         return False
-
-    delta = abs(msg_ts - last_ts)
-    return delta <= timedelta(minutes=TIME_PROXIMITY_MINUTES)
+    return abs(msg_ts - last_ts) <= _PROXIMITY_WINDOW
 
 
 # ---- DiscordIngestor ----
@@ -308,10 +307,23 @@ class DiscordIngestor(Ingestor):
         Returns:
             A list of ``RawDocument`` objects, one per channel.
         """
-        docs: list[RawDocument] = []
+        return list(self.iter_discover(source_path))
+
+    def iter_discover(self, source_path: Path) -> Iterator[RawDocument]:
+        """Lazily yield one ``RawDocument`` per channel directory.
+
+        Each channel's ``messages.json`` is read only when the consumer
+        asks for the next document.
+
+        Args:
+            source_path: Root directory of the Discord data export.
+
+        Yields:
+            A ``RawDocument`` for each channel with a ``messages.json``.
+        """
         messages_dir = source_path / "messages"
         if not messages_dir.is_dir():
-            return docs
+            return
 
         for channel_dir in sorted(messages_dir.iterdir()):
             if not channel_dir.is_dir():
@@ -324,17 +336,13 @@ class DiscordIngestor(Ingestor):
             metadata = self._load_channel_metadata(channel_dir)
             metadata["channel_dir"] = str(channel_dir)
 
-            docs.append(
-                RawDocument(
-                    path=messages_file,
-                    content=raw_bytes,
-                    metadata=metadata,
-                    detected_encoding="utf-8",
-                )
+            yield RawDocument(
+                path=messages_file,
+                content=raw_bytes,
+                metadata=metadata,
+                detected_encoding="utf-8",
             )
 
-        return docs
-
     def _load_channel_metadata(self, channel_dir: Path) -> dict[str, Any]:
         """Load channel metadata from ``channel.json`` if it exists.
 
@@ -383,20 +391,19 @@ class DiscordIngestor(Ingestor):
         groups = _group_messages(messages)
         channel_name = raw.metadata.get("channel_name", "unknown")
         channel_id = raw.metadata.get("channel_id", "unknown")
+        source_path = str(raw.path)
 
-        fragments: list[ParsedFragment] = []
-        for group in groups:
-            fragment = self._group_to_fragment(
+        candidates = (
+            self._group_to_fragment(
                 group=group,
                 msg_index=msg_index,
                 channel_name=channel_name,
                 channel_id=channel_id,
-                source_path=str(raw.path),
+                source_path=source_path,
             )
-            if fragment is not None:
-                fragments.append(fragment)
-
-        return fragments
+            for group in groups
+        )
+        return [fragment for fragment in candidates if fragment is not None]
 
     def _parse_messages_json(self, text: str, path: Path) -> list[dict[str, Any]]:
         """Parse the messages JSON text, handling both array and object formats.
@@ -447,19 +454,15 @@ class DiscordIngestor(Ingestor):
         Returns:
             A ``ParsedFragment``, or ``None`` if the group has no content.
         """
-        content_parts: list[str] = []
-        authors: set[str] = set()
-
-        for msg in group:
-            part = self._format_message(msg, msg_index)
-            if part:
-                content_parts.append(part)
-            authors.add(_safe_author_name(msg))
-
-        if not content_parts:
+        content = "\n\n".join(
+            filter(None, [self._format_message(msg, msg_index) for msg in group])
+        )
+        if not content:
             return None
 
-        content = "\n\n".join(content_parts)
+        # JSON decoding yields a fresh string per occurrence; intern the
+        # names kept in fragment metadata so repeat authors share one object.
+        authors = {sys.intern(_safe_author_name(msg)) for msg in group}
         first_ts = _safe_timestamp(group[0])
         timestamp = self._resolve_timestamp(first_ts)
 
@@ -508,10 +511,7 @@ class DiscordIngestor(Ingestor):
         # Handle embeds
         embeds = msg.get("embeds")
         if isinstance(embeds, list):
-            for embed in embeds:
-                embed_text = self._format_embed(embed)
-                if embed_text:
-                    parts.append(embed_text)
+            parts.extend(filter(None, map(self._format_embed, embeds)))
 
         # Handle reactions
         reactions = msg.get("reactions")
@@ -581,11 +581,11 @@ class DiscordIngestor(Ingestor):
             A timezone-aware datetime in the configured timezone.
         """
         if not ts_str:
-            return normalize_timestamp("1970-01-01T00:00:00Z", None)
+            return _EPOCH
         try:
             return normalize_timestamp(ts_str, None)
         except ValueError:
-            return normalize_timestamp("1970-01-01T00:00:00Z", None)
+            return _EPOCH
 
     def convert_to_markdown(self, fragment: ParsedFragment) -> str:
         """Convert a parsed Discord fragment to clean Markdown.
@@ -10,19 +10,19 @@ Exports:
     _detect_document_type: Classify content as journal, essay, technical, or notes.
     _infer_platform: Map document type and path to a ``SourcePlatform``.
     _merge_frontmatter: Merge Creek defaults with existing frontmatter.
+    _may_have_frontmatter: Byte-level check for a frontmatter preamble.
 """
 
 from __future__ import annotations
 
 import logging
+import os
 import re
 from datetime import datetime
-from pathlib import Path
-from typing import Any
-
-import frontmatter
+from typing import TYPE_CHECKING, Any
 
 from creek.ingest.base import (
+    LA_TZ,
     Ingestor,
     ParsedFragment,
     RawDocument,
@@ -31,47 +31,74 @@ from creek.ingest.base import (
 )
 from creek.models import SourcePlatform
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from pathlib import Path
+
 logger = logging.getLogger(__name__)
 
 # ---- Pattern Constants ----
 
-_JOURNAL_PATTERNS: list[re.Pattern[str]] = [
-    re.compile(r"^\d{4}-\d{2}-\d{2}", re.MULTILINE),
-    re.compile(r"(?i)\bdear diary\b"),
-    re.compile(r"(?i)\btoday i\b"),
-    re.compile(r"(?i)\breflect(?:ed|ing)?\b"),
+_JOURNAL_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
+    ("", re.compile(r"^\d{4}-\d{2}-\d{2}", re.MULTILINE)),
+    ("dear diary", re.compile(r"\bdear diary\b", re.IGNORECASE)),
+    ("today i", re.compile(r"\btoday i\b", re.IGNORECASE)),
+    ("reflect", re.compile(r"\breflect(?:ed|ing)?\b", re.IGNORECASE)),
 ]
-"""Regex patterns that indicate journal-style content."""
+"""Regex patterns that indicate journal-style content.
 
-_ESSAY_PATTERNS: list[re.Pattern[str]] = [
-    re.compile(r"(?i)^#{1,2}\s+introduction", re.MULTILINE),
-    re.compile(r"(?i)^#{1,2}\s+conclusion", re.MULTILINE),
-    re.compile(r"(?i)\bthesis\b"),
-    re.compile(r"(?i)\bin this essay\b"),
+Each pattern is paired with a lowercase literal that any match must
+contain (``""`` when there is none); see :func:`_count_pattern_matches`.
+"""
+
+_ESSAY_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
+    (
+        "introduction",
+        re.compile(r"^#{1,2}\s+introduction", re.IGNORECASE | re.MULTILINE),
+    ),
+    ("conclusion", re.compile(r"^#{1,2}\s+conclusion", re.IGNORECASE | re.MULTILINE)),
+    ("thesis", re.compile(r"\bthesis\b", re.IGNORECASE)),
+    ("in this essay", re.compile(r"\bin this essay\b", re.IGNORECASE)),
 ]
-"""Regex patterns that indicate essay-style content."""
+"""Regex patterns (with required literals) that indicate essay-style content."""
 
-_TECHNICAL_PATTERNS: list[re.Pattern[str]] = [
-    re.compile(r"```\w+", re.MULTILINE),
-    re.compile(r"(?i)\bapi\b"),
-    re.compile(r"(?i)\bconfiguration\b"),
-    re.compile(r"(?i)\bfunction\b"),
+_TECHNICAL_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
+    ("```", re.compile(r"```\w+", re.MULTILINE)),
+    ("api", re.compile(r"\bapi\b", re.IGNORECASE)),
+    ("configuration", re.compile(r"\bconfiguration\b", re.IGNORECASE)),
+    ("function", re.compile(r"\bfunction\b", re.IGNORECASE)),
 ]
-"""Regex patterns that indicate technical content."""
+"""Regex patterns (with required literals) that indicate technical content."""
 
 _JOURNAL_PATH_PATTERNS: list[re.Pattern[str]] = [
-    re.compile(r"(?i)/daily/"),
-    re.compile(r"(?i)/journal/"),
-    re.compile(r"(?i)/diary/"),
+    re.compile(r"/daily/", re.IGNORECASE),
+    re.compile(r"/journal/", re.IGNORECASE),
+    re.compile(r"/diary/", re.IGNORECASE),
 ]
 """Path patterns that indicate journal content."""
 
 _ESSAY_PATH_PATTERNS: list[re.Pattern[str]] = [
-    re.compile(r"(?i)/essay"),
-    re.compile(r"(?i)/writing/"),
+    re.compile(r"/essay", re.IGNORECASE),
+    re.compile(r"/writing/", re.IGNORECASE),
 ]
 """Path patterns that indicate essay content."""
 
+_UTF8_BOM = b"\xef\xbb\xbf"
+"""Byte-order mark that may precede UTF-8 encoded files."""
+
+_FRONTMATTER_OPENERS: tuple[bytes, ...] = (b"---", b"+++", b"{")
+"""Opening delimiters recognised by python-frontmatter (YAML, TOML, JSON)."""
+
+_STR_WHITESPACE_ASCII = b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+"""ASCII bytes that :meth:`str.strip` removes (a superset of ``bytes.strip``)."""
+
+_TYPE_PLATFORMS: dict[str, SourcePlatform] = {
+    "journal": SourcePlatform.JOURNAL,
+    "essay": SourcePlatform.ESSAY,
+    "technical": SourcePlatform.CODE,
+}
+"""Document types that map directly to a ``SourcePlatform``."""
+
 # ---- Score Thresholds ----
 
 _TYPE_SCORE_THRESHOLD = 2
@@ -97,10 +124,11 @@ def _detect_document_type(content: str) -> str:
     if not content.strip():
         return "notes"
 
+    folded = content.casefold() if content.isascii() else None
     scores: dict[str, int] = {
-        "journal": _count_pattern_matches(content, _JOURNAL_PATTERNS),
-        "essay": _count_pattern_matches(content, _ESSAY_PATTERNS),
-        "technical": _count_pattern_matches(content, _TECHNICAL_PATTERNS),
+        "journal": _count_pattern_matches(content, folded, _JOURNAL_PATTERNS),
+        "essay": _count_pattern_matches(content, folded, _ESSAY_PATTERNS),
+        "technical": _count_pattern_matches(content, folded, _TECHNICAL_PATTERNS),
     }
 
     best_type = max(scores, key=lambda k: scores[k])
@@ -110,20 +138,41 @@ def _detect_document_type(content: str) -> str:
     return "notes"
 
 
-def _count_pattern_matches(content: str, patterns: list[re.Pattern[str]]) -> int:
+def _count_pattern_matches(
+    content: str,
+    folded: str | None,
+    patterns: list[tuple[str, re.Pattern[str]]],
+) -> int:
     """Count how many patterns match within the content.
 
+    When *folded* is given, each pattern's required literal is first looked
+    up in it with a plain substring search, which is much cheaper than a
+    regex scan that starts with ``\\b``. The regex only runs when the
+    literal is present. Casefolding and ``re.IGNORECASE`` agree on ASCII
+    text but not beyond it: ``re.IGNORECASE`` matches dotless
+    ``'\\u0131'`` to ``'i'``, while :meth:`str.casefold` leaves it alone.
+    Callers therefore pass ``None`` for non-ASCII content, and every regex
+    runs.
+
     Args:
         content: The text to search.
-        patterns: A list of compiled regex patterns.
+        folded: ``content.casefold()`` for ASCII content, computed once by
+            the caller, or ``None`` to skip the literal prefilter.
+        patterns: ``(required_literal, compiled_regex)`` pairs.
 
     Returns:
         The number of patterns that matched at least once.
     """
-    return sum(1 for p in patterns if p.search(content))
+    if folded is None:
+        return sum(1 for _, pattern in patterns if pattern.search(content))
+    return sum(
+        1
+        for literal, pattern in patterns
+        if literal in folded and pattern.search(content)
+    )
 
 
-def _infer_platform(document_type: str, file_path: Path) -> SourcePlatform:
+def _infer_platform(document_type: str, file_path: str | Path) -> SourcePlatform:
     """Infer the source platform from document type and file path.
 
     First checks the document type for a direct mapping. If the type
@@ -132,24 +181,20 @@ def _infer_platform(document_type: str, file_path: Path) -> SourcePlatform:
 
     Args:
         document_type: The detected document type (journal, essay, etc.).
-        file_path: The path to the source markdown file.
+        file_path: The path to the source markdown file, as a string or
+            ``Path``. Only its string form is inspected.
 
     Returns:
         The inferred ``SourcePlatform`` enum value.
     """
-    type_map: dict[str, SourcePlatform] = {
-        "journal": SourcePlatform.JOURNAL,
-        "essay": SourcePlatform.ESSAY,
-        "technical": SourcePlatform.CODE,
-    }
-
-    if document_type in type_map:
-        return type_map[document_type]
+    platform = _TYPE_PLATFORMS.get(document_type)
+    if platform is not None:
+        return platform
 
     return _infer_platform_from_path(file_path)
 
 
-def _infer_platform_from_path(file_path: Path) -> SourcePlatform:
+def _infer_platform_from_path(file_path: str | Path) -> SourcePlatform:
     """Infer platform from directory path patterns.
 
     Args:
@@ -169,6 +214,30 @@ def _infer_platform_from_path(file_path: Path) -> SourcePlatform:
     return SourcePlatform.OTHER
 
 
+def _may_have_frontmatter(raw_bytes: bytes, encoding: str) -> bool:
+    """Cheaply check whether raw file bytes could start with frontmatter.
+
+    Looks for a frontmatter opening delimiter at the start of the bytes
+    (after an optional UTF-8 BOM and leading whitespace) without decoding
+    them. python-frontmatter strips the decoded text with :meth:`str.strip`,
+    so a leading non-ASCII byte (possibly Unicode whitespace such as a
+    no-break space) also reports ``True``. Multi-byte encodings such as
+    UTF-16 cannot be checked this way, so they always report ``True`` and
+    take the full parsing path.
+
+    Args:
+        raw_bytes: The raw file content.
+        encoding: The detected encoding of ``raw_bytes``.
+
+    Returns:
+        ``False`` only if the content definitely has no frontmatter.
+    """
+    if encoding.lower().startswith(("utf-16", "utf-32")):
+        return True
+    head = raw_bytes.removeprefix(_UTF8_BOM).lstrip(_STR_WHITESPACE_ASCII)
+    return head[:1] >= b"\x80" or head.startswith(_FRONTMATTER_OPENERS)
+
+
 def _merge_frontmatter(
     creek_defaults: dict[str, Any],
     existing: dict[str, Any],
@@ -224,8 +293,8 @@ def _get_file_creation_timestamp(path: Path) -> datetime:
     stat = path.stat()
     # Use birth time on macOS, fall back to mtime
     ctime = getattr(stat, "st_birthtime", stat.st_mtime)
-    ts_string = datetime.fromtimestamp(ctime).isoformat()
-    return normalize_timestamp(ts_string, None)
+    # Epoch seconds are absolute; convert straight into the target zone
+    return datetime.fromtimestamp(ctime, LA_TZ)
 
 
 # ---- MarkdownIngestor ----
@@ -253,56 +322,66 @@ class MarkdownIngestor(Ingestor):
         Returns:
             A list of ``RawDocument`` objects for each discovered file.
         """
+        return list(self.iter_discover(source_path))
+
+    def iter_discover(self, source_path: Path) -> Iterator[RawDocument]:
+        """Lazily yield a ``RawDocument`` for each ``.md`` file at the path.
+
+        Each file is read only when the consumer asks for the next
+        document, so at most one file's bytes are held at a time.
+
+        Args:
+            source_path: A file or directory path to search.
+
+        Yields:
+            A ``RawDocument`` for each discovered file.
+        """
         if not source_path.exists():
-            return []
+            return
 
         if source_path.is_file():
-            return self._read_single_file(source_path)
+            yield self._read_file(source_path)
+            return
 
-        return self._read_directory(source_path)
+        for md_file in sorted(source_path.rglob("*.md")):
+            yield self._read_file(md_file)
 
-    def _read_single_file(self, file_path: Path) -> list[RawDocument]:
-        """Read a single markdown file into a RawDocument.
+    def iter_discover_files(
+        self, source_path: Path, files: Sequence[Path]
+    ) -> Iterator[RawDocument]:
+        """Lazily yield a ``RawDocument`` for each ``.md`` file in *files*.
+
+        Filters the caller's file list in memory instead of walking
+        *source_path* again with ``rglob``.
 
         Args:
-            file_path: Path to the markdown file.
+            source_path: The directory the file list was built from.
+            files: Every regular file beneath *source_path*.
 
-        Returns:
-            A single-element list containing the RawDocument.
+        Yields:
+            A ``RawDocument`` for each markdown file, in sorted order.
         """
-        raw_bytes = file_path.read_bytes()
-        _text, encoding = normalize_encoding(raw_bytes)
-        return [
-            RawDocument(
-                path=file_path,
-                content=raw_bytes,
-                metadata={"source_type": "markdown"},
-                detected_encoding=encoding,
-            )
-        ]
+        for md_file in sorted(f for f in files if f.name.endswith(".md")):
+            yield self._read_file(md_file)
 
-    def _read_directory(self, dir_path: Path) -> list[RawDocument]:
-        """Recursively discover all .md files in a directory.
+    def _read_file(self, file_path: Path) -> RawDocument:
+        """Read a single markdown file into a RawDocument.
 
         Args:
-            dir_path: Directory path to search.
+            file_path: Path to the markdown file.
 
         Returns:
-            A list of RawDocument objects for each .md file found.
+            The RawDocument for the file.
         """
-        docs: list[RawDocument] = []
-        for md_file in sorted(dir_path.rglob("*.md")):
-            raw_bytes = md_file.read_bytes()
-            _text, encoding = normalize_encoding(raw_bytes)
-            docs.append(
-                RawDocument(
-                    path=md_file,
-                    content=raw_bytes,
-                    metadata={"source_type": "markdown"},
-                    detected_encoding=encoding,
-                )
-            )
-        return docs
+        raw_bytes = file_path.read_bytes()
+        text, encoding = normalize_encoding(raw_bytes)
+        return RawDocument(
+            path=file_path,
+            content=raw_bytes,
+            metadata={"source_type": "markdown"},
+            detected_encoding=encoding,
+            decoded_text=text,
+        )
 
     def parse(self, raw: RawDocument) -> list[ParsedFragment]:
         """Parse a raw markdown document, extracting frontmatter and content.
@@ -310,6 +389,9 @@ class MarkdownIngestor(Ingestor):
         Uses ``python-frontmatter`` to separate YAML frontmatter from
         the markdown body. Detects document type from content patterns
         and extracts a timestamp from frontmatter or filesystem metadata.
+        Reuses ``raw.decoded_text`` when discovery already decoded the file,
+        and skips the frontmatter parser entirely when the raw bytes show
+        no opening delimiter.
 
         Args:
             raw: The raw document to parse.
@@ -317,8 +399,13 @@ class MarkdownIngestor(Ingestor):
         Returns:
             A single-element list containing the parsed fragment.
         """
-        text, _encoding = normalize_encoding(raw.content)
-        fm_data, content = self._parse_frontmatter(text)
+        text = raw.decoded_text
+        if text is None:
+            text, _encoding = normalize_encoding(raw.content)
+        if _may_have_frontmatter(raw.content, raw.detected_encoding):
+            fm_data, content = self._parse_frontmatter(text)
+        else:
+            fm_data, content = {}, text.strip()
         document_type = _detect_document_type(content)
         timestamp = self._resolve_timestamp(fm_data, raw.path)
 
@@ -338,7 +425,9 @@ class MarkdownIngestor(Ingestor):
         """Parse YAML frontmatter from markdown text.
 
         Handles malformed frontmatter gracefully by treating the entire
-        text as content if parsing fails.
+        text as content if parsing fails. ``python-frontmatter`` is imported
+        here rather than at module load so that importing the ingest
+        package (e.g. for ``creek --help``) does not pay for it.
 
         Args:
             text: The full markdown text (possibly with frontmatter).
@@ -346,6 +435,8 @@ class MarkdownIngestor(Ingestor):
         Returns:
             A tuple of (frontmatter_dict, content_body).
         """
+        import frontmatter
+
         try:
             post = frontmatter.loads(text)
             return dict(post.metadata), post.content
@@ -405,7 +496,7 @@ class MarkdownIngestor(Ingestor):
         """
         document_type = fragment.metadata.get("document_type", "notes")
         existing_fm = fragment.metadata.get("existing_frontmatter", {})
-        platform = _infer_platform(document_type, Path(fragment.source_path))
+        platform = _infer_platform(document_type, fragment.source_path)
         title = self._derive_title(fragment)
 
         creek_defaults: dict[str, Any] = {
@@ -424,7 +515,9 @@ class MarkdownIngestor(Ingestor):
         """Derive a title from the fragment content or source path.
 
         Looks for a level-1 heading (``# Title``) in the content. Falls
-        back to the filename stem if no heading is found.
+        back to the filename stem if no heading is found. The stem is
+        taken with ``os.path`` string helpers rather than building a
+        ``Path`` for every fragment.
 
         Args:
             fragment: The parsed fragment.
@@ -435,4 +528,4 @@ class MarkdownIngestor(Ingestor):
         heading_match = re.match(r"^#\s+(.+)$", fragment.content, re.MULTILINE)
         if heading_match:
             return heading_match.group(1).strip()
-        return Path(fragment.source_path).stem
+        return os.path.splitext(os.path.basename(fragment.source_path))[0]
@@ -6,6 +6,7 @@ temporal, threads, and eddies.
 """
 
 import logging
+from array import array
 from pathlib import Path
 
 from pydantic import BaseModel
@@ -40,12 +41,19 @@ class LinkingPipeline:
     """Orchestrate the full linking pipeline across all four linker stages.
 
     The pipeline sequences: embeddings -> temporal -> threads -> eddies,
-    collecting results from each stage into a ``LinkingResult``.
+    collecting results from each stage into a ``LinkingResult``. The stage
+    objects are built once and reused across runs, and per-run fragment
+    columns (IDs, creation timestamps) are extracted once and handed to
+    the stages that work on them.
 
     Attributes:
         config: Embeddings configuration for the embedding linker.
         linking_config: Linking configuration for temporal window and
             minimum fragment thresholds.
+        embedding_linker: Stage 1 — embeddings and resonances.
+        temporal_linker: Stage 2 — temporal proximity links.
+        thread_detector: Stage 3 — narrative thread detection.
+        eddy_detector: Stage 4 — topic cluster eddy detection.
     """
 
     def __init__(self, config: EmbeddingsConfig, linking_config: LinkingConfig) -> None:
@@ -59,6 +67,10 @@ class LinkingPipeline:
         """
         self.config = config
         self.linking_config = linking_config
+        self.embedding_linker = EmbeddingLinker(config=config)
+        self.temporal_linker = TemporalLinker()
+        self.thread_detector = ThreadDetector()
+        self.eddy_detector = EddyDetector()
 
     def run(self, fragments: list[Fragment], vault_path: Path) -> LinkingResult:
         """Run all four linking stages in sequence and return the result.
@@ -82,25 +94,26 @@ class LinkingPipeline:
             vault_path,
         )
 
+        # Column views built once and shared by stages that need them
+        ids = [f.id for f in fragments]
+        created = array("d", [f.created.timestamp() for f in fragments])
+
         # Stage 1: Embeddings and resonances
-        embedding_linker = EmbeddingLinker(config=self.config)
-        embeddings = embedding_linker.generate_embeddings(fragments)
-        resonances = embedding_linker.find_resonances(embeddings)
+        embeddings = self.embedding_linker.generate_embeddings(fragments)
+        resonances = self.embedding_linker.find_resonances(embeddings)
 
         # Stage 2: Temporal proximity
-        temporal_linker = TemporalLinker()
-        temporal_links = temporal_linker.find_temporal_links(
-            fragments,
+        temporal_links = self.temporal_linker.find_temporal_links(
+            ids,
+            created,
             window_hours=self.linking_config.temporal_window_hours,
         )
 
         # Stage 3: Thread detection
-        thread_detector = ThreadDetector()
-        threads = thread_detector.detect_threads(fragments)
+        threads = self.thread_detector.detect_threads(fragments)
 
         # Stage 4: Eddy detection
-        eddy_detector = EddyDetector()
-        eddies = eddy_detector.detect_eddies(fragments)
+        eddies = self.eddy_detector.detect_eddies(fragments)
 
         result = LinkingResult(
             resonance_count=len(resonances),
@@ -121,10 +134,10 @@ class LinkingPipeline:
         return result
 
     def add_wikilinks(self, fragment: Fragment, links: list[str]) -> Fragment:
-        """Add wikilinks to a fragment's threads list without duplicates.
+        """Add wikilinks to a fragment's threads without duplicates.
 
-        Creates a new ``Fragment`` with the links appended to the threads
-        list.  Does not mutate the original fragment.
+        Creates a new ``Fragment`` with the links appended to its threads
+        tuple.  Does not mutate the original fragment.
 
         Args:
             fragment: The fragment to add wikilinks to.
@@ -132,7 +145,7 @@ class LinkingPipeline:
                 to add to the fragment's threads.
 
         Returns:
-            A new ``Fragment`` with the links added to its threads list.
+            A new ``Fragment`` with the links added to its threads.
         """
         existing = set(fragment.threads)
         new_threads = list(fragment.threads)
@@ -141,4 +154,4 @@ class LinkingPipeline:
                 new_threads.append(link)
                 existing.add(link)
 
-        return fragment.model_copy(update={"threads": new_threads})
+        return fragment.model_copy(update={"threads": tuple(new_threads)})
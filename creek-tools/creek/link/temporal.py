@@ -6,8 +6,7 @@ the real implementation comes in issues #28-33.
 """
 
 import logging
-
-from creek.models import Fragment
+from collections.abc import Sequence
 
 logger = logging.getLogger(__name__)
 
@@ -21,16 +20,24 @@ class TemporalLinker:
     """
 
     def find_temporal_links(
-        self, fragments: list[Fragment], window_hours: int
+        self,
+        ids: Sequence[str],
+        created: Sequence[float],
+        window_hours: int,
     ) -> list[tuple[str, str]]:
         """Find fragment pairs created within a time window of each other.
 
+        Takes fragments in column form — parallel sequences of IDs and
+        creation times (POSIX seconds) — so the real implementation can
+        sort and window the timestamps without touching the models.
+
         This is a stub that returns an empty list.  The real implementation
         will compare creation timestamps and return pairs within the
         configured window.
 
         Args:
-            fragments: List of fragments to check for temporal proximity.
+            ids: Fragment IDs, parallel to ``created``.
+            created: Fragment creation times as POSIX timestamps.
             window_hours: Maximum hours between creation times to consider
                 fragments temporally linked.
 
@@ -41,7 +48,7 @@ class TemporalLinker:
         logger.info(
             "Stub: would find temporal links among %d fragment(s) "
             "within %d-hour window",
-            len(fragments),
+            len(ids),
             window_hours,
         )
         return []
@@ -6,11 +6,13 @@ It also provides supporting enums and nested classification models used
 for the APTITUDE frequency framework and Archetypal Wavelength mapping.
 """
 
-import uuid
+import os
+import sys
+import threading
 from datetime import date, datetime
 from enum import StrEnum
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
 # ---- Enums ----
 
@@ -181,35 +183,71 @@ class SourcePlatform(StrEnum):
 
 # ---- ID Generation Helpers ----
 
+_ID_POOL_BYTES = 4096
+"""Bytes of entropy fetched per refill; each ID consumes 4 (8 hex chars)."""
+
+_id_pool = threading.local()
+"""Per-thread entropy buffer (``buf``) and read offset (``pos``)."""
+
+
+def _reset_id_pool() -> None:
+    """Discard the current thread's buffered entropy.
+
+    Registered to run in forked children so that a child never hands out
+    IDs from bytes its parent has already buffered.
+    """
+    _id_pool.buf = b""
+    _id_pool.pos = 0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_id_pool)
+
+
+def _random_hex8() -> str:
+    """Return 8 random hex characters from the thread-local entropy pool.
+
+    Refills the pool with a single :func:`os.urandom` call once drained,
+    rather than making one syscall per ID as ``uuid.uuid4()`` does.  The
+    collision profile (32 random bits) matches ``uuid4().hex[:8]``.
+    """
+    buf: bytes = getattr(_id_pool, "buf", b"")
+    pos: int = getattr(_id_pool, "pos", 0)
+    if pos + 4 > len(buf):
+        buf = _id_pool.buf = os.urandom(_ID_POOL_BYTES)
+        pos = 0
+    _id_pool.pos = pos + 4
+    return buf[pos : pos + 4].hex()
+
 
 def _generate_frag_id() -> str:
     """Generate a unique fragment ID with prefix 'frag-'."""
-    return f"frag-{uuid.uuid4().hex[:8]}"
+    return f"frag-{_random_hex8()}"
 
 
 def _generate_thread_id() -> str:
     """Generate a unique thread ID with prefix 'thread-'."""
-    return f"thread-{uuid.uuid4().hex[:8]}"
+    return f"thread-{_random_hex8()}"
 
 
 def _generate_eddy_id() -> str:
     """Generate a unique eddy ID with prefix 'eddy-'."""
-    return f"eddy-{uuid.uuid4().hex[:8]}"
+    return f"eddy-{_random_hex8()}"
 
 
 def _generate_praxis_id() -> str:
     """Generate a unique praxis ID with prefix 'praxis-'."""
-    return f"praxis-{uuid.uuid4().hex[:8]}"
+    return f"praxis-{_random_hex8()}"
 
 
 def _generate_decision_id() -> str:
     """Generate a unique decision ID with prefix 'decision-'."""
-    return f"decision-{uuid.uuid4().hex[:8]}"
+    return f"decision-{_random_hex8()}"
 
 
 def _generate_wave_id() -> str:
     """Generate a unique wavelength observation ID with prefix 'wave-'."""
-    return f"wave-{uuid.uuid4().hex[:8]}"
+    return f"wave-{_random_hex8()}"
 
 
 # ---- Nested Models ----
@@ -266,7 +304,10 @@ class Fragment(BaseModel):
     """An atomic content unit — the fundamental building block of the Creek system.
 
     Fragments are ingested from various sources and classified along
-    frequency, wavelength, and voice dimensions.
+    frequency, wavelength, and voice dimensions.  Label fields (tags,
+    threads, eddies, emotional texture) are tuples that share the empty
+    default and hold interned strings, since fragments exist in bulk and
+    the same labels recur across many of them.
     """
 
     model_config = ConfigDict(use_enum_values=True)
@@ -284,11 +325,24 @@ class Fragment(BaseModel):
         default_factory=WavelengthClassification,
     )
     voice: VoiceClassification = Field(default_factory=VoiceClassification)
-    emotional_texture: list[str] = Field(default_factory=list)
-    threads: list[str] = Field(default_factory=list)
-    eddies: list[str] = Field(default_factory=list)
+    emotional_texture: tuple[str, ...] = ()
+    threads: tuple[str, ...] = ()
+    eddies: tuple[str, ...] = ()
     praxis_potential: PraxisPotential = PraxisPotential.NONE
-    tags: list[str] = Field(default_factory=list)
+    tags: tuple[str, ...] = ()
+
+    @field_validator("emotional_texture", "threads", "eddies", "tags")
+    @classmethod
+    def _intern_labels(cls, value: tuple[str, ...]) -> tuple[str, ...]:
+        """Intern label strings so repeats across fragments share one object.
+
+        Args:
+            value: The validated tuple of labels.
+
+        Returns:
+            The same labels, each replaced by its interned string.
+        """
+        return tuple(sys.intern(label) for label in value)
 
 
 class Thread(BaseModel):
@@ -297,7 +351,7 @@ class Thread(BaseModel):
     Threads track the evolution of ideas and concerns over time.
     """
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(use_enum_values=True, defer_build=True)
 
     type: str = "thread"
     id: str = Field(default_factory=_generate_thread_id)
@@ -317,7 +371,7 @@ class Eddy(BaseModel):
     Eddies represent areas of concentrated attention and meaning.
     """
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(use_enum_values=True, defer_build=True)
 
     type: str = "eddy"
     id: str = Field(default_factory=_generate_eddy_id)
@@ -336,7 +390,7 @@ class Praxis(BaseModel):
     that emerge from the knowledge organization process.
     """
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(use_enum_values=True, defer_build=True)
 
     type: str = "praxis"
     id: str = Field(default_factory=_generate_praxis_id)
@@ -356,7 +410,7 @@ class Decision(BaseModel):
     and reflecting phases.
     """
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(use_enum_values=True, defer_build=True)
 
     type: str = "decision"
     id: str = Field(default_factory=_generate_decision_id)
@@ -381,7 +435,7 @@ class WavelengthObservation(BaseModel):
     the archetypal wavelength pattern.
     """
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(use_enum_values=True, defer_build=True)
 
     type: str = "wavelength_observation"
     id: str = Field(default_factory=_generate_wave_id)
@@ -393,3 +447,13 @@ class WavelengthObservation(BaseModel):
     notes: str = ""
     fragment_refs: list[str] = Field(default_factory=list)
     tags: list[str] = Field(default_factory=list)
+
+
+# ---- Type Adapters ----
+
+FRAGMENT_ADAPTER: TypeAdapter[list[Fragment]] = TypeAdapter(list[Fragment])
+"""Validator for a batch of fragments, built once at import.
+
+Validating a list of dicts through one adapter call avoids paying
+per-instance validator dispatch when constructing fragments in bulk.
+"""
@@ -17,8 +17,8 @@ from creek.config import CreekConfig
 from creek.generate.indexes import IndexGenerator
 from creek.ingest import INGESTOR_REGISTRY
 from creek.link.linker import LinkingPipeline
-from creek.models import Fragment, FragmentSource, SourcePlatform
-from creek.redact.scanner import RedactionScanner
+from creek.models import FRAGMENT_ADAPTER, Fragment, SourcePlatform
+from creek.redact.scanner import RedactionScanner, iter_files
 
 logger = logging.getLogger(__name__)
 
@@ -93,12 +93,16 @@ class Pipeline:
         """
         result = PipelineResult()
 
+        # Walk the source tree once, in sorted order so results do not depend
+        # on the filesystem; stages filter this list in memory
+        files = sorted(iter_files(source_path)) if source_path.is_dir() else None
+
         # Stage 1: Redaction scan
-        files_scanned = self._run_redaction(source_path, result)
+        files_scanned = self._run_redaction(source_path, result, files)
         result.files_scanned = files_scanned
 
         # Stage 2: Ingestion
-        fragments = self._run_ingestion(source_path, result)
+        fragments = self._run_ingestion(source_path, result, files)
         result.fragments_created = len(fragments)
 
         # Stage 3: Classification
@@ -116,12 +120,22 @@ class Pipeline:
         logger.info("Pipeline complete: %s", result)
         return result
 
-    def _run_redaction(self, source_path: Path, result: PipelineResult) -> int:
-        """Scan source files for sensitive data.
+    def _run_redaction(
+        self,
+        source_path: Path,
+        result: PipelineResult,
+        files: list[Path] | None = None,
+    ) -> int:
+        """Count source files and scan them for sensitive data.
+
+        The tree is walked at most once; the same sorted file list feeds
+        both the count and the scanner, so matches come back in path order.
 
         Args:
             source_path: Directory to scan.
             result: Pipeline result (unused directly but kept for symmetry).
+            files: Files beneath *source_path*, sorted, if the caller already
+                walked it; walked and sorted here when omitted.
 
         Returns:
             Number of files scanned.
@@ -130,11 +144,12 @@ class Pipeline:
             logger.warning("Source path does not exist: %s", source_path)
             return 0
 
-        files = list(source_path.rglob("*"))
-        file_count = sum(1 for f in files if f.is_file())
+        if files is None:
+            files = sorted(iter_files(source_path)) if source_path.is_dir() else []
+        file_count = len(files)
 
         if self.config.redaction.enabled:
-            matches = self.scanner.scan_directory(source_path)
+            matches = self.scanner.scan_paths(files)
             if matches:
                 logger.info(
                     "Redaction scan found %d potential PII match(es)",
@@ -144,7 +159,10 @@ class Pipeline:
         return file_count
 
     def _run_ingestion(
-        self, source_path: Path, result: PipelineResult
+        self,
+        source_path: Path,
+        result: PipelineResult,
+        files: list[Path] | None = None,
     ) -> list[Fragment]:
         """Discover and run ingestors for available source types.
 
@@ -154,6 +172,8 @@ class Pipeline:
         Args:
             source_path: Directory containing source files.
             result: Pipeline result (unused directly but kept for symmetry).
+            files: Files beneath *source_path*, handed to each ingestor so
+                it can skip walking the tree itself.
 
         Returns:
             List of Fragment models created by ingestion.
@@ -169,13 +189,17 @@ class Pipeline:
         for name, ingestor_cls in INGESTOR_REGISTRY.items():
             logger.info("Running ingestor: %s", name)
             ingestor = ingestor_cls()
-            ingest_result = ingestor.ingest(source_path)
-            for parsed in ingest_result.fragments:
-                fragment = Fragment(
-                    title=parsed.source_path,
-                    source=FragmentSource(platform=SourcePlatform.OTHER),
-                )
-                fragments.append(fragment)
+            ingest_result = ingestor.ingest(
+                source_path, files=files, workers=self.config.ingest.workers
+            )
+            raw = [
+                {
+                    "title": parsed.source_path,
+                    "source": {"platform": SourcePlatform.OTHER},
+                }
+                for parsed in ingest_result.fragments
+            ]
+            fragments.extend(FRAGMENT_ADAPTER.validate_python(raw))
 
         return fragments
 
@@ -187,6 +211,10 @@ class Pipeline:
     ) -> list[Fragment]:
         """Classify fragments through rules, LLM, and review queue.
 
+        Rules run per fragment in-process; the LLM stage receives the whole
+        list through :meth:`LLMClassifier.classify_batch`, which is where
+        request batching (``config.llm.batch_size``) belongs.
+
         Args:
             fragments: Fragments to classify.
             vault_path: Vault path for writing review queue.
@@ -199,11 +227,8 @@ class Pipeline:
             logger.info("No fragments to classify.")
             return []
 
-        classified: list[Fragment] = []
-        for fragment in fragments:
-            frag = self.rule_classifier.classify(fragment)
-            frag = self.llm_classifier.classify(frag)
-            classified.append(frag)
+        ruled = [self.rule_classifier.classify(fragment) for fragment in fragments]
+        classified = self.llm_classifier.classify_batch(ruled)
 
         self.review_generator.generate_queue(classified, vault_path)
         return classified
@@ -4,9 +4,21 @@ Each pattern is keyed by a human-readable name and compiled with
 :func:`re.compile` for efficient repeated use.  The patterns are
 intentionally conservative stubs — they cover the most common formats
 and are designed to be extended via :pyattr:`RedactionConfig.custom_patterns`.
+
+:func:`combine_patterns` fuses a set of named patterns into a single
+alternation so that text can be scanned once instead of once per pattern
+(:func:`fused_pattern` and :func:`fused_bytes_pattern` share the compiled
+result across scanners and redactors),
+and :func:`candidate_patterns` drops patterns whose required literal is
+absent before any regex runs; :func:`required_literals` extends those
+literals to custom patterns.  :func:`to_bytes_pattern` recompiles a
+pattern for raw ``bytes`` input so content need not be decoded first.
 """
 
+import functools
+import mmap
 import re
+from collections.abc import Iterable, Mapping
 
 REDACTION_PATTERNS: dict[str, re.Pattern[str]] = {
     "api_key": re.compile(
@@ -19,7 +31,8 @@ REDACTION_PATTERNS: dict[str, re.Pattern[str]] = {
         r")",
     ),
     "password": re.compile(
-        r"(?i)(?:password|passwd)\s*=\s*\S+",
+        r"(?:password|passwd)\s*=\s*\S+",
+        re.IGNORECASE,
     ),
     "ssn": re.compile(
         r"\b\d{3}-\d{2}-\d{4}\b",
@@ -28,3 +41,308 @@ REDACTION_PATTERNS: dict[str, re.Pattern[str]] = {
         r"\b[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}\b",
     ),
 }
+
+REQUIRED_LITERALS: dict[str, tuple[str, ...]] = {
+    "api_key": ("AKIA", "sk-", "sk_"),
+    "password": ("password", "passwd"),
+    "ssn": ("-",),
+    "email": ("@",),
+}
+"""Literals, at least one of which must occur for a pattern to match.
+
+Matched case-sensitively, except for patterns in
+:data:`CASE_INSENSITIVE_LITERALS`.  Patterns without an entry (e.g.
+custom patterns) are always considered candidates.
+"""
+
+CASE_INSENSITIVE_LITERALS: frozenset[str] = frozenset({"password"})
+"""Patterns whose (lower-case) literals are checked against lower-cased text."""
+
+_REGEX_METACHARACTERS: frozenset[str] = frozenset("\\.^$*+?{}[]()|")
+"""Characters that end the literal prefix of a pattern source."""
+
+_SCOPED_FLAGS: tuple[tuple[re.RegexFlag, str], ...] = (
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+    (re.ASCII, "a"),
+)
+"""Compile flags that can be re-applied as a scoped ``(?flags:...)`` group."""
+
+
+def combine_patterns(
+    patterns: dict[str, re.Pattern[str]],
+) -> tuple[re.Pattern[str], dict[str, str]] | None:
+    """Fuse named patterns into a single alternation regex.
+
+    Each pattern becomes a named group ``_p<index>`` (pattern names need
+    not be valid identifiers) wrapped in a scoped-flag group that carries
+    the pattern's own compile flags. ``match.lastgroup`` on the combined
+    regex identifies which pattern matched; where several patterns could
+    match at the same position, the earliest in ``patterns`` wins.
+
+    Patterns that define their own capturing groups are not fused, since
+    renumbering would break numeric backreferences, and neither is a set
+    whose combined source fails to compile.
+
+    Args:
+        patterns: Mapping of pattern name to compiled regex.
+
+    Returns:
+        A ``(combined_regex, group_to_name)`` tuple, or ``None`` if the
+        patterns are empty or cannot be fused safely.
+    """
+    if not patterns or any(p.groups for p in patterns.values()):
+        return None
+
+    alternatives: list[str] = []
+    group_names: dict[str, str] = {}
+    for index, (name, pattern) in enumerate(patterns.items()):
+        group = f"_p{index}"
+        flags = "".join(char for flag, char in _SCOPED_FLAGS if pattern.flags & flag)
+        body = f"(?{flags}:{pattern.pattern})" if flags else pattern.pattern
+        alternatives.append(f"(?P<{group}>{body})")
+        group_names[group] = name
+
+    try:
+        combined = re.compile("|".join(alternatives))
+    except re.error:
+        return None
+    return combined, group_names
+
+
+@functools.lru_cache(maxsize=256)
+def _fuse(
+    items: tuple[tuple[str, re.Pattern[str]], ...],
+) -> tuple[re.Pattern[str], dict[str, str]] | None:
+    """Memoised :func:`combine_patterns` over a hashable pattern tuple.
+
+    Args:
+        items: ``(name, pattern)`` pairs in fusion order.
+
+    Returns:
+        The result of :func:`combine_patterns`.
+    """
+    return combine_patterns(dict(items))
+
+
+@functools.lru_cache(maxsize=256)
+def _fuse_bytes(
+    items: tuple[tuple[str, re.Pattern[str]], ...],
+    flags: int,
+) -> tuple[re.Pattern[bytes], dict[str, str]] | None:
+    """Memoised bytes counterpart of :func:`_fuse`.
+
+    Args:
+        items: ``(name, pattern)`` pairs in fusion order.
+        flags: Extra flags passed to :func:`to_bytes_pattern`.
+
+    Returns:
+        The fused regex recompiled for bytes with its group-name map, or
+        ``None`` when the patterns cannot be fused or converted.
+    """
+    combined = _fuse(items)
+    if combined is None:
+        return None
+    regex = to_bytes_pattern(combined[0], flags)
+    if regex is None:
+        return None
+    return regex, combined[1]
+
+
+def fused_pattern(
+    patterns: Mapping[str, re.Pattern[str]],
+    names: frozenset[str],
+) -> tuple[re.Pattern[str], dict[str, str]] | None:
+    """Fuse the patterns named in *names*, compiling each distinct set once.
+
+    Results are memoised at module level, so every scanner and redactor
+    built from the same patterns (the built-ins, in the common case)
+    shares one compiled regex instead of compiling its own.  The returned
+    group map must not be mutated.
+
+    Args:
+        patterns: Mapping of pattern name to compiled regex.
+        names: Names of the patterns to fuse.
+
+    Returns:
+        The result of :func:`combine_patterns` for the selected patterns.
+    """
+    return _fuse(tuple((k, v) for k, v in patterns.items() if k in names))
+
+
+def fused_bytes_pattern(
+    patterns: Mapping[str, re.Pattern[str]],
+    names: frozenset[str],
+    flags: int = 0,
+) -> tuple[re.Pattern[bytes], dict[str, str]] | None:
+    """Like :func:`fused_pattern`, but recompiled for ``bytes`` input.
+
+    Args:
+        patterns: Mapping of pattern name to compiled regex.
+        names: Names of the patterns to fuse.
+        flags: Extra flags (e.g. :data:`re.MULTILINE`) to compile with.
+
+    Returns:
+        The fused bytes regex with its group-name map, or ``None`` when
+        the patterns cannot be fused or converted.
+    """
+    return _fuse_bytes(tuple((k, v) for k, v in patterns.items() if k in names), flags)
+
+
+def to_bytes_pattern(
+    pattern: re.Pattern[str], flags: int = 0
+) -> re.Pattern[bytes] | None:
+    """Recompile a ``str`` pattern so it can scan ``bytes`` directly.
+
+    Only ASCII pattern sources are converted: a non-ASCII character would
+    become a multi-byte sequence and change the meaning of character
+    classes.  Classes such as ``\\w``, ``\\d`` and ``\\b`` become
+    ASCII-only, so the result agrees with *pattern* only on ASCII input;
+    callers must route other input through the ``str`` pattern.
+
+    Args:
+        pattern: Compiled ``str`` regex.
+        flags: Extra flags (e.g. :data:`re.MULTILINE`) to compile with.
+
+    Returns:
+        The equivalent ``bytes`` regex, or ``None`` if the source is not
+        ASCII or does not compile as a bytes pattern.
+    """
+    if not pattern.pattern.isascii():
+        return None
+    try:
+        return re.compile(
+            pattern.pattern.encode("ascii"), (pattern.flags | flags) & ~re.UNICODE
+        )
+    except re.error:
+        return None
+
+
+def _contains_any(haystack: str | bytes | mmap.mmap, literals: tuple[str, ...]) -> bool:
+    """Return whether any of *literals* occurs in *haystack*.
+
+    Args:
+        haystack: Text, or ASCII-compatible bytes or memory map, to search.
+        literals: ASCII literals to look for.
+
+    Returns:
+        ``True`` if at least one literal is present.
+    """
+    if not isinstance(haystack, str):
+        return any(literal.encode() in haystack for literal in literals)
+    return any(literal in haystack for literal in literals)
+
+
+def literal_prefix(pattern: re.Pattern[str]) -> str | None:
+    """Return a literal that every match of *pattern* must contain.
+
+    Takes the run of plain characters at the start of the pattern source,
+    after any leading ``^`` or ``\\b`` anchors, dropping the last one if
+    a quantifier makes it optional.  Sources with a top-level choice
+    (``|``), verbose syntax or non-ASCII text are not analysed.
+
+    Args:
+        pattern: Compiled ``str`` regex.
+
+    Returns:
+        The literal (lower-cased for :data:`re.IGNORECASE` patterns), or
+        ``None`` if no literal could be derived.
+    """
+    src = pattern.pattern
+    if "|" in src or pattern.flags & re.VERBOSE or not src.isascii():
+        return None
+    start = 0
+    while src.startswith(("^", "\\b"), start):
+        start += 1 if src[start] == "^" else 2
+    end = start
+    while end < len(src) and src[end] not in _REGEX_METACHARACTERS:
+        end += 1
+    if end < len(src) and src[end] in "*?{":
+        end -= 1
+    literal = src[start:end]
+    if not literal:
+        return None
+    return literal.lower() if pattern.flags & re.IGNORECASE else literal
+
+
+def required_literals(
+    patterns: Mapping[str, re.Pattern[str]],
+) -> tuple[dict[str, tuple[str, ...]], frozenset[str]]:
+    """Build the prefilter literals for a scanner's configured patterns.
+
+    Built-in patterns use :data:`REQUIRED_LITERALS`; any other pattern,
+    including a custom pattern that replaces a built-in name, uses its
+    :func:`literal_prefix` if one exists and is otherwise always run.
+
+    Args:
+        patterns: Mapping of pattern name to compiled regex.
+
+    Returns:
+        The literals per pattern name, and the names whose literals must
+        be checked against lower-cased content.
+    """
+    literals: dict[str, tuple[str, ...]] = {}
+    folded: list[str] = []
+    for name, pattern in patterns.items():
+        if pattern is REDACTION_PATTERNS.get(name):
+            if name in REQUIRED_LITERALS:
+                literals[name] = REQUIRED_LITERALS[name]
+                if name in CASE_INSENSITIVE_LITERALS:
+                    folded.append(name)
+            continue
+        prefix = literal_prefix(pattern)
+        if prefix is not None:
+            literals[name] = (prefix,)
+            if pattern.flags & re.IGNORECASE:
+                folded.append(name)
+    return literals, frozenset(folded)
+
+
+def candidate_patterns(
+    names: Iterable[str],
+    content: str | bytes | mmap.mmap,
+    literals: Mapping[str, tuple[str, ...]] = REQUIRED_LITERALS,
+    folded_names: frozenset[str] = CASE_INSENSITIVE_LITERALS,
+) -> frozenset[str]:
+    """Return the pattern names that could possibly match *content*.
+
+    A pattern listed in *literals* is kept only if one of its literals
+    occurs in the content; this is a cheap substring test
+    that spares the regex engine from sweeping text that cannot contain a
+    hit (e.g. the email pattern over text with no ``@``).  The content is
+    lower-cased at most once, and only if a case-insensitive pattern is
+    among *names*; a memory map is never copied to be lower-cased, so
+    case-insensitive patterns are always kept for it.
+
+    Args:
+        names: Pattern names to consider.
+        content: The text (or raw bytes, or a memory map of them) about to
+            be scanned.
+        literals: Required literals per pattern name; defaults to the
+            built-in :data:`REQUIRED_LITERALS`.
+        folded_names: Names whose literals are matched against the
+            lower-cased content.
+
+    Returns:
+        The subset of *names* worth running against *content*.
+    """
+    folded: str | bytes | None = None
+    selected: list[str] = []
+    for name in names:
+        required = literals.get(name)
+        if required is None:
+            selected.append(name)
+            continue
+        haystack = content
+        if name in folded_names:
+            if isinstance(content, mmap.mmap):
+                selected.append(name)
+                continue
+            if folded is None:
+                folded = content.lower()
+            haystack = folded
+        if _contains_any(haystack, required):
+            selected.append(name)
+    return frozenset(selected)
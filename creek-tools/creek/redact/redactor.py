@@ -2,21 +2,43 @@
 
 The :class:`Redactor` re-scans content to locate match positions (since
 :class:`RedactionMatch` intentionally does **not** store the matched text)
-and replaces each hit with a ``[REDACTED:type]`` marker.
-
-Redaction logs are written as JSON with a session salt in the header so
-that hashes can be correlated within a session but not reversed.
+and replaces each hit with a ``[REDACTED:type]`` marker.  Patterns are
+fused into a single alternation (see :func:`combine_patterns`) so each
+document is scanned once rather than once per pattern.
+
+Redaction logs are written as JSON Lines: the first line is a header
+holding the session salt, so that hashes can be correlated within a
+session but not reversed, and each following line is one match.  New
+matches are appended without rereading the file; :func:`read_log`
+iterates a log lazily.  Logs in the earlier single-document JSON format
+are rewritten as JSON Lines before the first append.
 """
 
 import json
+import mmap
 import re
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 from creek.config import RedactionConfig
-from creek.redact.patterns import REDACTION_PATTERNS
+from creek.redact.patterns import (
+    REDACTION_PATTERNS,
+    candidate_patterns,
+    fused_bytes_pattern,
+    fused_pattern,
+    required_literals,
+)
 from creek.redact.scanner import RedactionMatch
 
+_STR_ONLY_BYTES = re.compile(rb"[\x1c-\x1f\x80-\xff]")
+"""Bytes that bytes-compiled patterns would match differently from ``str``.
+
+Non-ASCII bytes change the meaning of ``\\w``, ``\\d`` and ``\\b``, and
+``\\x1c``-``\\x1f`` are whitespace only to ``str`` patterns, so content
+holding any of them is redacted through :meth:`Redactor.redact_content`.
+"""
+
 
 class Redactor:
     """Replace sensitive data in text and log redactions.
@@ -41,6 +63,15 @@ class Redactor:
         self.config = config
         self.salt = salt
         self._patterns = self._build_patterns()
+        self._literals, self._folded_names = required_literals(self._patterns)
+        self._allowlist = frozenset(config.false_positive_allowlist)
+        self._allowlist_bytes = frozenset(s.encode() for s in self._allowlist)
+        self._combined_cache: dict[
+            frozenset[str], tuple[re.Pattern[str], dict[str, str]] | None
+        ] = {}
+        self._combined_bytes_cache: dict[
+            frozenset[str], tuple[re.Pattern[bytes], dict[str, str]] | None
+        ] = {}
 
     def _build_patterns(self) -> dict[str, re.Pattern[str]]:
         """Merge built-in patterns with any custom patterns from config.
@@ -56,13 +87,16 @@ class Redactor:
     def _is_allowlisted(self, text: str) -> bool:
         """Check whether *text* appears in the false-positive allowlist.
 
+        The allowlist is copied into a frozenset at construction, so each
+        check is a hash lookup however long the configured list is.
+
         Args:
             text: The matched string to check.
 
         Returns:
             ``True`` if the string should be excluded from redaction.
         """
-        return text in self.config.false_positive_allowlist
+        return text in self._allowlist
 
     def redact_content(
         self,
@@ -73,7 +107,8 @@ class Redactor:
 
         Re-scans *content* against the configured patterns (since matched
         text is never stored in :class:`RedactionMatch`) and substitutes
-        each hit that is not on the allowlist.
+        each hit that is not on the allowlist.  Patterns whose required
+        literal is absent from *content* are skipped up front.
 
         Args:
             content: The text to redact.
@@ -83,20 +118,220 @@ class Redactor:
         Returns:
             A copy of *content* with sensitive data replaced.
         """
-        patterns_to_use: dict[str, re.Pattern[str]]
-        if pattern_types is not None:
-            patterns_to_use = {
-                k: v for k, v in self._patterns.items() if k in pattern_types
-            }
-        else:
-            patterns_to_use = self._patterns
-
-        for name, pattern in patterns_to_use.items():
+        names = self._patterns.keys() if pattern_types is None else pattern_types
+        active = candidate_patterns(
+            (name for name in names if name in self._patterns),
+            content,
+            self._literals,
+            self._folded_names,
+        )
+        if not active:
+            return content
+
+        combined = self._combined_for(active)
+        if combined is not None:
+            regex, group_names = combined
+
+            def _replacer(m: re.Match[str]) -> str:
+                """Return the matching pattern's marker unless allowlisted.
+
+                Args:
+                    m: Regex match object from the combined pattern.
+
+                Returns:
+                    The marker string or the original match text.
+                """
+                text = m.group()
+                if self._is_allowlisted(text):
+                    return text
+                return f"[REDACTED:{group_names[m.lastgroup or '']}]"
+
+            return regex.sub(_replacer, content)
+
+        for name, pattern in self._patterns.items():
+            if name not in active:
+                continue
             marker = f"[REDACTED:{name}]"
             content = self._replace_pattern(content, pattern, marker)
 
         return content
 
+    def redact_bytes(
+        self,
+        content: bytes,
+        pattern_types: list[str] | None = None,
+    ) -> bytes:
+        """Replace sensitive data in raw *content* without decoding it.
+
+        Behaves like :meth:`redact_content` but scans ``bytes`` with
+        bytes-compiled patterns, so file contents can be redacted straight
+        from :meth:`Path.read_bytes` and written back without a decode and
+        re-encode.  If the selected patterns cannot be compiled for bytes
+        (e.g. a non-ASCII custom pattern), or *content* holds bytes they
+        would match differently (see :data:`_STR_ONLY_BYTES`), falls back
+        to :meth:`redact_content` on the ``surrogateescape``-decoded text,
+        so the result is always the same as redacting the text.  Invalid
+        UTF-8 is passed through untouched.
+
+        Args:
+            content: The raw bytes to redact.
+            pattern_types: If provided, only apply these pattern names.
+                Defaults to all configured patterns.
+
+        Returns:
+            A copy of *content* with sensitive data replaced.
+        """
+        names = self._patterns.keys() if pattern_types is None else pattern_types
+        active = candidate_patterns(
+            (name for name in names if name in self._patterns),
+            content,
+            self._literals,
+            self._folded_names,
+        )
+        if not active:
+            return content
+
+        combined = self._combined_bytes_for(active)
+        if combined is None or _STR_ONLY_BYTES.search(content) is not None:
+            text = content.decode("utf-8", errors="surrogateescape")
+            redacted = self.redact_content(text, sorted(active))
+            return redacted.encode("utf-8", errors="surrogateescape")
+
+        regex, group_names = combined
+        allowed = self._allowlist_bytes
+
+        def _replacer(m: re.Match[bytes]) -> bytes:
+            """Return the matching pattern's marker unless allowlisted.
+
+            Args:
+                m: Regex match object from the combined bytes pattern.
+
+            Returns:
+                The marker bytes or the original matched bytes.
+            """
+            data = m.group()
+            if data in allowed:
+                return data
+            return f"[REDACTED:{group_names[m.lastgroup or '']}]".encode()
+
+        return regex.sub(_replacer, content)
+
+    def redact_file(
+        self,
+        source: Path,
+        dest: Path,
+        pattern_types: list[str] | None = None,
+    ) -> int:
+        """Redact *source* into *dest* without loading either into memory.
+
+        The source is memory-mapped and scanned with the fused bytes
+        pattern; unchanged spans are written to *dest* straight from the
+        mapping, so only matched text is ever copied into Python objects
+        and the OS pages the source in on demand.  Falls back
+        to :meth:`redact_bytes` on the whole file when the patterns cannot
+        be compiled for bytes or the file holds bytes they would match
+        differently (see :data:`_STR_ONLY_BYTES`).
+
+        Args:
+            source: File to redact.
+            dest: File to write the redacted copy to.
+            pattern_types: If provided, only apply these pattern names.
+                Defaults to all configured patterns.
+
+        Returns:
+            The number of matches replaced with markers.
+
+        Raises:
+            ValueError: If *dest* is the same file as *source*.
+        """
+        if dest.exists() and dest.samefile(source):
+            msg = f"Cannot redact a file in place: {source}"
+            raise ValueError(msg)
+
+        names = self._patterns.keys() if pattern_types is None else pattern_types
+        active = frozenset(name for name in names if name in self._patterns)
+        combined = self._combined_bytes_for(active) if active else None
+        if combined is not None and source.stat().st_size > 0:
+            with (
+                source.open("rb") as src,
+                mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+            ):
+                if _STR_ONLY_BYTES.search(mapped) is None:
+                    return self._stream_redacted(mapped, dest, *combined)
+
+        content = source.read_bytes()
+        redacted = self.redact_bytes(content, pattern_types)
+        dest.write_bytes(redacted)
+        return redacted.count(b"[REDACTED:") - content.count(b"[REDACTED:")
+
+    def _stream_redacted(
+        self,
+        mapped: mmap.mmap,
+        dest: Path,
+        regex: re.Pattern[bytes],
+        group_names: dict[str, str],
+    ) -> int:
+        """Write *mapped* to *dest* with each match replaced by its marker.
+
+        Args:
+            mapped: Read-only mapping of the source file.
+            dest: File to write the redacted copy to.
+            regex: Fused bytes pattern to replace.
+            group_names: Map of regex group name to pattern name.
+
+        Returns:
+            The number of matches replaced with markers.
+        """
+        allowed = self._allowlist_bytes
+        replaced = 0
+        with memoryview(mapped) as view, dest.open("wb") as out:
+            position = 0
+            for m in regex.finditer(mapped):
+                if m.group() in allowed:
+                    continue
+                out.write(view[position : m.start()])
+                out.write(f"[REDACTED:{group_names[m.lastgroup or '']}]".encode())
+                position = m.end()
+                replaced += 1
+            out.write(view[position:])
+        return replaced
+
+    def _combined_bytes_for(
+        self,
+        names: frozenset[str],
+    ) -> tuple[re.Pattern[bytes], dict[str, str]] | None:
+        """Return the fused bytes regex for the given pattern names, cached.
+
+        Args:
+            names: Names of the patterns to fuse.
+
+        Returns:
+            The fused regex recompiled for bytes with its group-name map,
+            or ``None`` when the patterns cannot be fused or converted.
+        """
+        if names not in self._combined_bytes_cache:
+            self._combined_bytes_cache[names] = fused_bytes_pattern(
+                self._patterns, names
+            )
+        return self._combined_bytes_cache[names]
+
+    def _combined_for(
+        self,
+        names: frozenset[str],
+    ) -> tuple[re.Pattern[str], dict[str, str]] | None:
+        """Return the fused regex for the given pattern names, cached per set.
+
+        Args:
+            names: Names of the patterns to fuse.
+
+        Returns:
+            The result of :func:`combine_patterns` for those patterns, or
+            ``None`` when they must be applied one at a time.
+        """
+        if names not in self._combined_cache:
+            self._combined_cache[names] = fused_pattern(self._patterns, names)
+        return self._combined_cache[names]
+
     def _replace_pattern(
         self,
         content: str,
@@ -136,28 +371,99 @@ class Redactor:
         matches: list[RedactionMatch],
         log_path: Path,
     ) -> None:
-        """Write redaction matches to a JSON log file.
+        """Append redaction matches to a JSON Lines log file.
 
-        If the log file already exists, appends to the ``entries`` list.
-        The log header includes the hex-encoded session salt so hashes
-        can be correlated within the same scan session.
+        A new log starts with a header line holding the hex-encoded
+        session salt so hashes can be correlated within the same scan
+        session.  Each match is then appended as its own line, serialised
+        directly by :meth:`~pydantic.BaseModel.model_dump_json`, so logging
+        a batch costs the size of the batch, not the size of the log.
+
+        A log in the legacy single-document format is first rewritten as
+        JSON Lines, keeping its salt and entries.
 
         Args:
             matches: List of redaction matches to log.
-            log_path: Path to the JSON log file.
+            log_path: Path to the JSONL log file.
         """
-        data: dict[str, Any]
-        entries: list[Any]
-
+        lines: list[str] = []
         if log_path.exists():
-            data = json.loads(log_path.read_text())
-            entries = list(data.get("entries", []))
+            _migrate_legacy_log(log_path)
         else:
-            data = {"salt_hex": self.salt.hex()}
-            entries = []
+            lines.append(json.dumps({"salt_hex": self.salt.hex()}))
+        lines.extend(match.model_dump_json() for match in matches)
+        if not lines:
+            return
 
-        for match in matches:
-            entries.append(match.model_dump(mode="json"))
+        with log_path.open("a", encoding="utf-8") as fh:
+            fh.write("\n".join(lines) + "\n")
+
+
+def _is_legacy_log(log_path: Path) -> bool:
+    """Return whether *log_path* holds a legacy single-document JSON log.
+
+    Earlier versions wrote ``{"salt_hex": ..., "entries": [...]}`` with
+    ``indent=2``, so the document's first line is a lone ``{``; every JSON
+    Lines record is a complete object on one line.  Only the first line is
+    read.
+
+    Args:
+        log_path: Path to an existing redaction log.
 
-        data["entries"] = entries
-        log_path.write_text(json.dumps(data, indent=2))
+    Returns:
+        ``True`` if the log still needs converting to JSON Lines.
+    """
+    with log_path.open(encoding="utf-8") as fh:
+        return fh.readline().strip() == "{"
+
+
+def _legacy_records(log_path: Path) -> list[dict[str, Any]]:
+    """Return the records of a legacy log in JSON Lines order.
+
+    Args:
+        log_path: Path to a legacy single-document JSON log.
+
+    Returns:
+        The ``{"salt_hex": ...}`` header followed by each logged match.
+    """
+    data = json.loads(log_path.read_text(encoding="utf-8"))
+    return [{"salt_hex": data["salt_hex"]}, *data.get("entries", [])]
+
+
+def _migrate_legacy_log(log_path: Path) -> None:
+    """Rewrite a legacy single-document JSON log as JSON Lines, in place.
+
+    Does nothing if the log is already JSON Lines.
+
+    Args:
+        log_path: Path to an existing redaction log.
+    """
+    if not _is_legacy_log(log_path):
+        return
+    log_path.write_text(
+        "".join(json.dumps(record) + "\n" for record in _legacy_records(log_path)),
+        encoding="utf-8",
+    )
+
+
+def read_log(log_path: Path) -> Iterator[dict[str, Any]]:
+    """Lazily iterate the records of a JSON Lines redaction log.
+
+    The first record is the header (``{"salt_hex": ...}``); every later
+    record is a serialised :class:`RedactionMatch`.  Blank lines are
+    skipped.  A legacy single-document log that has not been migrated yet
+    is read whole and yields the same records.
+
+    Args:
+        log_path: Path to a log written by :meth:`Redactor.log_redactions`.
+
+    Yields:
+        One decoded JSON object per non-blank line.
+    """
+    if _is_legacy_log(log_path):
+        yield from _legacy_records(log_path)
+        return
+    with log_path.open(encoding="utf-8") as fh:
+        for line in fh:
+            if line.strip():
+                yield json.loads(line)
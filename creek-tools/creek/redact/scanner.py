@@ -1,9 +1,12 @@
 """Redaction scanner — detect sensitive data in files without storing it.
 
-The :class:`RedactionScanner` walks files line-by-line, matches against
-both built-in and custom regex patterns, and returns :class:`RedactionMatch`
-objects that contain only a salted SHA-256 hash of the matched text — never
-the text itself.
+The :class:`RedactionScanner` scans each file's raw bytes, running each
+built-in and custom regex pattern over the whole buffer and deriving line
+numbers from match offsets.  Patterns are applied independently, so text
+that matches several types (an email inside a password) is reported once
+per type.  It returns
+:class:`RedactionMatch` objects that contain only a salted SHA-256 hash of
+the matched text — never the text itself.
 
 A per-session random salt (16 bytes from :func:`os.urandom`) ensures that
 hashes cannot be reversed via rainbow tables while still allowing
@@ -11,14 +14,76 @@ deduplication within a single scan session.
 """
 
 import hashlib
+import itertools
+import mmap
 import os
 import re
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from pydantic import BaseModel
 
 from creek.config import RedactionConfig
-from creek.redact.patterns import REDACTION_PATTERNS
+from creek.redact.patterns import (
+    REDACTION_PATTERNS,
+    candidate_patterns,
+    required_literals,
+    to_bytes_pattern,
+)
+
+_MMAP_MIN_BYTES = 1 << 20
+"""Files at least this large are memory-mapped instead of read whole."""
+
+_BINARY_SNIFF_BYTES = 8192
+"""Leading bytes checked for NUL to recognise binary files."""
+
+_HASH_CACHE_SIZE = 131072
+"""Maximum number of memoised hashes a scanner keeps before resetting."""
+
+_STR_ONLY_BYTES = re.compile(rb"[\x0b-\x0d\x1c-\x1f\x80-\xff]")
+"""Bytes whose handling differs between the bytes scan and the ``str`` scan.
+
+Non-ASCII bytes change the meaning of ``\\w``, ``\\d`` and ``\\b``;
+``\\x0b``-``\\x0d`` and ``\\x1c``-``\\x1e`` are line breaks to
+:meth:`str.splitlines`; ``\\x1c``-``\\x1f`` are whitespace only to ``str``
+patterns.
+"""
+
+
+def iter_files(root: Path) -> Iterator[Path]:
+    """Yield every regular file beneath *root* in a single traversal.
+
+    Walks with :func:`os.scandir`, whose entries carry the file type from
+    the directory listing, so most entries need no extra ``stat`` call.
+    Directory symlinks are not followed, and directories or entries that
+    cannot be read are skipped, both matching :meth:`Path.rglob`.  Order
+    is unspecified; callers that need determinism should sort.
+
+    Args:
+        root: Directory to walk.
+
+    Yields:
+        Paths to regular files (including symlinks to files).
+    """
+    stack: list[str] = [os.fspath(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    is_file = not is_dir and entry.is_file()
+                except OSError:
+                    continue
+                if is_dir:
+                    stack.append(entry.path)
+                elif is_file:
+                    yield Path(entry.path)
 
 
 class RedactionMatch(BaseModel):
@@ -57,6 +122,12 @@ class RedactionScanner:
         self.config = config
         self.salt: bytes = os.urandom(16)
         self._patterns = self._build_patterns()
+        self._literals, self._folded_names = required_literals(self._patterns)
+        self._allowlist = frozenset(config.false_positive_allowlist)
+        self._bytes_cache: dict[str, re.Pattern[bytes] | None] = {}
+        self._hash_cache: dict[str, str] = {}
+        self._hash_cache_salt = self.salt
+        self._salted_ctx = hashlib.sha256(self.salt)
 
     def _build_patterns(self) -> dict[str, re.Pattern[str]]:
         """Merge built-in patterns with any custom patterns from config.
@@ -70,7 +141,14 @@ class RedactionScanner:
         return patterns
 
     def _hash_match(self, text: str) -> str:
-        """Compute a salted SHA-256 hash of *text*.
+        """Compute a salted SHA-256 hash of *text*, memoised per scanner.
+
+        Repeated matches (the same email on every page) are hashed once,
+        and each new digest starts from a copy of a context that has
+        already absorbed the salt.  The cache and context are rebuilt when
+        :attr:`salt` is reassigned, and the cache resets once it holds
+        :data:`_HASH_CACHE_SIZE` entries, so it lives no longer than the
+        scanner and stays bounded.
 
         Args:
             text: The sensitive string to hash.
@@ -78,24 +156,44 @@ class RedactionScanner:
         Returns:
             Hex-encoded SHA-256 digest of ``salt + text.encode()``.
         """
-        return hashlib.sha256(self.salt + text.encode()).hexdigest()  # nosec B324
+        cache = self._hash_cache
+        if self._hash_cache_salt is not self.salt:
+            cache.clear()
+            self._hash_cache_salt = self.salt
+            self._salted_ctx = hashlib.sha256(self.salt)
+        digest = cache.get(text)
+        if digest is None:
+            if len(cache) >= _HASH_CACHE_SIZE:
+                cache.clear()
+            ctx = self._salted_ctx.copy()
+            ctx.update(text.encode())
+            digest = ctx.hexdigest()
+            cache[text] = digest
+        return digest
 
     def _is_allowlisted(self, text: str) -> bool:
         """Check whether *text* appears in the false-positive allowlist.
 
+        The allowlist is copied into a frozenset at construction, so each
+        check is a hash lookup however long the configured list is.
+
         Args:
             text: The matched string to check.
 
         Returns:
             ``True`` if the string should be excluded from results.
         """
-        return text in self.config.false_positive_allowlist
+        return text in self._allowlist
 
     def scan_file(self, file_path: Path) -> list[RedactionMatch]:
         """Scan a single file for sensitive data patterns.
 
-        Reads the file line-by-line and returns a :class:`RedactionMatch`
-        for every pattern hit that is not on the false-positive allowlist.
+        Files of at least :data:`_MMAP_MIN_BYTES` are memory-mapped rather
+        than read, so the OS pages them in as the scan advances; smaller
+        files are read into memory in one call.  Either way the buffer is
+        scanned as described in :meth:`_scan_buffer`.  Files larger than
+        :attr:`RedactionConfig.max_scan_bytes` are skipped, as are binary
+        files (a NUL byte within the first :data:`_BINARY_SNIFF_BYTES`).
 
         Args:
             file_path: Path to the file to scan.
@@ -110,11 +208,111 @@ class RedactionScanner:
             msg = f"File not found: {file_path}"
             raise FileNotFoundError(msg)
 
+        size = file_path.stat().st_size
+        limit = self.config.max_scan_bytes
+        if limit is not None and size > limit:
+            return []
+        if size < _MMAP_MIN_BYTES:
+            return self._scan_buffer(file_path, file_path.read_bytes())
+        with (
+            file_path.open("rb") as handle,
+            mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+        ):
+            return self._scan_buffer(file_path, mapped)
+
+    def _scan_buffer(
+        self, file_path: Path, data: bytes | mmap.mmap
+    ) -> list[RedactionMatch]:
+        """Scan a file's raw content for sensitive data patterns.
+
+        Runs each candidate pattern over the whole buffer (with ``^``/``$``
+        matching at line boundaries) and derives each match's line number
+        by counting newlines since the previous match.  Only matched slices
+        are decoded.  Matches are reported line by line, in pattern order
+        within a line, exactly as :meth:`_scan_lines` would.  Falls back to
+        decoding the buffer and scanning line by line when a pattern cannot
+        be compiled for bytes, the buffer contains bytes the two scans
+        treat differently (see :data:`_STR_ONLY_BYTES`), or a match crosses
+        a line break.
+
+        Args:
+            file_path: Path recorded on each match.
+            data: The file's bytes, or a read-only mapping of them.
+
+        Returns:
+            List of :class:`RedactionMatch` objects (may be empty).
+        """
+        if data.find(b"\x00", 0, _BINARY_SNIFF_BYTES) != -1:
+            return []
+        active = candidate_patterns(
+            self._patterns, data, self._literals, self._folded_names
+        )
+        if not active:
+            return []
+
+        regexes = self._bytes_patterns_for(active)
+        if regexes is None or _STR_ONLY_BYTES.search(data) is not None:
+            text = bytes(data).decode("utf-8", errors="replace")
+            return self._scan_lines(file_path, text, active)
+
+        hits: list[tuple[int, int, bytes]] = []
+        for index, regex in enumerate(regexes):
+            for m in regex.finditer(data):
+                raw = m.group()
+                if b"\n" in raw:
+                    # A pattern such as ``\s*`` crossed a line break; rescan
+                    # by line so results match the line-oriented semantics.
+                    text = bytes(data).decode("utf-8", errors="replace")
+                    return self._scan_lines(file_path, text, active)
+                hits.append((m.start(), index, raw))
+        hits.sort()
+
+        located: list[tuple[int, int, int, bytes]] = []
+        line_num = 1
+        position = 0
+        for start, index, raw in hits:
+            line_num += data[position:start].count(b"\n")
+            position = start
+            located.append((line_num, index, start, raw))
+        located.sort()
+
+        names = [name for name in self._patterns if name in active]
         matches: list[RedactionMatch] = []
-        text = file_path.read_text(encoding="utf-8", errors="replace")
+        for line_num, index, _, raw in located:
+            matched_text = raw.decode("ascii")
+            if self._is_allowlisted(matched_text):
+                continue
+            matches.append(
+                RedactionMatch(
+                    file_path=file_path,
+                    line_number=line_num,
+                    match_type=names[index],
+                    salted_hash=self._hash_match(matched_text),
+                )
+            )
+
+        return matches
 
+    def _scan_lines(
+        self,
+        file_path: Path,
+        text: str,
+        active: frozenset[str],
+    ) -> list[RedactionMatch]:
+        """Scan decoded *text* line by line with the ``str`` patterns.
+
+        Args:
+            file_path: Path recorded on each match.
+            text: The decoded file content.
+            active: Names of the patterns to apply.
+
+        Returns:
+            List of :class:`RedactionMatch` objects (may be empty).
+        """
+        matches: list[RedactionMatch] = []
+        patterns = [(n, p) for n, p in self._patterns.items() if n in active]
         for line_num, line in enumerate(text.splitlines(), start=1):
-            for name, pattern in self._patterns.items():
+            for name, pattern in patterns:
                 for m in pattern.finditer(line):
                     matched_text = m.group()
                     if self._is_allowlisted(matched_text):
@@ -130,6 +328,33 @@ class RedactionScanner:
 
         return matches
 
+    def _bytes_patterns_for(
+        self,
+        names: frozenset[str],
+    ) -> list[re.Pattern[bytes]] | None:
+        """Return multiline bytes regexes for *names*, in pattern order.
+
+        Each pattern is converted once per scanner and cached by name.
+
+        Args:
+            names: Names of the patterns to convert.
+
+        Returns:
+            One bytes regex per selected pattern, or ``None`` if any of
+            them cannot be converted.
+        """
+        regexes: list[re.Pattern[bytes]] = []
+        for name, pattern in self._patterns.items():
+            if name not in names:
+                continue
+            if name not in self._bytes_cache:
+                self._bytes_cache[name] = to_bytes_pattern(pattern, re.MULTILINE)
+            regex = self._bytes_cache[name]
+            if regex is None:
+                return None
+            regexes.append(regex)
+        return regexes
+
     def scan_directory(self, dir_path: Path) -> list[RedactionMatch]:
         """Recursively scan all files in a directory for sensitive data.
 
@@ -148,12 +373,59 @@ class RedactionScanner:
             msg = f"Directory not found: {dir_path}"
             raise FileNotFoundError(msg)
 
+        return self.scan_paths(sorted(iter_files(dir_path)))
+
+    def scan_paths(self, paths: Iterable[Path]) -> list[RedactionMatch]:
+        """Scan each file in *paths* for sensitive data.
+
+        Accepts any iterable, including a generator, so callers that have
+        already walked a tree can hand over the file list instead of
+        having the scanner walk it again.
+
+        Args:
+            paths: Paths to regular files, scanned in iteration order.
+
+        Returns:
+            Aggregated list of :class:`RedactionMatch` objects.
+        """
+        workers = self.config.workers
+        if workers > 1:
+            batch = list(paths)
+            if len(batch) > 1:
+                return self._scan_parallel(batch, workers)
+            paths = batch
+
         matches: list[RedactionMatch] = []
-        for child in sorted(dir_path.rglob("*")):
-            if child.is_file():
-                matches.extend(self.scan_file(child))
+        for path in paths:
+            matches.extend(self.scan_file(path))
         return matches
 
+    def _scan_parallel(self, paths: list[Path], workers: int) -> list[RedactionMatch]:
+        """Scan *paths* across a pool of worker processes.
+
+        Each worker builds its own scanner once, from this scanner's
+        config and salt, so patterns compile once per process and hashes
+        match a serial scan.  Results keep the order of *paths*.
+
+        Args:
+            paths: Paths to regular files.
+            workers: Number of worker processes.
+
+        Returns:
+            Aggregated list of :class:`RedactionMatch` objects.
+        """
+        chunksize = max(1, len(paths) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self.config, self.salt),
+        ) as pool:
+            return list(
+                itertools.chain.from_iterable(
+                    pool.map(_scan_one, paths, chunksize=chunksize)
+                )
+            )
+
     def generate_report(self, matches: list[RedactionMatch]) -> str:
         """Generate a human-readable report from a list of matches.
 
@@ -171,23 +443,52 @@ class RedactionScanner:
             "",
         ]
 
-        by_type: dict[str, int] = {}
-        by_file: dict[str, list[RedactionMatch]] = {}
-
-        for match in matches:
-            by_type[match.match_type] = by_type.get(match.match_type, 0) + 1
-            file_key = str(match.file_path)
-            by_file.setdefault(file_key, []).append(match)
-
+        by_type = Counter(match.match_type for match in matches)
         lines.append("By type:")
-        for match_type, count in sorted(by_type.items()):
-            lines.append(f"  {match_type}: {count}")
+        lines.extend(
+            f"  {match_type}: {count}" for match_type, count in sorted(by_type.items())
+        )
 
         lines.append("")
         lines.append("By file:")
-        for file_key, file_matches in sorted(by_file.items()):
+        # One stable sort keeps each file's matches in scan order.
+        ordered = sorted(matches, key=lambda m: str(m.file_path))
+        for file_key, group in itertools.groupby(ordered, key=lambda m: m.file_path):
             lines.append(f"  {file_key}:")
-            for fm in file_matches:
-                lines.append(f"    line {fm.line_number}: {fm.match_type}")
+            lines.extend(f"    line {fm.line_number}: {fm.match_type}" for fm in group)
 
         return "\n".join(lines)
+
+
+_worker_scanner: RedactionScanner | None = None
+"""Scanner owned by the current pool worker process."""
+
+
+def _init_worker(config: RedactionConfig, salt: bytes) -> None:
+    """Build the worker's scanner, sharing the parent's session salt.
+
+    Args:
+        config: Redaction configuration of the parent scanner.
+        salt: Session salt of the parent scanner.
+    """
+    global _worker_scanner
+    _worker_scanner = RedactionScanner(config=config)
+    _worker_scanner.salt = salt
+
+
+def _scan_one(path: Path) -> list[RedactionMatch]:
+    """Scan *path* with the worker's scanner.
+
+    Args:
+        path: Path to a regular file.
+
+    Returns:
+        Matches found in the file.
+
+    Raises:
+        RuntimeError: If called outside an initialised worker.
+    """
+    if _worker_scanner is None:
+        msg = "Scanner worker was not initialised"
+        raise RuntimeError(msg)
+    return _worker_scanner.scan_file(path)
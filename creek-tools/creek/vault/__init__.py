@@ -1,5 +1,5 @@
 """Creek vault subpackage — write ontological primitives to an Obsidian vault."""
 
-from creek.vault.writer import VaultWriter
+from creek.vault.writer import VaultWriter, read_provenance
 
-__all__ = ["VaultWriter"]
+__all__ = ["VaultWriter", "read_provenance"]
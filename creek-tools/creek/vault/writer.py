@@ -6,16 +6,24 @@ Obsidian-compatible markdown files with YAML frontmatter. It handles:
 
 - Mapping each primitive to the correct vault subfolder
 - Sanitising titles into safe filenames
-- Detecting duplicates (by ID) and skipping re-writes
-- Appending provenance entries to the processing log
+- Emitting the YAML frontmatter directly for the models' fixed shapes
+- Detecting duplicates (by ID, via a per-directory index) and skipping
+  re-writes
+- Writing batches concurrently, one thread per target directory
+- Appending provenance entries to the JSON Lines processing log, read
+  back with :func:`read_provenance`
 """
 
 from __future__ import annotations
 
+import functools
 import json
+import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import frontmatter
 
@@ -26,7 +34,7 @@ from creek.models import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
     from pathlib import Path
 
     from pydantic import BaseModel
@@ -62,6 +70,36 @@ _PRAXIS_SUBFOLDER: dict[str, str] = {
 _MAX_FILENAME_LENGTH = 80
 """Maximum character length for sanitised filename components."""
 
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w\s-]")
+"""Characters stripped from titles (``\\w`` keeps international letters)."""
+
+_PLAIN_SCALAR = re.compile(r"[^\W\d](?:[\w .,;()'/?!+&-]*[\w.)'?!/+&-])?")
+"""Strings that may be written as plain (unquoted) YAML scalars.
+
+They start with a letter (so cannot read as a number or date), never
+contain ``:`` or ``#``, and do not end in a space.
+"""
+
+_YAML_RESERVED_WORDS: frozenset[str] = frozenset(
+    {"y", "n", "yes", "no", "on", "off", "true", "false", "null"}
+)
+"""Words YAML 1.1 would resolve to a bool or null (compared lower-cased)."""
+
+_YAML_UNSAFE_CHARS = re.compile("[\x7f-\x9f\u2028\u2029\ud800-\udfff\ufffe\uffff]")
+"""Characters YAML readers treat as line breaks or reject when left raw."""
+
+_MIN_PARALLEL_WRITES = 8
+"""Smallest :meth:`VaultWriter.write_many` batch worth a thread pool."""
+
+_MAX_WRITE_WORKERS = 32
+"""Upper bound on threads used by :meth:`VaultWriter.write_many`."""
+
+_PROVENANCE_LOG = "provenance.jsonl"
+"""Name of the JSON Lines provenance log in ``00-Creek-Meta/Processing-Log``."""
+
+_LEGACY_PROVENANCE_LOG = "provenance.json"
+"""Name of the earlier JSON-array provenance log, migrated on first write."""
+
 _ACTIVE_DECISION_STATUSES: set[str] = {
     DecisionStatus.SENSING,
     DecisionStatus.DELIBERATING,
@@ -69,11 +107,13 @@ _ACTIVE_DECISION_STATUSES: set[str] = {
 }
 
 
+@functools.lru_cache(maxsize=8192)
 def _sanitize_title(title: str) -> str:
     """Sanitise a title string into a safe filename component.
 
     Removes non-word, non-space, non-hyphen characters and truncates
-    the result to 80 characters.
+    the result to 80 characters.  Memoised, since chunked sources write
+    many fragments under the same title.
 
     Args:
         title: The raw title string.
@@ -81,12 +121,169 @@ def _sanitize_title(title: str) -> str:
     Returns:
         A sanitised string suitable for use in a filename.
     """
-    # \w includes unicode word chars — intentional for international content
-    cleaned = re.sub(r"[^\w\s-]", "", title)
+    cleaned = _UNSAFE_FILENAME_CHARS.sub("", title)
     cleaned = cleaned.strip().replace(" ", "-")
     return cleaned[:_MAX_FILENAME_LENGTH]
 
 
+def _provenance_dir(vault_path: Path) -> Path:
+    """Return the processing-log directory of the vault at *vault_path*.
+
+    Args:
+        vault_path: Path to the root of the Obsidian vault.
+
+    Returns:
+        Path to ``00-Creek-Meta/Processing-Log``.
+    """
+    return vault_path / "00-Creek-Meta" / "Processing-Log"
+
+
+def _migrate_provenance(log_dir: Path) -> None:
+    """Convert a legacy ``provenance.json`` array into JSON Lines.
+
+    The legacy entries are placed ahead of any lines already in
+    ``provenance.jsonl`` and the legacy file is removed.  Does nothing if
+    there is no legacy log.
+
+    Args:
+        log_dir: The vault's processing-log directory.
+    """
+    legacy_path = log_dir / _LEGACY_PROVENANCE_LOG
+    if not legacy_path.exists():
+        return
+    raw = legacy_path.read_text(encoding="utf-8")
+    entries: list[dict[str, str]] = json.loads(raw) if raw.strip() else []
+    log_path = log_dir / _PROVENANCE_LOG
+    existing = log_path.read_text(encoding="utf-8") if log_path.exists() else ""
+    log_path.write_text(
+        "".join(json.dumps(entry) + "\n" for entry in entries) + existing,
+        encoding="utf-8",
+    )
+    legacy_path.unlink()
+
+
+def read_provenance(vault_path: Path) -> list[dict[str, str]]:
+    """Read every provenance entry written to the vault at *vault_path*.
+
+    Entries from a legacy ``provenance.json`` array that has not been
+    migrated yet come first.  Blank lines are skipped.
+
+    Args:
+        vault_path: Path to the root of the Obsidian vault.
+
+    Returns:
+        The provenance entries in the order they were written.
+    """
+    log_dir = _provenance_dir(vault_path)
+    entries: list[dict[str, str]] = []
+    legacy_path = log_dir / _LEGACY_PROVENANCE_LOG
+    if legacy_path.exists():
+        raw = legacy_path.read_text(encoding="utf-8")
+        if raw.strip():
+            entries.extend(json.loads(raw))
+    log_path = log_dir / _PROVENANCE_LOG
+    if log_path.exists():
+        with log_path.open(encoding="utf-8") as fh:
+            entries.extend(json.loads(line) for line in fh if line.strip())
+    return entries
+
+
+class _UnsupportedValueError(TypeError):
+    """Raised when a value is outside what :func:`_dump_frontmatter` emits."""
+
+
+def _yaml_scalar(value: object) -> str:
+    """Render a JSON-mode scalar as a YAML scalar that loads back unchanged.
+
+    Strings are written plain when they cannot be mistaken for another
+    type, and otherwise double-quoted using JSON escapes (a subset of
+    YAML's double-quoted syntax).
+
+    Args:
+        value: ``None``, a bool, int, float, or str.
+
+    Returns:
+        The YAML text for *value*.
+
+    Raises:
+        _UnsupportedValueError: For other types, or floats whose text
+            YAML 1.1 would not read back as a float.
+    """
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        text = repr(value)
+        if "." not in text:
+            raise _UnsupportedValueError(text)
+        return text
+    if isinstance(value, str):
+        if _PLAIN_SCALAR.fullmatch(value) and value.lower() not in (
+            _YAML_RESERVED_WORDS
+        ):
+            return value
+        quoted = json.dumps(value, ensure_ascii=False)
+        return _YAML_UNSAFE_CHARS.sub(lambda m: f"\\u{ord(m.group()):04x}", quoted)
+    raise _UnsupportedValueError(type(value).__name__)
+
+
+def _yaml_block(data: dict[str, Any], indent: str, lines: list[str]) -> None:
+    """Append block-style YAML lines for *data*, keys sorted.
+
+    Args:
+        data: Mapping of JSON-mode values (scalars, nested mappings, and
+            lists of scalars).
+        indent: Prefix for each line at this nesting level.
+        lines: Output list the lines are appended to.
+
+    Raises:
+        _UnsupportedValueError: If a value cannot be emitted.
+    """
+    for key in sorted(data):
+        value = data[key]
+        name = _yaml_scalar(key)
+        if isinstance(value, dict):
+            if not value:
+                lines.append(f"{indent}{name}: {{}}")
+                continue
+            lines.append(f"{indent}{name}:")
+            _yaml_block(value, indent + "  ", lines)
+        elif isinstance(value, list):
+            if not value:
+                lines.append(f"{indent}{name}: []")
+                continue
+            lines.append(f"{indent}{name}:")
+            lines.extend(f"{indent}- {_yaml_scalar(item)}" for item in value)
+        else:
+            lines.append(f"{indent}{name}: {_yaml_scalar(value)}")
+
+
+def _dump_frontmatter(data: dict[str, Any]) -> str:
+    """Serialise *data* as a markdown document holding only frontmatter.
+
+    The models' dumps are flat mappings of scalars, nested mappings and
+    lists of strings, so the block YAML is emitted directly, which is an
+    order of magnitude faster than PyYAML's representer.  Anything else
+    falls back to :func:`frontmatter.dumps`.
+
+    Args:
+        data: The model's ``model_dump(mode="json")`` output.
+
+    Returns:
+        The document text, in the same layout ``frontmatter.dumps`` uses.
+    """
+    lines: list[str] = ["---"]
+    try:
+        _yaml_block(data, "", lines)
+    except _UnsupportedValueError:
+        return frontmatter.dumps(frontmatter.Post(content="", **data))
+    lines.append("---")
+    return "\n".join(lines)
+
+
 def _extract_date_str(model: BaseModel) -> str:
     """Extract a date string from a model for use in filename prefix.
 
@@ -147,6 +344,11 @@ class VaultWriter:
                 raise FileNotFoundError(msg)
 
         self.vault_path = vault_path
+        self._id_index: dict[Path, dict[str, Path]] = {}
+        self._provenance_ready = False
+        self._created_dirs: set[Path] = set()
+        self._dir_names: dict[Path, set[str]] = {}
+        self._provenance_lock = threading.Lock()
 
     def write_fragment(self, fragment: Fragment) -> Path:
         """Write a Fragment to the appropriate 01-Fragments/ subfolder.
@@ -161,10 +363,7 @@ class VaultWriter:
         Returns:
             Path to the written (or existing duplicate) markdown file.
         """
-        platform = fragment.source.platform
-        subfolder = _PLATFORM_SUBFOLDER.get(str(platform), "Unsorted")
-        target_dir = self.vault_path / "01-Fragments" / subfolder
-        return self._write_model(fragment, target_dir)
+        return self._write_model(fragment, self._fragment_dir(fragment))
 
     def write_thread(self, thread: Thread) -> Path:
         """Write a Thread to 02-Threads/{status}/.
@@ -178,9 +377,7 @@ class VaultWriter:
         Returns:
             Path to the written (or existing duplicate) markdown file.
         """
-        status_folder = str(thread.status).capitalize()
-        target_dir = self.vault_path / "02-Threads" / status_folder
-        return self._write_model(thread, target_dir)
+        return self._write_model(thread, self._thread_dir(thread))
 
     def write_eddy(self, eddy: Eddy) -> Path:
         """Write an Eddy to 03-Eddies/.
@@ -191,8 +388,7 @@ class VaultWriter:
         Returns:
             Path to the written (or existing duplicate) markdown file.
         """
-        target_dir = self.vault_path / "03-Eddies"
-        return self._write_model(eddy, target_dir)
+        return self._write_model(eddy, self._eddy_dir(eddy))
 
     def write_praxis(self, praxis: Praxis) -> Path:
         """Write a Praxis to 04-Praxis/{type}/.
@@ -206,9 +402,7 @@ class VaultWriter:
         Returns:
             Path to the written (or existing duplicate) markdown file.
         """
-        subfolder = _PRAXIS_SUBFOLDER.get(str(praxis.praxis_type), "Situational")
-        target_dir = self.vault_path / "04-Praxis" / subfolder
-        return self._write_model(praxis, target_dir)
+        return self._write_model(praxis, self._praxis_dir(praxis))
 
     def write_decision(self, decision: Decision) -> Path:
         """Write a Decision to 08-Decisions/{status}/.
@@ -222,11 +416,7 @@ class VaultWriter:
         Returns:
             Path to the written (or existing duplicate) markdown file.
         """
-        subfolder = (
-            "Active" if str(decision.status) in _ACTIVE_DECISION_STATUSES else "Archive"
-        )
-        target_dir = self.vault_path / "08-Decisions" / subfolder
-        return self._write_model(decision, target_dir)
+        return self._write_model(decision, self._decision_dir(decision))
 
     def write_any(self, model: BaseModel) -> Path:
         """Dispatch to the appropriate write method based on the model's type field.
@@ -257,11 +447,155 @@ class VaultWriter:
             raise ValueError(msg)
         return writer(model)
 
+    def write_many(self, models: Iterable[BaseModel]) -> list[Path]:
+        """Write a batch of models, spreading target directories over threads.
+
+        Models are grouped by target directory; each group is written in
+        order by a single worker, so duplicate detection and filename
+        choice within a directory never race, while different directories
+        are written concurrently.  Batches smaller than
+        :data:`_MIN_PARALLEL_WRITES` are written inline.
+
+        Args:
+            models: Pydantic models with a ``type`` field.
+
+        Returns:
+            Paths to the written (or existing duplicate) files, in the
+            order of *models*.
+
+        Raises:
+            ValueError: If a model's type is not recognised.
+        """
+        batch = list(models)
+        targets = [self._target_dir_for(model) for model in batch]
+        if len(batch) < _MIN_PARALLEL_WRITES:
+            return [
+                self._write_model(model, target)
+                for model, target in zip(batch, targets, strict=True)
+            ]
+
+        groups: dict[Path, list[int]] = {}
+        for index, target in enumerate(targets):
+            groups.setdefault(target, []).append(index)
+
+        paths: list[Path | None] = [None] * len(batch)
+
+        def _write_group(target: Path, indices: list[int]) -> None:
+            """Write the models at *indices* into *target*, in order.
+
+            Args:
+                target: The shared target directory.
+                indices: Positions in the batch of the models to write.
+            """
+            for index in indices:
+                paths[index] = self._write_model(batch[index], target)
+
+        workers = min(_MAX_WRITE_WORKERS, len(groups))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_write_group, target, indices)
+                for target, indices in groups.items()
+            ]
+            for future in futures:
+                future.result()
+        return [path for path in paths if path is not None]
+
+    def _target_dir_for(self, model: BaseModel) -> Path:
+        """Return the vault directory a model of any supported type goes to.
+
+        Args:
+            model: A Pydantic model with a ``type`` field.
+
+        Returns:
+            The target directory, as chosen by the matching ``write_*``.
+
+        Raises:
+            ValueError: If the model's type is not recognised.
+        """
+        type_field = getattr(model, "type", None)
+        dispatch: dict[str, Callable[..., Path]] = {
+            "fragment": self._fragment_dir,
+            "thread": self._thread_dir,
+            "eddy": self._eddy_dir,
+            "praxis": self._praxis_dir,
+            "decision": self._decision_dir,
+        }
+        target_for = dispatch.get(str(type_field))
+        if target_for is None:
+            msg = f"Unsupported model type: {type_field}"
+            raise ValueError(msg)
+        return target_for(model)
+
+    def _fragment_dir(self, fragment: Fragment) -> Path:
+        """Return the 01-Fragments/ subfolder for a fragment's platform.
+
+        Args:
+            fragment: The Fragment being written.
+
+        Returns:
+            The target directory.
+        """
+        platform = fragment.source.platform
+        subfolder = _PLATFORM_SUBFOLDER.get(str(platform), "Unsorted")
+        return self.vault_path / "01-Fragments" / subfolder
+
+    def _thread_dir(self, thread: Thread) -> Path:
+        """Return the 02-Threads/{status}/ folder for a thread.
+
+        Args:
+            thread: The Thread being written.
+
+        Returns:
+            The target directory.
+        """
+        return self.vault_path / "02-Threads" / str(thread.status).capitalize()
+
+    def _eddy_dir(self, eddy: Eddy) -> Path:
+        """Return the 03-Eddies/ folder.
+
+        Args:
+            eddy: The Eddy being written.
+
+        Returns:
+            The target directory.
+        """
+        return self.vault_path / "03-Eddies"
+
+    def _praxis_dir(self, praxis: Praxis) -> Path:
+        """Return the 04-Praxis/{type}/ subfolder for a praxis.
+
+        Args:
+            praxis: The Praxis being written.
+
+        Returns:
+            The target directory.
+        """
+        subfolder = _PRAXIS_SUBFOLDER.get(str(praxis.praxis_type), "Situational")
+        return self.vault_path / "04-Praxis" / subfolder
+
+    def _decision_dir(self, decision: Decision) -> Path:
+        """Return the 08-Decisions/ Active or Archive folder for a decision.
+
+        Args:
+            decision: The Decision being written.
+
+        Returns:
+            The target directory.
+        """
+        subfolder = (
+            "Active" if str(decision.status) in _ACTIVE_DECISION_STATUSES else "Archive"
+        )
+        return self.vault_path / "08-Decisions" / subfolder
+
     def _write_model(self, model: BaseModel, target_dir: Path) -> Path:
         """Serialise a model to markdown with YAML frontmatter and write to disk.
 
         Handles duplicate detection (by ID), filename generation,
-        frontmatter serialisation, and provenance logging.
+        frontmatter serialisation, and provenance logging.  The document
+        is encoded once and written in a single binary write, and each
+        target directory is created at most once per writer.  Files are
+        opened in exclusive-create mode, so a note that appeared since
+        the directory was listed is never overwritten.
 
         Args:
             model: The Pydantic model to serialise.
@@ -275,15 +609,22 @@ class VaultWriter:
         if existing is not None:
             return existing
 
-        target_dir.mkdir(parents=True, exist_ok=True)
-
-        filename = self._generate_filename(model, target_dir)
-        file_path = target_dir / filename
-
-        data = model.model_dump(mode="json")
-        post = frontmatter.Post(content="", **data)
-        content = frontmatter.dumps(post)
-        file_path.write_text(content, encoding="utf-8")
+        if target_dir not in self._created_dirs:
+            target_dir.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(target_dir)
+
+        content = _dump_frontmatter(model.model_dump(mode="json")).encode("utf-8")
+        while True:
+            file_path = target_dir / self._generate_filename(model, target_dir)
+            try:
+                with file_path.open("xb") as fh:
+                    fh.write(content)
+            except FileExistsError:
+                # Created behind this writer's back; the name is now
+                # reserved, so the next attempt picks another.
+                continue
+            break
+        self._index_for(target_dir)[model_id] = file_path
 
         self._log_provenance(model_id, str(getattr(model, "type", "")), file_path)
         return file_path
@@ -291,8 +632,9 @@ class VaultWriter:
     def _find_existing(self, model_id: str, target_dir: Path) -> Path | None:
         """Search for an existing file with the given model ID in target_dir.
 
-        Reads the frontmatter of each ``.md`` file in the directory and
-        checks if its ``id`` field matches.
+        Looks the ID up in the directory's index (see :meth:`_index_for`).
+        An indexed file that has since been removed is dropped from the
+        index and treated as absent.
 
         Args:
             model_id: The ID to search for.
@@ -301,20 +643,47 @@ class VaultWriter:
         Returns:
             The path to the existing file, or ``None`` if not found.
         """
-        if not target_dir.exists():
+        index = self._index_for(target_dir)
+        existing = index.get(model_id)
+        if existing is not None and not existing.exists():
+            del index[model_id]
+            self._dir_names.get(target_dir, set()).discard(existing.name)
             return None
-        for md_file in target_dir.glob("*.md"):
-            post = frontmatter.load(str(md_file))
-            if post.get("id") == model_id:
-                return md_file
-        return None
+        return existing
+
+    def _index_for(self, target_dir: Path) -> dict[str, Path]:
+        """Return the ``id`` -> path index for *target_dir*, building it once.
+
+        The first lookup in a directory reads the frontmatter of each
+        ``.md`` file in it; later lookups and writes through this writer
+        use and update the in-memory index, so a bulk import parses each
+        existing file once rather than once per write.
+
+        Args:
+            target_dir: The vault directory to index.
+
+        Returns:
+            Mapping of model ID to the file that holds it.
+        """
+        index = self._id_index.get(target_dir)
+        if index is None:
+            index = {}
+            if target_dir.exists():
+                for md_file in target_dir.glob("*.md"):
+                    model_id = frontmatter.load(str(md_file)).get("id")
+                    if isinstance(model_id, str):
+                        index.setdefault(model_id, md_file)
+            self._id_index[target_dir] = index
+        return index
 
     def _generate_filename(self, model: BaseModel, target_dir: Path) -> str:
         """Generate a unique filename for the model.
 
         Format: ``{date}-{sanitised_title}.md``. If a file with the
         same name already exists (title collision with different ID),
-        a numeric suffix is appended.
+        a numeric suffix is appended.  Collisions are checked against the
+        directory's cached listing (see :meth:`_names_for`), and the
+        chosen name is reserved in it.
 
         Args:
             model: The model to generate a filename for.
@@ -329,14 +698,33 @@ class VaultWriter:
 
         base_name = f"{date_str}-{sanitized}" if sanitized else date_str
 
+        names = self._names_for(target_dir)
         filename = f"{base_name}.md"
-        if not (target_dir / filename).exists():
-            return filename
-
-        counter = 1
-        while (target_dir / f"{base_name}-{counter}.md").exists():
+        counter = 0
+        while filename in names:
             counter += 1
-        return f"{base_name}-{counter}.md"
+            filename = f"{base_name}-{counter}.md"
+        names.add(filename)
+        return filename
+
+    def _names_for(self, target_dir: Path) -> set[str]:
+        """Return the cached set of entry names in *target_dir*.
+
+        The directory is listed once per writer; names chosen by
+        :meth:`_generate_filename` are added as files are written, so
+        collision checks need no ``stat`` calls.
+
+        Args:
+            target_dir: The vault directory.
+
+        Returns:
+            The mutable set of names known to exist in *target_dir*.
+        """
+        names = self._dir_names.get(target_dir)
+        if names is None:
+            names = set(os.listdir(target_dir)) if target_dir.exists() else set()
+            self._dir_names[target_dir] = names
+        return names
 
     def _log_provenance(
         self,
@@ -346,32 +734,29 @@ class VaultWriter:
     ) -> None:
         """Append a provenance entry to the processing log.
 
-        The log is a JSON array stored at
-        ``00-Creek-Meta/Processing-Log/provenance.json``.
+        The log is a JSON Lines file at
+        ``00-Creek-Meta/Processing-Log/provenance.jsonl``; each entry is
+        appended as one line, so logging costs the same however long the
+        log grows.  The first write through this writer migrates a legacy
+        ``provenance.json`` array, if present.
 
         Args:
             model_id: The ID of the written model.
             model_type: The type string of the written model.
             file_path: The path where the model was written.
         """
-        log_dir = self.vault_path / "00-Creek-Meta" / "Processing-Log"
-        log_dir.mkdir(parents=True, exist_ok=True)
-        log_path = log_dir / "provenance.json"
-
-        entries: list[dict[str, str]] = []
-        if log_path.exists():
-            raw = log_path.read_text(encoding="utf-8")
-            if raw.strip():
-                entries = json.loads(raw)
-
+        log_dir = _provenance_dir(self.vault_path)
         entry: dict[str, str] = {
             "id": model_id,
             "type": model_type,
             "path": str(file_path),
             "written_at": datetime.now().isoformat(),
         }
-        entries.append(entry)
-        log_path.write_text(
-            json.dumps(entries, indent=2),
-            encoding="utf-8",
-        )
+        line = json.dumps(entry) + "\n"
+        with self._provenance_lock:
+            if not self._provenance_ready:
+                log_dir.mkdir(parents=True, exist_ok=True)
+                _migrate_provenance(log_dir)
+                self._provenance_ready = True
+            with (log_dir / _PROVENANCE_LOG).open("a", encoding="utf-8") as fh:
+                fh.write(line)
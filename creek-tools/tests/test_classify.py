@@ -1,7 +1,11 @@
 """Tests for the creek.classify classification pipeline."""
 
 import logging
+from enum import StrEnum
+from operator import attrgetter
 from pathlib import Path
+from typing import NamedTuple
+from unittest.mock import patch
 
 import pytest
 
@@ -23,6 +27,7 @@ from creek.classify.rules import (
 from creek.classify.rules import RuleClassifier as RuleClassifierDirect
 from creek.config import ClassificationConfig, LLMConfig
 from creek.models import (
+    Confidence,
     Fragment,
     FragmentSource,
     Frequency,
@@ -35,6 +40,13 @@ from creek.models import (
 
 # ---- Helpers ----
 
+_FREQUENCY_KEYWORD = next(iter(FREQUENCY_SIGNALS.values()))[0]
+_PHASE_KEYWORD = next(iter(WAVELENGTH_PHASE_SIGNALS.values()))[0]
+_MODE_KEYWORD = next(iter(MODE_SIGNALS.values()))[0]
+_CLASSIFIED_FREQUENCIES = frozenset(Frequency) - {Frequency.UNCLASSIFIED}
+_CLASSIFIED_PHASES = frozenset(Phase) - {Phase.UNCLASSIFIED}
+_CLASSIFIED_MODES = frozenset(Mode) - {Mode.UNCLASSIFIED}
+
 
 def _make_fragment(
     title: str = "Test Fragment",
@@ -55,23 +67,100 @@ def _make_fragment(
     )
 
 
+def _classified(
+    fragment: Fragment,
+    *,
+    primary: Frequency = Frequency.F1,
+    confidence: Confidence | None = Confidence.SETTLED,
+) -> Fragment:
+    """Return a copy of *fragment* with a frequency and voice confidence set.
+
+    Args:
+        fragment: The fragment to copy.
+        primary: Primary frequency for the copy.
+        confidence: Voice confidence for the copy.
+
+    Returns:
+        The classified copy; *fragment* itself is unchanged.
+    """
+    return fragment.model_copy(
+        update={
+            "frequency": FrequencyClassification(primary=primary),
+            "voice": VoiceClassification(confidence=confidence),
+        },
+    )
+
+
+class _Queue(NamedTuple):
+    """A generated review queue and the inputs that produced it."""
+
+    vault: Path
+    path: Path
+    content: str
+    fragments: list[Fragment]
+
+
+@pytest.fixture(scope="module")
+def llm_classifier() -> LLMClassifier:
+    """Create one default-config LLMClassifier shared by the module."""
+    return LLMClassifier(config=LLMConfig())
+
+
+@pytest.fixture(scope="module")
+def batch_fragments() -> list[Fragment]:
+    """Build a batch of unclassified fragments once for read-only batch tests."""
+    return [_make_fragment(title=f"Batch {i}") for i in range(3)]
+
+
+@pytest.fixture(scope="module")
+def review_generator() -> ReviewQueueGenerator:
+    """Create one default-config ReviewQueueGenerator shared by the module."""
+    return ReviewQueueGenerator()
+
+
+@pytest.fixture(scope="module")
+def review_queue(
+    review_generator: ReviewQueueGenerator,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> _Queue:
+    """Generate one review queue for two fragments and read it back once.
+
+    Args:
+        review_generator: The shared default-config generator.
+        tmp_path_factory: Pytest factory for module-scoped temp directories.
+
+    Returns:
+        The vault directory, queue path, queue text and input fragments.
+    """
+    vault = tmp_path_factory.mktemp("vault")
+    fragments = [
+        _make_fragment(title="Fragment Alpha"),
+        _make_fragment(title="Fragment Beta").model_copy(
+            update={"frequency": FrequencyClassification(primary=Frequency.F7)},
+        ),
+    ]
+    path = review_generator.generate_queue(fragments, vault)
+    return _Queue(vault, path, path.read_text(), fragments)
+
+
 # ---- Module __init__ re-exports ----
 
 
 class TestClassifyModuleExports:
     """Tests that creek.classify.__init__ re-exports key classes."""
 
-    def test_rule_classifier_reexported(self) -> None:
-        """RuleClassifier should be importable from creek.classify."""
-        assert RuleClassifier is RuleClassifierDirect
-
-    def test_llm_classifier_reexported(self) -> None:
-        """LLMClassifier should be importable from creek.classify."""
-        assert LLMClassifier is LLMClassifierDirect
-
-    def test_review_queue_generator_reexported(self) -> None:
-        """ReviewQueueGenerator should be importable from creek.classify."""
-        assert ReviewQueueGenerator is ReviewQueueGeneratorDirect
+    @pytest.mark.parametrize(
+        ("exported", "defined"),
+        [
+            (RuleClassifier, RuleClassifierDirect),
+            (LLMClassifier, LLMClassifierDirect),
+            (ReviewQueueGenerator, ReviewQueueGeneratorDirect),
+        ],
+        ids=["rule_classifier", "llm_classifier", "review_queue_generator"],
+    )
+    def test_reexported(self, exported: type, defined: type) -> None:
+        """Each class should be importable from creek.classify."""
+        assert exported is defined
 
 
 # ---- Signal Dictionaries ----
@@ -83,10 +172,7 @@ class TestSignalDictionaries:
     def test_frequency_signals_has_entries(self) -> None:
         """FREQUENCY_SIGNALS should have entries for frequencies."""
         assert len(FREQUENCY_SIGNALS) >= 2
-        for key in FREQUENCY_SIGNALS:
-            assert key in Frequency.__members__.values() or key in [
-                f.value for f in Frequency if f != Frequency.UNCLASSIFIED
-            ]
+        assert FREQUENCY_SIGNALS.keys() <= _CLASSIFIED_FREQUENCIES
 
     def test_frequency_signals_values_are_keyword_lists(self) -> None:
         """Each frequency signal should be a non-empty list of strings."""
@@ -99,6 +185,7 @@ class TestSignalDictionaries:
     def test_wavelength_phase_signals_has_entries(self) -> None:
         """WAVELENGTH_PHASE_SIGNALS should have entries with keywords."""
         assert len(WAVELENGTH_PHASE_SIGNALS) >= 2
+        assert WAVELENGTH_PHASE_SIGNALS.keys() <= _CLASSIFIED_PHASES
         for _phase, keywords in WAVELENGTH_PHASE_SIGNALS.items():
             assert isinstance(keywords, list)
             assert len(keywords) >= 2
@@ -106,6 +193,7 @@ class TestSignalDictionaries:
     def test_mode_signals_has_entries(self) -> None:
         """MODE_SIGNALS should have entries with keyword lists."""
         assert len(MODE_SIGNALS) >= 2
+        assert MODE_SIGNALS.keys() <= _CLASSIFIED_MODES
         for _mode, keywords in MODE_SIGNALS.items():
             assert isinstance(keywords, list)
             assert len(keywords) >= 2
@@ -144,35 +232,23 @@ class TestRuleClassifier:
         assert result.id == frag.id
         assert result.title == "My Title"
 
-    def test_classify_matches_frequency_keywords(self) -> None:
-        """classify() should set primary frequency on keyword match."""
-        classifier = RuleClassifier()
-        first_freq = next(iter(FREQUENCY_SIGNALS))
-        keyword = FREQUENCY_SIGNALS[first_freq][0]
-        frag = _make_fragment()
-        content = f"Talking about {keyword} today"
-        result = classifier.classify(frag, content=content)
-        assert result.frequency.primary != Frequency.UNCLASSIFIED
-
-    def test_classify_matches_phase_keywords(self) -> None:
-        """classify() should set wavelength phase on keyword match."""
-        classifier = RuleClassifier()
-        first_phase = next(iter(WAVELENGTH_PHASE_SIGNALS))
-        keyword = WAVELENGTH_PHASE_SIGNALS[first_phase][0]
-        frag = _make_fragment()
-        content = f"Feeling {keyword} in my life"
-        result = classifier.classify(frag, content=content)
-        assert result.wavelength.phase != Phase.UNCLASSIFIED
-
-    def test_classify_matches_mode_keywords(self) -> None:
-        """classify() should set wavelength mode on keyword match."""
+    @pytest.mark.parametrize(
+        ("keyword", "field", "unclassified"),
+        [
+            (_FREQUENCY_KEYWORD, "frequency.primary", Frequency.UNCLASSIFIED),
+            (_PHASE_KEYWORD, "wavelength.phase", Phase.UNCLASSIFIED),
+            (_MODE_KEYWORD, "wavelength.mode", Mode.UNCLASSIFIED),
+        ],
+        ids=["frequency", "phase", "mode"],
+    )
+    def test_classify_matches_keywords(
+        self, keyword: str, field: str, unclassified: StrEnum
+    ) -> None:
+        """classify() should set the signal's field on a keyword match."""
         classifier = RuleClassifier()
-        first_mode = next(iter(MODE_SIGNALS))
-        keyword = MODE_SIGNALS[first_mode][0]
         frag = _make_fragment()
-        content = f"I need to {keyword} this idea"
-        result = classifier.classify(frag, content=content)
-        assert result.wavelength.mode != Mode.UNCLASSIFIED
+        result = classifier.classify(frag, content=f"Talking about {keyword} today")
+        assert attrgetter(field)(result) != unclassified
 
     def test_classify_no_match_leaves_unclassified(self) -> None:
         """classify() with no matches leaves fields unclassified."""
@@ -187,10 +263,8 @@ class TestRuleClassifier:
     def test_classify_case_insensitive(self) -> None:
         """classify() keyword matching should be case-insensitive."""
         classifier = RuleClassifier()
-        first_freq = next(iter(FREQUENCY_SIGNALS))
-        keyword = FREQUENCY_SIGNALS[first_freq][0]
         frag = _make_fragment()
-        result = classifier.classify(frag, content=keyword.upper())
+        result = classifier.classify(frag, content=_FREQUENCY_KEYWORD.upper())
         assert result.frequency.primary != Frequency.UNCLASSIFIED
 
     def test_classify_default_content_parameter(self) -> None:
@@ -205,11 +279,33 @@ class TestRuleClassifier:
         classifier = RuleClassifier()
         frag = _make_fragment()
         original_freq = frag.frequency.primary
-        first_freq = next(iter(FREQUENCY_SIGNALS))
-        keyword = FREQUENCY_SIGNALS[first_freq][0]
-        _ = classifier.classify(frag, content=keyword)
+        _ = classifier.classify(frag, content=_FREQUENCY_KEYWORD)
         assert frag.frequency.primary == original_freq
 
+    def test_classify_does_not_revalidate_fragment(self) -> None:
+        """classify() should copy the validated fragment, not rebuild it."""
+        classifier = RuleClassifier()
+        frag = _make_fragment()
+        with patch.object(Fragment, "__init__", side_effect=AssertionError):
+            result = classifier.classify(frag, content=_FREQUENCY_KEYWORD)
+        assert result.frequency.primary != Frequency.UNCLASSIFIED
+
+    def test_classify_lowercases_content_once(self) -> None:
+        """classify() should lowercase content once, not once per keyword."""
+
+        class _CountingStr(str):
+            calls = 0
+
+            def lower(self) -> str:
+                type(self).calls += 1
+                return super().lower()
+
+        classifier = RuleClassifier()
+        content = _CountingStr("xyzzy " * 100_000)
+        result = classifier.classify(_make_fragment(), content=content)
+        assert _CountingStr.calls == 1
+        assert result.frequency.primary == Frequency.UNCLASSIFIED
+
 
 # ---- LLMClassifier ----
 
@@ -223,59 +319,51 @@ class TestLLMClassifier:
         classifier = LLMClassifier(config=config)
         assert classifier.config is config
 
-    def test_classify_returns_fragment_unchanged(self) -> None:
+    def test_classify_returns_fragment_unchanged(
+        self, llm_classifier: LLMClassifier
+    ) -> None:
         """classify() stub should return the fragment unchanged."""
-        config = LLMConfig()
-        classifier = LLMClassifier(config=config)
         frag = _make_fragment()
-        result = classifier.classify(frag)
+        result = llm_classifier.classify(frag)
         assert result.id == frag.id
         assert result.title == frag.title
         assert result.frequency.primary == frag.frequency.primary
 
     def test_classify_logs_message(
         self,
+        llm_classifier: LLMClassifier,
         caplog: pytest.LogCaptureFixture,
     ) -> None:
         """classify() should log a message about being a stub."""
-        config = LLMConfig()
-        classifier = LLMClassifier(config=config)
         frag = _make_fragment(title="Log Test")
         with caplog.at_level(logging.INFO):
-            classifier.classify(frag)
-        assert any(
-            "stub" in record.message.lower() or "llm" in record.message.lower()
-            for record in caplog.records
-        )
+            llm_classifier.classify(frag)
+        messages = " ".join(r.message for r in caplog.records).lower()
+        assert "stub" in messages or "llm" in messages
 
-    def test_classify_batch_returns_unchanged(self) -> None:
+    def test_classify_batch_returns_unchanged(
+        self, llm_classifier: LLMClassifier, batch_fragments: list[Fragment]
+    ) -> None:
         """classify_batch() should return all fragments unchanged."""
-        config = LLMConfig()
-        classifier = LLMClassifier(config=config)
-        frags = [_make_fragment(title=f"Frag {i}") for i in range(3)]
-        results = classifier.classify_batch(frags)
-        assert len(results) == 3
-        for original, result in zip(frags, results, strict=True):
-            assert result.id == original.id
-            assert result.title == original.title
-
-    def test_classify_batch_empty_list(self) -> None:
+        results = llm_classifier.classify_batch(batch_fragments)
+        assert [(r.id, r.title) for r in results] == [
+            (f.id, f.title) for f in batch_fragments
+        ]
+
+    def test_classify_batch_empty_list(self, llm_classifier: LLMClassifier) -> None:
         """classify_batch() with empty list returns empty list."""
-        config = LLMConfig()
-        classifier = LLMClassifier(config=config)
-        results = classifier.classify_batch([])
+        results = llm_classifier.classify_batch([])
         assert results == []
 
     def test_classify_batch_logs_message(
         self,
+        llm_classifier: LLMClassifier,
+        batch_fragments: list[Fragment],
         caplog: pytest.LogCaptureFixture,
     ) -> None:
         """classify_batch() should log about stub processing."""
-        config = LLMConfig()
-        classifier = LLMClassifier(config=config)
-        frags = [_make_fragment(title=f"Batch {i}") for i in range(2)]
         with caplog.at_level(logging.INFO):
-            classifier.classify_batch(frags)
+            llm_classifier.classify_batch(batch_fragments[:2])
         assert len(caplog.records) > 0
 
     def test_classification_prompt_is_nonempty_string(self) -> None:
@@ -314,11 +402,12 @@ class TestReviewQueueGenerator:
         generator = ReviewQueueGenerator(config=config)
         assert generator.config is config
 
-    def test_needs_review_unclassified_fragment(self) -> None:
+    def test_needs_review_unclassified_fragment(
+        self, review_generator: ReviewQueueGenerator
+    ) -> None:
         """needs_review() returns True for unclassified fragments."""
-        generator = ReviewQueueGenerator()
         frag = _make_fragment()
-        assert generator.needs_review(frag) is True
+        assert review_generator.needs_review(frag) is True
 
     def test_needs_review_classified_auto_source(self) -> None:
         """needs_review() returns False for classified auto source."""
@@ -327,14 +416,7 @@ class TestReviewQueueGenerator:
         )
         generator = ReviewQueueGenerator(config=config)
         frag = _make_fragment(platform=SourcePlatform.CLAUDE)
-        frag = frag.model_copy(
-            update={
-                "frequency": FrequencyClassification(
-                    primary=Frequency.F3,
-                ),
-                "voice": VoiceClassification(confidence="settled"),
-            },
-        )
+        frag = _classified(frag, primary=Frequency.F3)
         assert generator.needs_review(frag) is False
 
     def test_needs_review_human_review_source(self) -> None:
@@ -344,133 +426,71 @@ class TestReviewQueueGenerator:
         )
         generator = ReviewQueueGenerator(config=config)
         frag = _make_fragment(platform=SourcePlatform.JOURNAL)
-        frag = frag.model_copy(
-            update={
-                "frequency": FrequencyClassification(
-                    primary=Frequency.F5,
-                ),
-                "voice": VoiceClassification(confidence="settled"),
-            },
-        )
+        frag = _classified(frag, primary=Frequency.F5)
         assert generator.needs_review(frag) is True
 
-    def test_needs_review_low_confidence(self) -> None:
+    def test_human_review_sources_is_frozenset(self) -> None:
+        """Configured review sources should be held as a frozenset."""
+        config = ClassificationConfig(
+            human_review_sources=["journal", "discord", "journal"],
+        )
+        generator = ReviewQueueGenerator(config=config)
+        assert generator.human_review_sources == frozenset({"journal", "discord"})
+
+    def test_needs_review_low_confidence(
+        self, review_generator: ReviewQueueGenerator
+    ) -> None:
         """needs_review() returns True when confidence is low."""
-        generator = ReviewQueueGenerator()
         frag = _make_fragment()
-        frag = frag.model_copy(
-            update={
-                "frequency": FrequencyClassification(
-                    primary=Frequency.F1,
-                ),
-                "voice": VoiceClassification(confidence="musing"),
-            },
-        )
-        assert generator.needs_review(frag) is True
+        frag = _classified(frag, confidence=Confidence.MUSING)
+        assert review_generator.needs_review(frag) is True
 
-    def test_needs_review_no_confidence(self) -> None:
+    def test_needs_review_no_confidence(
+        self, review_generator: ReviewQueueGenerator
+    ) -> None:
         """needs_review() returns True when confidence is None."""
-        generator = ReviewQueueGenerator()
         frag = _make_fragment()
-        frag = frag.model_copy(
-            update={
-                "frequency": FrequencyClassification(
-                    primary=Frequency.F1,
-                ),
-                "voice": VoiceClassification(confidence=None),
-            },
-        )
-        assert generator.needs_review(frag) is True
+        frag = _classified(frag, confidence=None)
+        assert review_generator.needs_review(frag) is True
 
-    def test_generate_queue_creates_file(
-        self,
-        tmp_path: Path,
-    ) -> None:
+    def test_generate_queue_creates_file(self, review_queue: _Queue) -> None:
         """generate_queue() should create a markdown file."""
-        generator = ReviewQueueGenerator()
-        frags = [_make_fragment(title="Needs Review")]
-        result = generator.generate_queue(frags, tmp_path)
-        assert result.exists()
-        assert result.suffix == ".md"
+        assert review_queue.path.exists()
+        assert review_queue.path.suffix == ".md"
 
-    def test_generate_queue_contains_checkboxes(
-        self,
-        tmp_path: Path,
-    ) -> None:
+    def test_generate_queue_contains_checkboxes(self, review_queue: _Queue) -> None:
         """generate_queue() output should contain checkboxes."""
-        generator = ReviewQueueGenerator()
-        frags = [
-            _make_fragment(title="Fragment Alpha"),
-            _make_fragment(title="Fragment Beta"),
-        ]
-        result = generator.generate_queue(frags, tmp_path)
-        content = result.read_text()
-        assert "- [ ]" in content
-        assert "Fragment Alpha" in content
-        assert "Fragment Beta" in content
+        assert "- [ ]" in review_queue.content
+        assert "Fragment Alpha" in review_queue.content
+        assert "Fragment Beta" in review_queue.content
 
     def test_generate_queue_empty_list(
         self,
+        review_generator: ReviewQueueGenerator,
         tmp_path: Path,
     ) -> None:
         """generate_queue() with no fragments creates file anyway."""
-        generator = ReviewQueueGenerator()
-        result = generator.generate_queue([], tmp_path)
+        result = review_generator.generate_queue([], tmp_path)
         assert result.exists()
         content = result.read_text()
         assert "- [ ]" not in content
 
-    def test_generate_queue_returns_path_in_vault(
-        self,
-        tmp_path: Path,
-    ) -> None:
+    def test_generate_queue_returns_path_in_vault(self, review_queue: _Queue) -> None:
         """generate_queue() path should be inside vault directory."""
-        generator = ReviewQueueGenerator()
-        frags = [_make_fragment()]
-        result = generator.generate_queue(frags, tmp_path)
-        assert str(result).startswith(str(tmp_path))
+        assert review_queue.path.parent == review_queue.vault
 
-    def test_generate_queue_includes_fragment_ids(
-        self,
-        tmp_path: Path,
-    ) -> None:
+    def test_generate_queue_includes_fragment_ids(self, review_queue: _Queue) -> None:
         """generate_queue() should include fragment IDs."""
-        generator = ReviewQueueGenerator()
-        frag = _make_fragment(title="Traceable")
-        frags = [frag]
-        result = generator.generate_queue(frags, tmp_path)
-        content = result.read_text()
-        assert frag.id in content
+        for frag in review_queue.fragments:
+            assert frag.id in review_queue.content
 
-    def test_generate_queue_includes_frequency_info(
-        self,
-        tmp_path: Path,
-    ) -> None:
+    def test_generate_queue_includes_frequency_info(self, review_queue: _Queue) -> None:
         """generate_queue() should include frequency info."""
-        generator = ReviewQueueGenerator()
-        frag = _make_fragment(title="Classified Fragment")
-        frag = frag.model_copy(
-            update={
-                "frequency": FrequencyClassification(
-                    primary=Frequency.F7,
-                ),
-            },
-        )
-        frags = [frag]
-        result = generator.generate_queue(frags, tmp_path)
-        content = result.read_text()
-        assert "F7" in content
+        assert "F7" in review_queue.content
 
-    def test_generate_queue_file_has_header(
-        self,
-        tmp_path: Path,
-    ) -> None:
+    def test_generate_queue_file_has_header(self, review_queue: _Queue) -> None:
         """generate_queue() file should have a markdown header."""
-        generator = ReviewQueueGenerator()
-        frags = [_make_fragment()]
-        result = generator.generate_queue(frags, tmp_path)
-        content = result.read_text()
-        assert content.startswith("#")
+        assert review_queue.content.startswith("#")
 
     def test_generate_queue_filters_needing_review(
         self,
@@ -491,14 +511,7 @@ class TestReviewQueueGenerator:
             title="Already Classified",
             platform=SourcePlatform.CLAUDE,
         )
-        frag_ok = frag_ok.model_copy(
-            update={
-                "frequency": FrequencyClassification(
-                    primary=Frequency.F3,
-                ),
-                "voice": VoiceClassification(confidence="settled"),
-            },
-        )
+        frag_ok = _classified(frag_ok, primary=Frequency.F3)
 
         frags = [frag_needs, frag_ok]
         result = generator.generate_queue(frags, tmp_path)
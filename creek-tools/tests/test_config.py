@@ -4,12 +4,14 @@ from pathlib import Path
 
 import pytest
 import yaml
+from pydantic import ValidationError
 
 from creek.config import (
     ClassificationConfig,
     CreekConfig,
     EmbeddingsConfig,
     GoogleDriveConfig,
+    IngestConfig,
     LinkingConfig,
     LLMConfig,
     OCRConfig,
@@ -19,6 +21,13 @@ from creek.config import (
     load_config,
 )
 
+
+@pytest.fixture(scope="module")
+def default_config() -> CreekConfig:
+    """Build the all-defaults CreekConfig once for read-only assertions."""
+    return CreekConfig()
+
+
 # ---------------------------------------------------------------------------
 # Individual nested model defaults
 # ---------------------------------------------------------------------------
@@ -110,6 +119,19 @@ class TestRedactionConfig:
         assert cfg.false_positive_allowlist == []
 
 
+class TestIngestConfig:
+    """Tests for IngestConfig model."""
+
+    def test_defaults(self) -> None:
+        """IngestConfig should parse serially by default."""
+        assert IngestConfig().workers == 1
+
+    def test_workers_must_be_positive(self) -> None:
+        """workers below 1 should be rejected."""
+        with pytest.raises(ValidationError):
+            IngestConfig(workers=0)
+
+
 class TestGoogleDriveConfig:
     """Tests for GoogleDriveConfig model."""
 
@@ -168,9 +190,9 @@ class TestSourcePaths:
 class TestCreekConfig:
     """Tests for CreekConfig top-level settings model."""
 
-    def test_all_defaults_valid(self) -> None:
+    def test_all_defaults_valid(self, default_config: CreekConfig) -> None:
         """CreekConfig() with all defaults should produce a valid config."""
-        cfg = CreekConfig()
+        cfg = default_config
         assert cfg.vault_path == Path(".")
         assert cfg.source_drive == Path(".")
         assert cfg.timezone == "America/Los_Angeles"
@@ -181,6 +203,7 @@ class TestCreekConfig:
         assert isinstance(cfg.linking, LinkingConfig)
         assert isinstance(cfg.classification, ClassificationConfig)
         assert isinstance(cfg.redaction, RedactionConfig)
+        assert isinstance(cfg.ingest, IngestConfig)
         assert isinstance(cfg.google_drive, GoogleDriveConfig)
         assert isinstance(cfg.sources, SourcePaths)
 
@@ -223,11 +246,12 @@ class TestCreekConfig:
 class TestLoadConfig:
     """Tests for load_config function."""
 
-    def test_no_file_returns_defaults(self, tmp_path: Path) -> None:
+    def test_no_file_returns_defaults(
+        self, tmp_path: Path, default_config: CreekConfig
+    ) -> None:
         """load_config() should return defaults when YAML file does not exist."""
         cfg = load_config(tmp_path / "nonexistent.yaml")
-        assert cfg.vault_path == Path(".")
-        assert cfg.timezone == "America/Los_Angeles"
+        assert cfg == default_config
 
     def test_loads_yaml_file(self, tmp_path: Path) -> None:
         """load_config() should load values from a YAML file."""
@@ -249,13 +273,15 @@ class TestLoadConfig:
         # Unspecified fields keep defaults
         assert cfg.llm.batch_size == 50
 
-    def test_loads_empty_yaml(self, tmp_path: Path) -> None:
+    def test_loads_empty_yaml(
+        self, tmp_path: Path, default_config: CreekConfig
+    ) -> None:
         """load_config() should handle an empty YAML file gracefully."""
         config_file = tmp_path / "creek_config.yaml"
         config_file.write_text("")
 
         cfg = load_config(config_file)
-        assert cfg.vault_path == Path(".")
+        assert cfg == default_config
 
     def test_partial_nested_config(self, tmp_path: Path) -> None:
         """load_config() should merge partial nested config with defaults."""
@@ -293,12 +319,13 @@ class TestGenerateDefaultConfig:
         assert "vault_path" in data
         assert "timezone" in data
 
-    def test_roundtrip(self, tmp_path: Path) -> None:
+    def test_roundtrip(self, tmp_path: Path, default_config: CreekConfig) -> None:
         """Generated config should round-trip back through load_config."""
         output = tmp_path / "creek_config.yaml"
         generate_default_config(output)
 
         cfg = load_config(output)
+        assert cfg == default_config
         assert cfg.vault_path == Path(".")
         assert cfg.timezone == "America/Los_Angeles"
         assert cfg.llm.provider == "ollama"
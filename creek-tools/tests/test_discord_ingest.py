@@ -9,11 +9,13 @@ custom emoji), and full pipeline integration.
 from __future__ import annotations
 
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 from zoneinfo import ZoneInfo
 
+import pytest
+
 from creek.ingest.base import ParsedFragment, RawDocument
 from creek.ingest.discord import (
     DiscordIngestor,
@@ -22,7 +24,7 @@ from creek.ingest.discord import (
     _format_reply_context,
     _get_reference_id,
     _group_messages,
-    _is_time_proximate,
+    _is_within_window,
     _parse_msg_timestamp,
     _safe_author_name,
     _safe_timestamp,
@@ -30,10 +32,35 @@ from creek.ingest.discord import (
 
 LA_TZ = ZoneInfo("America/Los_Angeles")
 
+_FIXED_TS = datetime(2024, 11, 10, 14, 0, 0, tzinfo=LA_TZ)
+
 
 # ---- Fixture helpers ----
 
 
+@pytest.fixture(scope="module")
+def discord_ingestor() -> DiscordIngestor:
+    """Create one stateless DiscordIngestor shared by the module's tests."""
+    return DiscordIngestor()
+
+
+@pytest.fixture(scope="module")
+def frontmatter(discord_ingestor: DiscordIngestor) -> dict[str, Any]:
+    """Generate frontmatter once for a fragment with typical Discord metadata."""
+    fragment = ParsedFragment(
+        content="test content",
+        metadata={
+            "channel_name": "knowledge-sharing",
+            "channel_id": "ch-123",
+            "authors": ["Alice", "Bob"],
+            "message_count": 3,
+        },
+        source_path="/fake/messages.json",
+        timestamp=_FIXED_TS,
+    )
+    return discord_ingestor.generate_frontmatter(fragment)
+
+
 def _make_msg(
     msg_id: str = "msg-001",
     author: str = "Alice",
@@ -266,38 +293,33 @@ class TestFormatReplyContext:
         assert result == "> **Bob**: "
 
 
-class TestIsTimeProximate:
-    """Tests for the _is_time_proximate helper."""
-
-    def test_same_author_within_threshold(self) -> None:
-        """Should return True for same author within 5 minutes."""
-        msg1 = _make_msg(author="Alice", timestamp="2024-11-10T14:00:00Z")
-        msg2 = _make_msg(author="Alice", timestamp="2024-11-10T14:03:00Z")
-        assert _is_time_proximate(msg2, msg1) is True
-
-    def test_same_author_at_boundary(self) -> None:
-        """Should return True for same author exactly at 5-minute boundary."""
-        msg1 = _make_msg(author="Alice", timestamp="2024-11-10T14:00:00Z")
-        msg2 = _make_msg(author="Alice", timestamp="2024-11-10T14:05:00Z")
-        assert _is_time_proximate(msg2, msg1) is True
-
-    def test_same_author_over_threshold(self) -> None:
-        """Should return False for same author beyond 5 minutes."""
-        msg1 = _make_msg(author="Alice", timestamp="2024-11-10T14:00:00Z")
-        msg2 = _make_msg(author="Alice", timestamp="2024-11-10T14:06:00Z")
-        assert _is_time_proximate(msg2, msg1) is False
-
-    def test_different_author_within_threshold(self) -> None:
-        """Should return False for different authors even within threshold."""
-        msg1 = _make_msg(author="Alice", timestamp="2024-11-10T14:00:00Z")
-        msg2 = _make_msg(author="Bob", timestamp="2024-11-10T14:01:00Z")
-        assert _is_time_proximate(msg2, msg1) is False
-
-    def test_missing_timestamps(self) -> None:
-        """Should return False when timestamps cannot be parsed."""
-        msg1: dict[str, Any] = {"author": {"name": "Alice"}}
-        msg2: dict[str, Any] = {"author": {"name": "Alice"}}
-        assert _is_time_proximate(msg2, msg1) is False
+class TestIsWithinWindow:
+    """Tests for the _is_within_window helper."""
+
+    @pytest.mark.parametrize(
+        ("gap", "expected"),
+        [
+            (timedelta(minutes=3), True),
+            (timedelta(minutes=5), True),
+            (timedelta(minutes=6), False),
+            (timedelta(minutes=-3), True),
+        ],
+        ids=["within", "at-boundary", "over", "earlier"],
+    )
+    def test_gap(self, gap: timedelta, expected: bool) -> None:
+        """Should return True only for gaps up to 5 minutes either way."""
+        assert _is_within_window(_FIXED_TS + gap, _FIXED_TS) is expected
+
+    @pytest.mark.parametrize(
+        ("msg_ts", "last_ts"),
+        [(None, _FIXED_TS), (_FIXED_TS, None), (None, None)],
+        ids=["msg", "last", "both"],
+    )
+    def test_missing_timestamps(
+        self, msg_ts: datetime | None, last_ts: datetime | None
+    ) -> None:
+        """Should return False when either timestamp failed to parse."""
+        assert _is_within_window(msg_ts, last_ts) is False
 
 
 # ---- Grouping tests ----
@@ -788,33 +810,32 @@ class TestDiscordIngestorConvertToMarkdown:
             content=content,
             metadata={"channel_name": channel_name},
             source_path="/fake/messages.json",
-            timestamp=datetime(2024, 11, 10, 14, 0, 0, tzinfo=LA_TZ),
+            timestamp=_FIXED_TS,
         )
 
-    def test_includes_channel_header(self) -> None:
+    def test_includes_channel_header(self, discord_ingestor: DiscordIngestor) -> None:
         """Should include channel name as H1 header."""
-        ingestor = DiscordIngestor()
-        md = ingestor.convert_to_markdown(self._fragment(channel_name="general"))
+        md = discord_ingestor.convert_to_markdown(
+            self._fragment(channel_name="general")
+        )
         assert md.startswith("# #general\n\n")
 
-    def test_includes_content(self) -> None:
+    def test_includes_content(self, discord_ingestor: DiscordIngestor) -> None:
         """Should include the fragment content after the header."""
-        ingestor = DiscordIngestor()
-        md = ingestor.convert_to_markdown(
+        md = discord_ingestor.convert_to_markdown(
             self._fragment(content="Hello world", channel_name="test")
         )
         assert "Hello world" in md
 
-    def test_missing_channel_name(self) -> None:
+    def test_missing_channel_name(self, discord_ingestor: DiscordIngestor) -> None:
         """Should use 'unknown' when channel_name is missing from metadata."""
         frag = ParsedFragment(
             content="content",
             metadata={},
             source_path="/fake/messages.json",
-            timestamp=datetime(2024, 11, 10, 14, 0, 0, tzinfo=LA_TZ),
+            timestamp=_FIXED_TS,
         )
-        ingestor = DiscordIngestor()
-        md = ingestor.convert_to_markdown(frag)
+        md = discord_ingestor.convert_to_markdown(frag)
         assert "# #unknown" in md
 
 
@@ -824,72 +845,43 @@ class TestDiscordIngestorConvertToMarkdown:
 class TestDiscordIngestorGenerateFrontmatter:
     """Tests for DiscordIngestor.generate_frontmatter()."""
 
-    def _fragment(self) -> ParsedFragment:
-        """Create a ParsedFragment with typical Discord metadata.
-
-        Returns:
-            A ParsedFragment for testing frontmatter generation.
-        """
-        return ParsedFragment(
-            content="test content",
-            metadata={
-                "channel_name": "knowledge-sharing",
-                "channel_id": "ch-123",
-                "authors": ["Alice", "Bob"],
-                "message_count": 3,
-            },
-            source_path="/fake/messages.json",
-            timestamp=datetime(2024, 11, 10, 14, 0, 0, tzinfo=LA_TZ),
-        )
-
-    def test_source_platform(self) -> None:
-        """Should set source.platform to 'discord'."""
-        ingestor = DiscordIngestor()
-        fm = ingestor.generate_frontmatter(self._fragment())
-        assert fm["source"]["platform"] == "discord"
-
-    def test_source_channel(self) -> None:
-        """Should set source.channel from metadata."""
-        ingestor = DiscordIngestor()
-        fm = ingestor.generate_frontmatter(self._fragment())
-        assert fm["source"]["channel"] == "knowledge-sharing"
-
-    def test_source_channel_id(self) -> None:
-        """Should set source.channel_id from metadata."""
-        ingestor = DiscordIngestor()
-        fm = ingestor.generate_frontmatter(self._fragment())
-        assert fm["source"]["channel_id"] == "ch-123"
-
-    def test_created_timestamp(self) -> None:
+    @pytest.mark.parametrize(
+        ("keys", "expected"),
+        [
+            (("source", "platform"), "discord"),
+            (("source", "channel"), "knowledge-sharing"),
+            (("source", "channel_id"), "ch-123"),
+            (("authors",), ["Alice", "Bob"]),
+            (("message_count",), 3),
+        ],
+        ids=["platform", "channel", "channel_id", "authors", "message_count"],
+    )
+    def test_field_from_metadata(
+        self, frontmatter: dict[str, Any], keys: tuple[str, ...], expected: Any
+    ) -> None:
+        """Should copy each source field and count from the fragment metadata."""
+        value: Any = frontmatter
+        for key in keys:
+            value = value[key]
+        assert value == expected
+
+    def test_created_timestamp(self, frontmatter: dict[str, Any]) -> None:
         """Should include an ISO 8601 created timestamp."""
-        ingestor = DiscordIngestor()
-        fm = ingestor.generate_frontmatter(self._fragment())
-        assert "created" in fm
+        assert "created" in frontmatter
         # Should be parseable as ISO 8601
-        datetime.fromisoformat(fm["created"])
+        datetime.fromisoformat(frontmatter["created"])
 
-    def test_authors_list(self) -> None:
-        """Should include sorted authors list."""
-        ingestor = DiscordIngestor()
-        fm = ingestor.generate_frontmatter(self._fragment())
-        assert fm["authors"] == ["Alice", "Bob"]
-
-    def test_message_count(self) -> None:
-        """Should include message count."""
-        ingestor = DiscordIngestor()
-        fm = ingestor.generate_frontmatter(self._fragment())
-        assert fm["message_count"] == 3
-
-    def test_missing_metadata_uses_defaults(self) -> None:
+    def test_missing_metadata_uses_defaults(
+        self, discord_ingestor: DiscordIngestor
+    ) -> None:
         """Should use default values when metadata keys are missing."""
         frag = ParsedFragment(
             content="test",
             metadata={},
             source_path="/fake/messages.json",
-            timestamp=datetime(2024, 11, 10, 14, 0, 0, tzinfo=LA_TZ),
+            timestamp=_FIXED_TS,
         )
-        ingestor = DiscordIngestor()
-        fm = ingestor.generate_frontmatter(frag)
+        fm = discord_ingestor.generate_frontmatter(frag)
         assert fm["source"]["channel"] == "unknown"
         assert fm["source"]["channel_id"] == "unknown"
         assert fm["authors"] == []
@@ -31,6 +31,8 @@ from creek.ingest.base import (
 
 LA_TZ = ZoneInfo("America/Los_Angeles")
 
+_FIXED_TS = datetime(2024, 1, 15, tzinfo=LA_TZ)
+
 
 class _ConcreteIngestor(Ingestor):
     """A minimal concrete implementation of Ingestor for testing.
@@ -101,6 +103,58 @@ class _ConcreteIngestor(Ingestor):
         }
 
 
+class _ListIngestor(_ConcreteIngestor):
+    """A concrete Ingestor that discovers a fixed list of documents.
+
+    Defined at module level, with no mocks attached, so it can be pickled
+    into worker processes. ``parse()`` rejects documents named ``bad.txt``.
+    """
+
+    def __init__(self, names: list[str]) -> None:
+        """Build one small RawDocument per file name.
+
+        Args:
+            names: File names for the documents, under ``/fake``.
+        """
+        self.docs = [
+            RawDocument(
+                path=Path("/fake") / name,
+                content=f"doc {name}".encode(),
+                metadata={},
+                detected_encoding="utf-8",
+            )
+            for name in names
+        ]
+
+    def discover(self, source_path: Path) -> list[RawDocument]:
+        """Return the fixed document list.
+
+        Args:
+            source_path: Ignored.
+
+        Returns:
+            The documents built at construction.
+        """
+        return self.docs
+
+    def parse(self, raw: RawDocument) -> list[ParsedFragment]:
+        """Parse a RawDocument, failing for ``bad.txt``.
+
+        Args:
+            raw: The raw document to parse.
+
+        Returns:
+            A list with a single ParsedFragment.
+
+        Raises:
+            ValueError: If the document is named ``bad.txt``.
+        """
+        if raw.path.name == "bad.txt":
+            msg = "Bad content"
+            raise ValueError(msg)
+        return super().parse(raw)
+
+
 class _PartialIngestor(Ingestor):
     """An incomplete Ingestor that only implements some abstract methods.
 
@@ -185,6 +239,16 @@ class TestRawDocument:
         assert isinstance(dump, dict)
         assert dump["detected_encoding"] == "utf-8"
 
+    def test_decoded_text_defaults_to_none(self) -> None:
+        """RawDocument decoded_text should be optional and default to None."""
+        doc = RawDocument(
+            path=Path("/fake/test.txt"),
+            content=b"test",
+            metadata={},
+            detected_encoding="utf-8",
+        )
+        assert doc.decoded_text is None
+
 
 # ---- ParsedFragment Model Tests ----
 
@@ -257,7 +321,7 @@ class TestProvenanceEntry:
         entry = ProvenanceEntry(
             source_path="/fake/test.txt",
             ingestor_name="TestIngestor",
-            timestamp=datetime(2024, 1, 15, tzinfo=LA_TZ),
+            timestamp=_FIXED_TS,
             fragment_id="frag-abc123def456",
             status="success",
         )
@@ -520,7 +584,7 @@ class TestCreateProvenanceEntry:
         entry = create_provenance_entry(
             source_path="/fake/test.txt",
             ingestor_name="TestIngestor",
-            timestamp=datetime(2024, 1, 15, tzinfo=LA_TZ),
+            timestamp=_FIXED_TS,
             fragment_id="frag-abc123def456",
             status="error",
         )
@@ -531,7 +595,7 @@ class TestCreateProvenanceEntry:
         entry = create_provenance_entry(
             source_path="/fake/test.txt",
             ingestor_name="TestIngestor",
-            timestamp=datetime(2024, 1, 15, tzinfo=LA_TZ),
+            timestamp=_FIXED_TS,
             fragment_id="frag-abc123def456",
             status="skipped",
         )
@@ -612,6 +676,25 @@ class TestIngestOrchestration:
             ingestor.ingest(source)
             mock_discover.assert_called_once_with(source)
 
+    def test_ingest_with_files_uses_iter_discover_files(self) -> None:
+        """ingest(files=...) should route discovery through iter_discover_files()."""
+        ingestor = _ConcreteIngestor()
+        source = Path("/fake/source")
+        files = [source / "a.txt"]
+        with patch.object(
+            ingestor, "iter_discover_files", wraps=ingestor.iter_discover_files
+        ) as mock_files:
+            result = ingestor.ingest(source, files=files)
+            mock_files.assert_called_once_with(source, files)
+        assert len(result.fragments) == 1
+
+    def test_iter_discover_files_default_ignores_list(self) -> None:
+        """The default iter_discover_files() should fall back to discover()."""
+        ingestor = _ConcreteIngestor()
+        source = Path("/fake/source")
+        docs = list(ingestor.iter_discover_files(source, []))
+        assert [d.path for d in docs] == [d.path for d in ingestor.discover(source)]
+
     def test_ingest_calls_parse_for_each_document(self) -> None:
         """ingest() should call parse() for each discovered RawDocument."""
         ingestor = _ConcreteIngestor()
@@ -716,19 +799,63 @@ class TestIngestOrchestration:
                 content="frag 1",
                 metadata={},
                 source_path="/fake/test.txt",
-                timestamp=datetime(2024, 1, 15, tzinfo=LA_TZ),
+                timestamp=_FIXED_TS,
             ),
             ParsedFragment(
                 content="frag 2",
                 metadata={},
                 source_path="/fake/test.txt",
-                timestamp=datetime(2024, 1, 15, tzinfo=LA_TZ),
+                timestamp=_FIXED_TS,
             ),
         ]
         with patch.object(ingestor, "parse", return_value=multi_frags):
             result = ingestor.ingest(Path("/fake/source"))
             assert len(result.fragments) == 2
 
+    def test_iter_discover_defaults_to_discover(self) -> None:
+        """iter_discover() should yield the documents returned by discover()."""
+        ingestor = _ConcreteIngestor()
+        source = Path("/fake/source")
+        assert list(ingestor.iter_discover(source)) == ingestor.discover(source)
+
+    def test_ingest_keeps_documents_yielded_before_discover_error(self) -> None:
+        """Documents yielded before a lazy discover error should be processed."""
+        ingestor = _ConcreteIngestor()
+        doc = RawDocument(
+            path=Path("/fake/a.txt"),
+            content=b"doc a",
+            metadata={},
+            detected_encoding="utf-8",
+        )
+
+        def _failing_iter(source_path: Path) -> Any:
+            yield doc
+            raise OSError("Disk gone")
+
+        with patch.object(ingestor, "iter_discover", side_effect=_failing_iter):
+            result = ingestor.ingest(Path("/fake/source"))
+        assert len(result.fragments) == 1
+        assert result.errors == ["discover error: Disk gone"]
+
+    def test_parallel_ingest_matches_serial(self) -> None:
+        """A process pool should produce the same fragments, in discovery order."""
+        ingestor = _ListIngestor([f"{i}.txt" for i in range(7)])
+        serial = ingestor.ingest(Path("/fake/source"))
+        parallel = ingestor.ingest(Path("/fake/source"), workers=2)
+        assert [f.content for f in parallel.fragments] == [
+            f.content for f in serial.fragments
+        ]
+        assert parallel.errors == []
+
+    def test_parallel_ingest_records_parse_error(self) -> None:
+        """A parse error in a worker should be recorded, not abort the run."""
+        ingestor = _ListIngestor(["a.txt", "bad.txt", "b.txt"])
+        result = ingestor.ingest(Path("/fake/source"), workers=2)
+        assert [f.content for f in result.fragments] == ["doc a.txt", "doc b.txt"]
+        assert result.errors == [
+            f"parse error for {Path('/fake/bad.txt')}: Bad content"
+        ]
+
 
 # ---- Ingest Package __init__ Tests ----
 
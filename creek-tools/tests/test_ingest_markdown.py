@@ -8,24 +8,37 @@ INGESTOR_REGISTRY registration.
 
 from __future__ import annotations
 
+import os
+import subprocess
+import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
 from zoneinfo import ZoneInfo
 
 import pytest
 
 from creek.ingest.base import IngestResult, ParsedFragment, RawDocument
 from creek.ingest.markdown import (
+    _ESSAY_PATTERNS,
+    _JOURNAL_PATTERNS,
+    _TECHNICAL_PATTERNS,
     MarkdownIngestor,
     _detect_document_type,
     _infer_platform,
+    _may_have_frontmatter,
     _merge_frontmatter,
 )
 from creek.models import SourcePlatform
 
+if TYPE_CHECKING:
+    import re
+
 LA_TZ = ZoneInfo("America/Los_Angeles")
 
+_FIXED_TS = datetime(2024, 1, 15, tzinfo=LA_TZ)
+
 
 # ---- Fixtures ----
 
@@ -211,6 +224,39 @@ class TestMarkdownIngestorDiscover:
         assert len(docs) == 1
         assert docs[0].path == single_file
 
+    def test_iter_discover_reads_lazily(
+        self, md_ingestor: MarkdownIngestor, tmp_md_dir: Path
+    ) -> None:
+        """iter_discover() should read each file only when it is requested."""
+        with patch.object(
+            Path, "read_bytes", autospec=True, side_effect=Path.read_bytes
+        ) as mock_read:
+            docs = md_ingestor.iter_discover(tmp_md_dir)
+            assert mock_read.call_count == 0
+            first = next(docs)
+            assert mock_read.call_count == 1
+            assert isinstance(first, RawDocument)
+
+    def test_iter_discover_matches_discover(
+        self, md_ingestor: MarkdownIngestor, tmp_md_dir: Path
+    ) -> None:
+        """iter_discover() should yield the same paths as discover()."""
+        lazy_paths = [d.path for d in md_ingestor.iter_discover(tmp_md_dir)]
+        assert lazy_paths == [d.path for d in md_ingestor.discover(tmp_md_dir)]
+
+    def test_iter_discover_files_filters_without_walking(
+        self, md_ingestor: MarkdownIngestor, tmp_md_dir: Path
+    ) -> None:
+        """iter_discover_files() should use the given list, not rglob."""
+        (tmp_md_dir / "notes.txt").write_text("not markdown")
+        files = [p for p in tmp_md_dir.rglob("*") if p.is_file()]
+        expected = [d.path for d in md_ingestor.discover(tmp_md_dir)]
+
+        with patch.object(Path, "rglob", side_effect=AssertionError):
+            docs = list(md_ingestor.iter_discover_files(tmp_md_dir, files[::-1]))
+
+        assert [d.path for d in docs] == expected
+
 
 # ---- Parse Tests ----
 
@@ -288,6 +334,21 @@ class TestMarkdownIngestorParse:
         fragments = md_ingestor.parse(doc)
         assert isinstance(fragments[0].timestamp, datetime)
 
+    def test_parse_timestamp_falls_back_to_file_time(
+        self, md_ingestor: MarkdownIngestor, tmp_md_dir: Path
+    ) -> None:
+        """Without frontmatter dates, the file's epoch time is used, in LA time."""
+        path = tmp_md_dir / "without_frontmatter.md"
+        os.utime(path, (1_700_000_000, 1_700_000_000))
+        doc = next(
+            d for d in md_ingestor.discover(tmp_md_dir) if d.path.name == path.name
+        )
+        stat = path.stat()
+        expected = getattr(stat, "st_birthtime", stat.st_mtime)
+        timestamp = md_ingestor.parse(doc)[0].timestamp
+        assert timestamp == datetime.fromtimestamp(expected, LA_TZ)
+        assert timestamp.tzinfo == LA_TZ
+
     def test_parse_empty_file(
         self, md_ingestor: MarkdownIngestor, tmp_md_dir: Path
     ) -> None:
@@ -315,6 +376,47 @@ class TestMarkdownIngestorParse:
         fragments = md_ingestor.parse(docs[0])
         assert all(isinstance(f, ParsedFragment) for f in fragments)
 
+    def test_discover_populates_decoded_text(
+        self, md_ingestor: MarkdownIngestor, tmp_md_dir: Path
+    ) -> None:
+        """Discovered documents should carry their decoded text."""
+        docs = md_ingestor.discover(tmp_md_dir)
+        for doc in docs:
+            assert doc.decoded_text == doc.content.decode("utf-8")
+
+    def test_parse_reuses_decoded_text(
+        self, md_ingestor: MarkdownIngestor, tmp_path: Path
+    ) -> None:
+        """Parse should use decoded_text instead of decoding content again."""
+        md_file = tmp_path / "notes.md"
+        md_file.write_text("# Ignored\n", encoding="utf-8")
+        raw = RawDocument(
+            path=md_file,
+            content=md_file.read_bytes(),
+            metadata={},
+            detected_encoding="utf-8",
+            decoded_text="# From Discovery\n\nBody.\n",
+        )
+        with patch("creek.ingest.markdown.normalize_encoding") as mock_decode:
+            fragments = md_ingestor.parse(raw)
+        mock_decode.assert_not_called()
+        assert "From Discovery" in fragments[0].content
+
+    def test_parse_decodes_content_without_decoded_text(
+        self, md_ingestor: MarkdownIngestor, tmp_path: Path
+    ) -> None:
+        """Parse should fall back to decoding content when no text is cached."""
+        md_file = tmp_path / "plain.md"
+        md_file.write_text("# Plain\n\nBody.\n", encoding="utf-8")
+        raw = RawDocument(
+            path=md_file,
+            content=md_file.read_bytes(),
+            metadata={},
+            detected_encoding="utf-8",
+        )
+        fragments = md_ingestor.parse(raw)
+        assert "# Plain" in fragments[0].content
+
 
 # ---- Document Type Detection Tests ----
 
@@ -362,6 +464,34 @@ class TestDocumentTypeDetection:
         """Should return 'notes' for empty content."""
         assert _detect_document_type("") == "notes"
 
+    def test_uppercase_keywords_still_detected(self) -> None:
+        """The literal prefilter should not defeat case-insensitive matching."""
+        content = "THESIS statement.\nIN THIS ESSAY we argue.\n"
+        assert _detect_document_type(content) == "essay"
+
+    def test_dotless_i_keywords_still_detected(self) -> None:
+        """Non-ASCII case variants matched by re.IGNORECASE should count."""
+        content = "Dear D\u0131ary, todaY \u0131 went out and reflected\n"
+        assert _detect_document_type(content) == "journal"
+
+    def test_literal_without_word_boundary_not_counted(self) -> None:
+        """A prefilter hit should still require the regex to match."""
+        content = "Rapid prototyping, dysfunctional configurations, hypothesis.\n"
+        assert _detect_document_type(content) == "notes"
+
+    @pytest.mark.parametrize(
+        "patterns",
+        [_JOURNAL_PATTERNS, _ESSAY_PATTERNS, _TECHNICAL_PATTERNS],
+        ids=["journal", "essay", "technical"],
+    )
+    def test_required_literals_appear_in_patterns(
+        self, patterns: list[tuple[str, re.Pattern[str]]]
+    ) -> None:
+        """Each prefilter literal should be lowercase text from its pattern."""
+        for literal, pattern in patterns:
+            assert literal == literal.casefold()
+            assert literal in pattern.pattern.casefold()
+
 
 # ---- Platform Inference Tests ----
 
@@ -411,6 +541,12 @@ class TestPlatformInference:
             SourcePlatform.ESSAY
         )
 
+    def test_accepts_string_path(self) -> None:
+        """Should accept a plain string path without building a Path."""
+        assert _infer_platform("notes", "/vault/daily/2024-01-15.md") == (
+            SourcePlatform.JOURNAL
+        )
+
 
 # ---- Frontmatter Merge Tests ----
 
@@ -454,6 +590,79 @@ class TestFrontmatterMerge:
         assert merged["source"] == {"platform": "journal"}
 
 
+# ---- Frontmatter Detection Tests ----
+
+
+class TestFrontmatterDetection:
+    """Tests for _may_have_frontmatter() and the parse fast path."""
+
+    @pytest.mark.parametrize(
+        ("raw_bytes", "encoding", "expected"),
+        [
+            (b"---\ntitle: x\n---\n", "utf-8", True),
+            (b"\xef\xbb\xbf---\ntitle: x\n---\n", "UTF-8-SIG", True),
+            (b"\n\n---\ntitle: x\n---\n", "ascii", True),
+            (b"+++\ntitle = 'x'\n+++\n", "utf-8", True),
+            (b'{\n"title": "x"\n}\n', "utf-8", True),
+            (b"# Heading\n\nBody.\n", "utf-8", False),
+            (b"", "utf-8", False),
+            (b"\xff\xfe#\x00", "UTF-16", True),
+            ("\u00a0---\ntitle: x\n---\n".encode(), "utf-8", True),
+            (b"\x1c---\ntitle: x\n---\n", "ascii", True),
+            ("\u00e9t\u00e9\n".encode(), "utf-8", True),
+        ],
+        ids=[
+            "yaml",
+            "yaml_after_bom",
+            "yaml_after_blank_lines",
+            "toml",
+            "json",
+            "no_delimiter",
+            "empty",
+            "utf16",
+            "yaml_after_nbsp",
+            "yaml_after_file_separator",
+            "non_ascii_start",
+        ],
+    )
+    def test_may_have_frontmatter(
+        self, raw_bytes: bytes, encoding: str, expected: bool
+    ) -> None:
+        """Should only rule out frontmatter when no delimiter can be present."""
+        assert _may_have_frontmatter(raw_bytes, encoding) is expected
+
+    def test_parse_skips_frontmatter_parser_without_delimiter(
+        self, md_ingestor: MarkdownIngestor, tmp_path: Path
+    ) -> None:
+        """Plain markdown should not be passed to the frontmatter parser."""
+        md_file = tmp_path / "plain.md"
+        md_file.write_text("\n# Plain\n\nBody.\n\n", encoding="utf-8")
+        (raw,) = md_ingestor.discover(md_file)
+        with patch.object(MarkdownIngestor, "_parse_frontmatter") as mock_parse:
+            fragments = md_ingestor.parse(raw)
+        mock_parse.assert_not_called()
+        assert fragments[0].content == "# Plain\n\nBody."
+        assert fragments[0].metadata["existing_frontmatter"] == {}
+
+    def test_parse_reads_frontmatter_after_unicode_whitespace(
+        self, md_ingestor: MarkdownIngestor, tmp_path: Path
+    ) -> None:
+        """Frontmatter after a no-break space should still be parsed."""
+        md_file = tmp_path / "nbsp.md"
+        md_file.write_text("\u00a0---\ntitle: Custom\n---\nBody.\n", encoding="utf-8")
+        (raw,) = md_ingestor.discover(md_file)
+        fragments = md_ingestor.parse(raw)
+        assert fragments[0].content == "Body."
+        assert fragments[0].metadata["existing_frontmatter"] == {"title": "Custom"}
+
+    def test_fast_path_matches_frontmatter_parser(
+        self, md_ingestor: MarkdownIngestor
+    ) -> None:
+        """The fast path should produce the same body as the full parser."""
+        text = "\n# Plain\n\nBody.\n\n"
+        assert md_ingestor._parse_frontmatter(text) == ({}, text.strip())
+
+
 # ---- convert_to_markdown Tests ----
 
 
@@ -466,7 +675,7 @@ class TestMarkdownIngestorConvertToMarkdown:
             content="# Hello\n\nWorld.\n",
             metadata={},
             source_path="/fake/test.md",
-            timestamp=datetime(2024, 1, 15, tzinfo=LA_TZ),
+            timestamp=_FIXED_TS,
         )
         result = md_ingestor.convert_to_markdown(fragment)
         assert result == "# Hello\n\nWorld.\n"
@@ -478,7 +687,7 @@ class TestMarkdownIngestorConvertToMarkdown:
             content=content,
             metadata={},
             source_path="/fake/test.md",
-            timestamp=datetime(2024, 1, 15, tzinfo=LA_TZ),
+            timestamp=_FIXED_TS,
         )
         result = md_ingestor.convert_to_markdown(fragment)
         assert result == content
@@ -489,7 +698,7 @@ class TestMarkdownIngestorConvertToMarkdown:
             content="",
             metadata={},
             source_path="/fake/test.md",
-            timestamp=datetime(2024, 1, 15, tzinfo=LA_TZ),
+            timestamp=_FIXED_TS,
         )
         result = md_ingestor.convert_to_markdown(fragment)
         assert result == ""
@@ -507,7 +716,7 @@ class TestMarkdownIngestorGenerateFrontmatter:
             content="# Hello\n\nWorld.\n",
             metadata={"document_type": "notes", "existing_frontmatter": {}},
             source_path="/fake/test.md",
-            timestamp=datetime(2024, 1, 15, tzinfo=LA_TZ),
+            timestamp=_FIXED_TS,
         )
         fm = md_ingestor.generate_frontmatter(fragment)
         assert fm["type"] == "fragment"
@@ -518,7 +727,7 @@ class TestMarkdownIngestorGenerateFrontmatter:
             content="# Hello\n\nWorld.\n",
             metadata={"document_type": "notes", "existing_frontmatter": {}},
             source_path="/fake/test.md",
-            timestamp=datetime(2024, 1, 15, tzinfo=LA_TZ),
+            timestamp=_FIXED_TS,
         )
         fm = md_ingestor.generate_frontmatter(fragment)
         assert "source" in fm
@@ -530,7 +739,7 @@ class TestMarkdownIngestorGenerateFrontmatter:
             content="# Hello\n\nWorld.\n",
             metadata={"document_type": "notes", "existing_frontmatter": {}},
             source_path="/fake/test.md",
-            timestamp=datetime(2024, 1, 15, tzinfo=LA_TZ),
+            timestamp=_FIXED_TS,
         )
         fm = md_ingestor.generate_frontmatter(fragment)
         assert fm["source"]["original_file"] == "/fake/test.md"
@@ -546,7 +755,7 @@ class TestMarkdownIngestorGenerateFrontmatter:
                 "existing_frontmatter": {"title": "My Custom Title", "tags": ["foo"]},
             },
             source_path="/fake/test.md",
-            timestamp=datetime(2024, 1, 15, tzinfo=LA_TZ),
+            timestamp=_FIXED_TS,
         )
         fm = md_ingestor.generate_frontmatter(fragment)
         # Existing title takes priority
@@ -581,7 +790,7 @@ class TestMarkdownIngestorGenerateFrontmatter:
                 },
             },
             source_path="/fake/test.md",
-            timestamp=datetime(2024, 1, 15, tzinfo=LA_TZ),
+            timestamp=_FIXED_TS,
         )
         fm = md_ingestor.generate_frontmatter(fragment)
         assert fm["type"] == "custom_type"
@@ -595,11 +804,44 @@ class TestMarkdownIngestorGenerateFrontmatter:
             content="Today I reflected on my progress.\n",
             metadata={"document_type": "journal", "existing_frontmatter": {}},
             source_path="/fake/journal.md",
-            timestamp=datetime(2024, 1, 15, tzinfo=LA_TZ),
+            timestamp=_FIXED_TS,
         )
         fm = md_ingestor.generate_frontmatter(fragment)
         assert fm["source"]["platform"] == SourcePlatform.JOURNAL
 
+    def test_title_from_heading(self, md_ingestor: MarkdownIngestor) -> None:
+        """Title should come from the first level-1 heading when present."""
+        fragment = ParsedFragment(
+            content="# Hello World\n\nBody.\n",
+            metadata={"document_type": "notes", "existing_frontmatter": {}},
+            source_path="/fake/some-file.md",
+            timestamp=_FIXED_TS,
+        )
+        fm = md_ingestor.generate_frontmatter(fragment)
+        assert fm["title"] == "Hello World"
+
+    @pytest.mark.parametrize(
+        ("source_path", "expected"),
+        [
+            ("/fake/some-file.md", "some-file"),
+            ("/fake/archive.tar.md", "archive.tar"),
+            ("/fake/no_extension", "no_extension"),
+            ("relative.md", "relative"),
+        ],
+    )
+    def test_title_falls_back_to_filename_stem(
+        self, md_ingestor: MarkdownIngestor, source_path: str, expected: str
+    ) -> None:
+        """Title should fall back to the filename stem without a heading."""
+        fragment = ParsedFragment(
+            content="Just some body text.\n",
+            metadata={"document_type": "notes", "existing_frontmatter": {}},
+            source_path=source_path,
+            timestamp=_FIXED_TS,
+        )
+        fm = md_ingestor.generate_frontmatter(fragment)
+        assert fm["title"] == expected == Path(source_path).stem
+
 
 # ---- Full Pipeline Integration Tests ----
 
@@ -678,6 +920,15 @@ class TestMarkdownIngestorRegistry:
 
         assert INGESTOR_REGISTRY["markdown"] is MarkdownIngestor
 
+    def test_import_does_not_load_frontmatter(self) -> None:
+        """Importing the ingest package should not import python-frontmatter."""
+        code = (
+            "import sys, creek.ingest; "
+            "sys.exit(1 if 'frontmatter' in sys.modules else 0)"
+        )
+        completed = subprocess.run([sys.executable, "-c", code], check=False)
+        assert completed.returncode == 0
+
 
 # ---- Edge Case Tests ----
 
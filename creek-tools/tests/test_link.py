@@ -6,6 +6,7 @@ LinkingResult, and LinkingPipeline orchestration.
 
 import logging
 from pathlib import Path
+from unittest.mock import patch
 
 from creek.config import EmbeddingsConfig, LinkingConfig
 from creek.link import (
@@ -138,30 +139,29 @@ class TestTemporalLinker:
     def test_find_temporal_links_returns_empty_list(self) -> None:
         """Stub find_temporal_links should return an empty list."""
         linker = TemporalLinker()
-        fragments = [_make_fragment("A"), _make_fragment("B")]
-        result = linker.find_temporal_links(fragments, window_hours=168)
+        result = linker.find_temporal_links(
+            ["frag-a", "frag-b"], [0.0, 3600.0], window_hours=168
+        )
         assert result == []
         assert isinstance(result, list)
 
     def test_find_temporal_links_empty_input(self) -> None:
         """find_temporal_links with empty list should return empty list."""
         linker = TemporalLinker()
-        result = linker.find_temporal_links([], window_hours=24)
+        result = linker.find_temporal_links([], [], window_hours=24)
         assert result == []
 
     def test_find_temporal_links_custom_window(self) -> None:
         """find_temporal_links should accept custom window_hours."""
         linker = TemporalLinker()
-        fragments = [_make_fragment("A")]
-        result = linker.find_temporal_links(fragments, window_hours=48)
+        result = linker.find_temporal_links(["frag-a"], [0.0], window_hours=48)
         assert result == []
 
     def test_find_temporal_links_logs_message(self, caplog) -> None:
         """find_temporal_links should log an info message."""
         linker = TemporalLinker()
-        fragments = [_make_fragment("A")]
         with caplog.at_level(logging.INFO, logger="creek.link.temporal"):
-            linker.find_temporal_links(fragments, window_hours=168)
+            linker.find_temporal_links(["frag-a"], [0.0], window_hours=168)
         assert any("temporal" in r.message.lower() for r in caplog.records)
 
 
@@ -286,6 +286,26 @@ class TestLinkingPipeline:
         assert pipeline.config is emb_config
         assert pipeline.linking_config is link_config
 
+    def test_init_builds_stage_objects_once(self) -> None:
+        """LinkingPipeline should build its stages once and reuse them."""
+        emb_config = EmbeddingsConfig()
+        pipeline = LinkingPipeline(config=emb_config, linking_config=LinkingConfig())
+        stages = (
+            pipeline.embedding_linker,
+            pipeline.temporal_linker,
+            pipeline.thread_detector,
+            pipeline.eddy_detector,
+        )
+        assert pipeline.embedding_linker.config is emb_config
+        pipeline.run(fragments=[_make_fragment("A")], vault_path=Path("/fake/vault"))
+        pipeline.run(fragments=[_make_fragment("B")], vault_path=Path("/fake/vault"))
+        assert stages == (
+            pipeline.embedding_linker,
+            pipeline.temporal_linker,
+            pipeline.thread_detector,
+            pipeline.eddy_detector,
+        )
+
     def test_run_returns_linking_result(self) -> None:
         """Pipeline.run should return a LinkingResult instance."""
         pipeline = LinkingPipeline(
@@ -315,6 +335,22 @@ class TestLinkingPipeline:
         assert result.thread_count == 0
         assert result.eddy_count == 0
 
+    def test_run_passes_fragment_columns_to_temporal_linker(self) -> None:
+        """Pipeline.run should hand the temporal stage ID and timestamp columns."""
+        pipeline = LinkingPipeline(
+            config=EmbeddingsConfig(),
+            linking_config=LinkingConfig(temporal_window_hours=12),
+        )
+        fragments = [_make_fragment("A"), _make_fragment("B")]
+        with patch.object(
+            pipeline.temporal_linker, "find_temporal_links", return_value=[]
+        ) as mock_find:
+            pipeline.run(fragments=fragments, vault_path=Path("/fake/vault"))
+        ids, created = mock_find.call_args.args
+        assert ids == [f.id for f in fragments]
+        assert list(created) == [f.created.timestamp() for f in fragments]
+        assert mock_find.call_args.kwargs == {"window_hours": 12}
+
     def test_run_empty_fragments(self) -> None:
         """Pipeline.run with empty fragment list should succeed."""
         pipeline = LinkingPipeline(
@@ -353,7 +389,7 @@ class TestLinkingPipeline:
             linking_config=LinkingConfig(),
         )
         fragment = _make_fragment("Test")
-        assert fragment.threads == []
+        assert fragment.threads == ()
         updated = pipeline.add_wikilinks(
             fragment=fragment,
             links=["[[Thread A]]", "[[Thread B]]"],
@@ -418,5 +454,5 @@ class TestLinkingPipeline:
             fragment=fragment,
             links=["[[Link]]"],
         )
-        assert fragment.threads == []
+        assert fragment.threads == ()
         assert "[[Link]]" in updated.threads
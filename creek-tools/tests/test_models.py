@@ -1,11 +1,16 @@
 """Tests for creek.models module — Pydantic models for ontological primitives."""
 
 import json
+import os
+import subprocess
+import sys
+import threading
 from datetime import date, datetime
 
 import pytest
 from pydantic import ValidationError
 
+from creek import models
 from creek.models import (
     Color,
     Confidence,
@@ -389,11 +394,11 @@ class TestFragment:
         assert frag.frequency.primary == "unclassified"
         assert frag.wavelength.phase == "unclassified"
         assert frag.voice.voice_register is None
-        assert frag.emotional_texture == []
-        assert frag.threads == []
-        assert frag.eddies == []
+        assert frag.emotional_texture == ()
+        assert frag.threads == ()
+        assert frag.eddies == ()
         assert frag.praxis_potential == "none"
-        assert frag.tags == []
+        assert frag.tags == ()
 
     def test_full_creation(self) -> None:
         """Fragment with all fields specified should work."""
@@ -483,6 +488,49 @@ class TestFragment:
         assert restored.tags == original.tags
 
 
+class TestFragmentLabels:
+    """Tests for Fragment's tuple-valued label fields."""
+
+    def test_empty_defaults_are_shared(self) -> None:
+        """Unset label fields should all reference the empty tuple."""
+        first = Fragment(title="a", source=FragmentSource(platform="other"))
+        second = Fragment(title="b", source=FragmentSource(platform="other"))
+        empty = ()
+        assert first.tags is second.tags is empty
+        assert first.threads is empty
+
+    def test_lists_are_coerced_to_tuples(self) -> None:
+        """List input should be stored as a tuple."""
+        frag = Fragment(
+            title="a",
+            source=FragmentSource(platform="other"),
+            tags=["x", "y"],
+        )
+        assert frag.tags == ("x", "y")
+
+    def test_labels_are_interned(self) -> None:
+        """Equal labels from separate inputs should share one object."""
+        label = "".join(["anx", "iety"])
+        other = "".join(["anxi", "ety"])
+        assert label is not other
+        first = Fragment(
+            title="a", source=FragmentSource(platform="other"), tags=[label]
+        )
+        second = Fragment(
+            title="b", source=FragmentSource(platform="other"), tags=[other]
+        )
+        assert first.tags[0] is second.tags[0]
+
+    def test_json_dump_emits_lists(self) -> None:
+        """JSON-mode dumps should keep list-shaped label fields."""
+        frag = Fragment(
+            title="a",
+            source=FragmentSource(platform="other"),
+            emotional_texture=["awe"],
+        )
+        assert frag.model_dump(mode="json")["emotional_texture"] == ["awe"]
+
+
 class TestThread:
     """Tests for the Thread model."""
 
@@ -790,6 +838,96 @@ class TestIdGeneration:
         ids = {Thread(title="Test").id for _ in range(100)}
         assert len(ids) == 100
 
+    def test_id_pool_refills_once_per_buffer(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """IDs should be sliced from one urandom read until it is drained."""
+        calls: list[int] = []
+        real_urandom = os.urandom
+
+        def _counting_urandom(n: int) -> bytes:
+            calls.append(n)
+            return real_urandom(n)
+
+        monkeypatch.setattr(models.os, "urandom", _counting_urandom)
+        models._reset_id_pool()
+
+        per_pool = models._ID_POOL_BYTES // 4
+        ids = {Eddy(title="Test").id for _ in range(per_pool + 1)}
+
+        assert len(ids) == per_pool + 1
+        assert calls == [models._ID_POOL_BYTES, models._ID_POOL_BYTES]
+
+    def test_id_pool_is_per_thread(self) -> None:
+        """Threads should draw from independent buffers."""
+        models._reset_id_pool()
+        main_buf = models._id_pool.buf
+        seen: list[bytes] = []
+
+        def _worker() -> None:
+            Thread(title="Test")
+            seen.append(models._id_pool.buf)
+
+        worker = threading.Thread(target=_worker)
+        worker.start()
+        worker.join()
+
+        assert models._id_pool.buf == main_buf
+        assert len(seen[0]) == models._ID_POOL_BYTES
+
+
+# ---- Schema Build Tests ----
+
+
+class TestDeferredBuild:
+    """Tests for lazily built model schemas."""
+
+    @pytest.mark.parametrize(
+        "model", ["Thread", "Eddy", "Praxis", "Decision", "WavelengthObservation"]
+    )
+    def test_schema_not_built_at_import(self, model: str) -> None:
+        """Less-hot models should defer schema building until first use."""
+        code = (
+            "import sys; from creek import models; "
+            f"sys.exit(1 if models.{model}.__pydantic_complete__ else 0)"
+        )
+        completed = subprocess.run([sys.executable, "-c", code], check=False)
+        assert completed.returncode == 0
+
+    def test_fragment_built_eagerly(self) -> None:
+        """Fragment is validated in the hot ingestion path and stays eager."""
+        assert Fragment.__pydantic_complete__
+
+    def test_deferred_model_validates_on_first_use(self) -> None:
+        """A deferred model should build and validate on construction."""
+        with pytest.raises(ValidationError):
+            Decision.model_validate({"title": 1})
+
+
+# ---- Type Adapter Tests ----
+
+
+class TestFragmentAdapter:
+    """Tests for the bulk fragment validator."""
+
+    def test_validates_list_of_dicts(self) -> None:
+        """FRAGMENT_ADAPTER should build Fragments with defaults applied."""
+        fragments = models.FRAGMENT_ADAPTER.validate_python(
+            [
+                {"title": "a", "source": {"platform": "other"}},
+                {"title": "b", "source": {"platform": "discord"}},
+            ]
+        )
+        assert [f.title for f in fragments] == ["a", "b"]
+        assert all(isinstance(f, Fragment) for f in fragments)
+        assert fragments[1].source.platform == SourcePlatform.DISCORD
+        assert fragments[0].id != fragments[1].id
+
+    def test_rejects_invalid_entry(self) -> None:
+        """An invalid entry should raise ValidationError for the batch."""
+        with pytest.raises(ValidationError):
+            models.FRAGMENT_ADAPTER.validate_python([{"title": "a"}])
+
 
 # ---- model_dump Enum Serialization Tests ----
 
@@ -813,6 +951,13 @@ class TestEnumSerialization:
         assert isinstance(dump["frequency"]["primary"], str)
         assert isinstance(dump["wavelength"]["phase"], str)
 
+    def test_enum_values_are_shared_objects(self) -> None:
+        """Stored enum values should be the enum's own str, not fresh copies."""
+        first = FrequencyClassification(primary="F3")
+        second = FrequencyClassification(primary=Frequency.F3)
+        assert first.primary is Frequency.F3.value
+        assert second.primary is Frequency.F3.value
+
     def test_thread_enums_as_strings(self) -> None:
         """Thread model_dump should serialize status as string."""
         thread = Thread(
@@ -10,13 +10,15 @@ from __future__ import annotations
 
 import json
 import shutil
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from creek.config import CreekConfig
+from creek.models import Fragment, SourcePlatform
 from creek.pipeline import Pipeline, PipelineResult
+from creek.redact.scanner import iter_files
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -77,6 +79,27 @@ def config() -> CreekConfig:
 
 
 @pytest.fixture()
+def ingestor_registry(source_path: Path) -> dict[str, MagicMock]:
+    """Build a mock INGESTOR_REGISTRY whose ingestor returns one fragment.
+
+    The fragment's provenance points at ``note1.md`` under *source_path*.
+    """
+    from datetime import datetime
+
+    from creek.ingest.base import IngestResult, ParsedFragment
+
+    fragment = ParsedFragment(
+        content="Test content about systems and patterns",
+        metadata={},
+        source_path=str(source_path / "note1.md"),
+        timestamp=datetime.now(),
+    )
+    mock_ingestor = MagicMock()
+    mock_ingestor.return_value.ingest.return_value = IngestResult(fragments=[fragment])
+    return {"mock": mock_ingestor}
+
+
+@pytest.fixture(scope="session")
 def fixtures_dir() -> Path:
     """Return the path to the tests/fixtures directory."""
     from pathlib import Path as _Path
@@ -84,6 +107,15 @@ def fixtures_dir() -> Path:
     return _Path(__file__).parent / "fixtures"
 
 
+@pytest.fixture(scope="session")
+def sample_exports(fixtures_dir: Path) -> dict[str, Any]:
+    """Read and parse the sample JSON exports once per test session."""
+    return {
+        name: json.loads((fixtures_dir / name).read_text())
+        for name in ("sample_claude_export.json", "sample_discord_export.json")
+    }
+
+
 # ---------------------------------------------------------------------------
 # PipelineResult model tests
 # ---------------------------------------------------------------------------
@@ -233,7 +265,7 @@ class TestPipelineStages:
         config = CreekConfig()
         config.redaction.enabled = False
         pipeline = Pipeline(config=config)
-        with patch.object(pipeline.scanner, "scan_directory") as mock_scan:
+        with patch.object(pipeline.scanner, "scan_paths") as mock_scan:
             result = pipeline.run(source_path=source_path, vault_path=vault_path)
             mock_scan.assert_not_called()
             # Files are still counted even when scanning is disabled
@@ -243,11 +275,26 @@ class TestPipelineStages:
         """Test that redaction scanner is called when enabled."""
         config = CreekConfig()
         pipeline = Pipeline(config=config)
-        with patch.object(
-            pipeline.scanner, "scan_directory", return_value=[]
-        ) as mock_scan:
+        with patch.object(pipeline.scanner, "scan_paths", return_value=[]) as mock_scan:
+            pipeline.run(source_path=source_path, vault_path=vault_path)
+            mock_scan.assert_called_once()
+            (paths,) = mock_scan.call_args.args
+            assert sorted(paths) == sorted(
+                p for p in source_path.rglob("*") if p.is_file()
+            )
+
+    def test_redaction_scans_files_in_sorted_order(self, vault_path, source_path):
+        """Test that the scanner gets files sorted, whatever the walk order."""
+        pipeline = Pipeline(config=CreekConfig())
+        walked = sorted(iter_files(source_path), reverse=True)
+        with (
+            patch("creek.pipeline.iter_files", return_value=iter(walked)),
+            patch.object(pipeline.scanner, "scan_paths", return_value=[]) as mock_scan,
+        ):
             pipeline.run(source_path=source_path, vault_path=vault_path)
-            mock_scan.assert_called_once_with(source_path)
+        (paths,) = mock_scan.call_args.args
+        assert len(paths) > 1
+        assert paths == sorted(walked)
 
     def test_redaction_logs_when_matches_found(self, vault_path, tmp_path):
         """Test that redaction scan logs findings when PII is detected."""
@@ -305,62 +352,40 @@ class TestPipelineStages:
 class TestPipelineWithFragments:
     """Tests for Pipeline.run() when fragments are produced by ingestion."""
 
-    def _make_mock_ingestor_registry(self, source_path):
-        """Build a mock INGESTOR_REGISTRY that returns one ParsedFragment.
-
-        Args:
-            source_path: The source path, used for provenance.
-
-        Returns:
-            A dict suitable for patching INGESTOR_REGISTRY.
-        """
-        from datetime import datetime
-
-        from creek.ingest.base import IngestResult, ParsedFragment
-
-        fragment = ParsedFragment(
-            content="Test content about systems and patterns",
-            metadata={},
-            source_path=str(source_path / "note1.md"),
-            timestamp=datetime.now(),
-        )
-        ingest_result = IngestResult(fragments=[fragment])
-
-        mock_ingestor = MagicMock()
-        mock_ingestor.return_value.ingest.return_value = ingest_result
-
-        return {"mock": mock_ingestor}
-
-    def test_ingestion_with_registered_ingestor(self, config, vault_path, source_path):
+    def test_ingestion_with_registered_ingestor(
+        self, config, vault_path, source_path, ingestor_registry
+    ):
         """Test that registered ingestors produce fragments."""
-        registry = self._make_mock_ingestor_registry(source_path)
         pipeline = Pipeline(config=config)
-        with patch("creek.pipeline.INGESTOR_REGISTRY", registry):
+        with patch("creek.pipeline.INGESTOR_REGISTRY", ingestor_registry):
             result = pipeline.run(source_path=source_path, vault_path=vault_path)
         assert result.fragments_created == 1
 
-    def test_classification_runs_on_fragments(self, config, vault_path, source_path):
+    def test_classification_runs_on_fragments(
+        self, config, vault_path, source_path, ingestor_registry
+    ):
         """Test that classification runs when fragments are available."""
-        registry = self._make_mock_ingestor_registry(source_path)
         pipeline = Pipeline(config=config)
-        with patch("creek.pipeline.INGESTOR_REGISTRY", registry):
+        with patch("creek.pipeline.INGESTOR_REGISTRY", ingestor_registry):
             result = pipeline.run(source_path=source_path, vault_path=vault_path)
         assert result.classifications_made == 1
 
-    def test_linking_runs_on_fragments(self, config, vault_path, source_path):
+    def test_linking_runs_on_fragments(
+        self, config, vault_path, source_path, ingestor_registry
+    ):
         """Test that linking runs when fragments are available."""
-        registry = self._make_mock_ingestor_registry(source_path)
         pipeline = Pipeline(config=config)
-        with patch("creek.pipeline.INGESTOR_REGISTRY", registry):
+        with patch("creek.pipeline.INGESTOR_REGISTRY", ingestor_registry):
             result = pipeline.run(source_path=source_path, vault_path=vault_path)
         # Linking returns counts (may be 0 with stubs, but it ran)
         assert result.links_found >= 0
 
-    def test_review_queue_generated(self, config, vault_path, source_path):
+    def test_review_queue_generated(
+        self, config, vault_path, source_path, ingestor_registry
+    ):
         """Test that review queue markdown is generated for fragments."""
-        registry = self._make_mock_ingestor_registry(source_path)
         pipeline = Pipeline(config=config)
-        with patch("creek.pipeline.INGESTOR_REGISTRY", registry):
+        with patch("creek.pipeline.INGESTOR_REGISTRY", ingestor_registry):
             pipeline.run(source_path=source_path, vault_path=vault_path)
         # Review queue file should exist in vault_path
         review_files = list(vault_path.glob("review-queue-*.md"))
@@ -382,6 +407,27 @@ class TestPipelinePrivateMethods:
         count = pipeline._run_redaction(tmp_path / "nope", result)
         assert count == 0
 
+    def test_run_redaction_file_source(self, config, tmp_path):
+        """Test _run_redaction counts nothing when given a single file."""
+        source = tmp_path / "one.md"
+        source.write_text("x")
+        pipeline = Pipeline(config=config)
+        assert pipeline._run_redaction(source, PipelineResult()) == 0
+
+    def test_run_walks_source_once(self, config, vault_path, source_path):
+        """Test run() walks the source tree once and shares the file list."""
+        from creek.redact import scanner
+
+        pipeline = Pipeline(config=config)
+        with (
+            patch("creek.pipeline.iter_files", wraps=scanner.iter_files) as mock_walk,
+            patch.object(type(source_path), "rglob", side_effect=AssertionError),
+        ):
+            result = pipeline.run(source_path=source_path, vault_path=vault_path)
+        mock_walk.assert_called_once_with(source_path)
+        assert result.files_scanned == 3
+        assert result.fragments_created == 3
+
     def test_run_ingestion_empty_registry(self, config, source_path):
         """Test _run_ingestion returns empty list when registry is empty."""
         pipeline = Pipeline(config=config)
@@ -390,6 +436,19 @@ class TestPipelinePrivateMethods:
             fragments = pipeline._run_ingestion(source_path, result)
         assert fragments == []
 
+    def test_run_ingestion_builds_fragments(
+        self, config, source_path, ingestor_registry
+    ):
+        """Test _run_ingestion validates one Fragment per parsed fragment."""
+        pipeline = Pipeline(config=config)
+        result = PipelineResult()
+        with patch("creek.pipeline.INGESTOR_REGISTRY", ingestor_registry):
+            fragments = pipeline._run_ingestion(source_path, result)
+        assert len(fragments) == 1
+        assert isinstance(fragments[0], Fragment)
+        assert fragments[0].title == str(source_path / "note1.md")
+        assert fragments[0].source.platform == SourcePlatform.OTHER
+
     def test_run_classification_no_fragments(self, config, vault_path):
         """Test _run_classification returns empty list for no fragments."""
         pipeline = Pipeline(config=config)
@@ -397,6 +456,25 @@ class TestPipelinePrivateMethods:
         classified = pipeline._run_classification([], vault_path, result)
         assert classified == []
 
+    def test_run_classification_batches_llm_stage(
+        self, config, vault_path, source_path, ingestor_registry
+    ):
+        """Test the LLM stage is invoked once with every rule-classified fragment."""
+        pipeline = Pipeline(config=config)
+        result = PipelineResult()
+        with patch("creek.pipeline.INGESTOR_REGISTRY", ingestor_registry):
+            fragments = pipeline._run_ingestion(source_path, result) * 3
+        with (
+            patch.object(
+                pipeline.llm_classifier, "classify_batch", side_effect=list
+            ) as mock_batch,
+            patch.object(pipeline.llm_classifier, "classify") as mock_single,
+        ):
+            classified = pipeline._run_classification(fragments, vault_path, result)
+        mock_batch.assert_called_once()
+        mock_single.assert_not_called()
+        assert [f.id for f in classified] == [f.id for f in fragments]
+
     def test_run_linking_no_fragments(self, config, vault_path):
         """Test _run_linking returns 0 for no fragments."""
         pipeline = Pipeline(config=config)
@@ -575,18 +653,16 @@ class TestFixtures:
         """Test that sample_discord_export.json exists."""
         assert (fixtures_dir / "sample_discord_export.json").exists()
 
-    def test_sample_claude_export_is_valid_json(self, fixtures_dir):
+    def test_sample_claude_export_is_valid_json(self, sample_exports):
         """Test that sample_claude_export.json is valid JSON."""
-        content = (fixtures_dir / "sample_claude_export.json").read_text()
-        data = json.loads(content)
+        data = sample_exports["sample_claude_export.json"]
         assert "conversation_id" in data
         assert "messages" in data
         assert len(data["messages"]) >= 2
 
-    def test_sample_discord_export_is_valid_json(self, fixtures_dir):
+    def test_sample_discord_export_is_valid_json(self, sample_exports):
         """Test that sample_discord_export.json is valid JSON."""
-        content = (fixtures_dir / "sample_discord_export.json").read_text()
-        data = json.loads(content)
+        data = sample_exports["sample_discord_export.json"]
         assert "channel" in data
         assert "messages" in data
         assert len(data["messages"]) >= 2
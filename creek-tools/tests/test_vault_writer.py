@@ -11,8 +11,10 @@ from __future__ import annotations
 
 import json
 from datetime import date, datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
+from unittest.mock import patch
 
+import frontmatter
 import pytest
 from pydantic import BaseModel
 
@@ -29,7 +31,7 @@ from creek.models import (
     Thread,
     ThreadStatus,
 )
-from creek.vault.writer import VaultWriter
+from creek.vault.writer import VaultWriter, _dump_frontmatter, read_provenance
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -567,6 +569,50 @@ class TestWriteAny:
             writer.write_any(Unknown())
 
 
+# ---- write_many ----
+
+
+class TestWriteMany:
+    """Tests for batched, threaded writes."""
+
+    @pytest.mark.parametrize("count", [3, 20])
+    def test_write_many_matches_write_any(
+        self,
+        vault_path: Path,
+        count: int,
+    ) -> None:
+        """Batched writes should land where write_any puts them, in order."""
+        platforms = [SourcePlatform.CLAUDE, SourcePlatform.JOURNAL]
+        models: list[BaseModel] = [
+            Fragment(
+                id=f"frag-{i:08d}",
+                title=f"Note {i}",
+                source=FragmentSource(platform=platforms[i % 2]),
+            )
+            for i in range(count)
+        ]
+        models.append(models[0])
+
+        paths = VaultWriter(vault_path).write_many(models)
+
+        assert len(paths) == count + 1
+        assert paths[-1] == paths[0]
+        assert len(set(paths)) == count
+        assert [p.parent.name for p in paths[:2]] == ["Conversations", "Journal"]
+        assert len(read_provenance(vault_path)) == count
+        fresh = VaultWriter(vault_path)
+        assert [fresh.write_any(m) for m in models] == paths
+
+    def test_write_many_unknown_type_raises(self, writer: VaultWriter) -> None:
+        """An unsupported model type should be rejected before any write."""
+
+        class Other(BaseModel):
+            type: str = "unknown"
+
+        with pytest.raises(ValueError, match="Unsupported model type"):
+            writer.write_many([Other()])
+
+
 # ---- Filename Sanitization ----
 
 
@@ -639,6 +685,60 @@ class TestFilenameSanitization:
         assert result.name[4] == "-"
 
 
+# ---- Frontmatter Emission ----
+
+
+class TestFrontmatterEmission:
+    """Tests for the direct YAML frontmatter emitter."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "plain-id_01",
+            "A title, with (some) punctuation!",
+            "trailing space ",
+            "word #not-comment",
+            "Caf\u00e9 au lait",
+            "yes",
+            "Null",
+            "",
+            "2025-01-15",
+            "0x1F",
+            "a: b",
+            "- item",
+            "#hash",
+            "'single' and \"double\"",
+            "line\nbreak\ttab",
+            "caf\u00e9 \U0001f600",
+            "\u2028\x85\x7f",
+        ],
+    )
+    def test_string_round_trips(self, value: str) -> None:
+        """Strings that YAML could misread should load back unchanged."""
+        data = {"title": value, "tags": [value], "nested": {"value": value}}
+        post = frontmatter.loads(_dump_frontmatter(data))
+        assert post.metadata == data
+
+    def test_model_round_trips(self, sample_decision: Decision) -> None:
+        """A model dump should load back as the same mapping."""
+        data = sample_decision.model_dump(mode="json")
+        assert frontmatter.loads(_dump_frontmatter(data)).metadata == data
+
+    def test_scalars_and_empty_containers(self) -> None:
+        """Scalars, empty lists and mappings use YAML's own spellings."""
+        text = _dump_frontmatter(
+            {"flag": True, "ratio": 0.5, "count": 3, "none": None, "a": [], "m": {}}
+        )
+        assert text == (
+            "---\na: []\ncount: 3\nflag: true\nm: {}\nnone: null\nratio: 0.5\n---"
+        )
+
+    def test_unsupported_value_falls_back(self) -> None:
+        """Values the emitter cannot spell exactly go through PyYAML."""
+        data = {"confidence": 1e-05, "title": "x"}
+        assert frontmatter.loads(_dump_frontmatter(data)).metadata == data
+
+
 # ---- Duplicate Detection ----
 
 
@@ -695,6 +795,52 @@ class TestDuplicateDetection:
         second = writer.write_decision(sample_decision)
         assert first == second
 
+    def test_existing_file_detected_by_new_writer(
+        self,
+        vault_path: Path,
+        sample_fragment: Fragment,
+    ) -> None:
+        """A fresh writer should index files written by an earlier one."""
+        first = VaultWriter(vault_path).write_fragment(sample_fragment)
+        second = VaultWriter(vault_path).write_fragment(sample_fragment)
+        assert first == second
+
+    def test_existing_files_parsed_once_per_directory(
+        self,
+        vault_path: Path,
+    ) -> None:
+        """Repeated writes should not re-read every file in the directory."""
+        fragments = [
+            Fragment(
+                id=f"frag-0000000{i}",
+                title=f"Note {i}",
+                source=FragmentSource(platform=SourcePlatform.JOURNAL),
+            )
+            for i in range(4)
+        ]
+        for fragment in fragments[:2]:
+            VaultWriter(vault_path).write_fragment(fragment)
+
+        writer = VaultWriter(vault_path)
+        with patch(
+            "creek.vault.writer.frontmatter.load", wraps=frontmatter.load
+        ) as load:
+            for fragment in fragments:
+                writer.write_fragment(fragment)
+
+        assert load.call_count == 2
+
+    def test_deleted_file_is_rewritten(
+        self,
+        writer: VaultWriter,
+        sample_fragment: Fragment,
+    ) -> None:
+        """A file removed after indexing should be written again."""
+        first = writer.write_fragment(sample_fragment)
+        first.unlink()
+        second = writer.write_fragment(sample_fragment)
+        assert second.exists()
+
 
 # ---- Uniqueness: Same Title Different ID ----
 
@@ -725,6 +871,29 @@ class TestFilenameUniqueness:
         assert path1.exists()
         assert path2.exists()
 
+    def test_file_created_after_listing_not_overwritten(
+        self,
+        writer: VaultWriter,
+    ) -> None:
+        """A note that appears after the directory was listed is kept."""
+
+        def fragment(frag_id: str) -> Fragment:
+            return Fragment(
+                id=frag_id,
+                title="Same Title",
+                source=FragmentSource(platform=SourcePlatform.CLAUDE),
+                created=datetime(2025, 1, 15, 10, 0, 0),
+            )
+
+        first = writer.write_fragment(fragment("frag-aaaa0001"))
+        external = first.with_name("2025-01-15-Same-Title-1.md")
+        external.write_text("hand-written", encoding="utf-8")
+
+        second = writer.write_fragment(fragment("frag-bbbb0001"))
+
+        assert external.read_text(encoding="utf-8") == "hand-written"
+        assert second.name == "2025-01-15-Same-Title-2.md"
+
 
 # ---- Provenance Logging ----
 
@@ -740,9 +909,44 @@ class TestProvenanceLogging:
     ) -> None:
         """Writing a fragment creates/updates the provenance log."""
         writer.write_fragment(sample_fragment)
-        log_path = vault_path / "00-Creek-Meta" / "Processing-Log" / "provenance.json"
+        log_path = vault_path / "00-Creek-Meta" / "Processing-Log" / "provenance.jsonl"
         assert log_path.exists()
 
+    def test_provenance_log_one_entry_per_line(
+        self,
+        writer: VaultWriter,
+        sample_fragment: Fragment,
+        sample_thread: Thread,
+        vault_path: Path,
+    ) -> None:
+        """Each write appends exactly one JSON line."""
+        writer.write_fragment(sample_fragment)
+        writer.write_thread(sample_thread)
+        log_path = vault_path / "00-Creek-Meta" / "Processing-Log" / "provenance.jsonl"
+        lines = log_path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [
+            "frag-test0001",
+            "thread-test001",
+        ]
+
+    def test_legacy_provenance_log_migrated(
+        self,
+        writer: VaultWriter,
+        sample_fragment: Fragment,
+        vault_path: Path,
+    ) -> None:
+        """A legacy JSON-array log is converted and kept ahead of new entries."""
+        log_dir = vault_path / "00-Creek-Meta" / "Processing-Log"
+        legacy = [{"id": "frag-old00001", "type": "fragment", "path": "x.md"}]
+        (log_dir / "provenance.json").write_text(json.dumps(legacy), encoding="utf-8")
+        assert read_provenance(vault_path) == legacy
+
+        writer.write_fragment(sample_fragment)
+
+        assert not (log_dir / "provenance.json").exists()
+        ids = [e["id"] for e in read_provenance(vault_path)]
+        assert ids == ["frag-old00001", "frag-test0001"]
+
     def test_provenance_log_contains_entry(
         self,
         writer: VaultWriter,
@@ -751,10 +955,7 @@ class TestProvenanceLogging:
     ) -> None:
         """Provenance log contains an entry for the written fragment."""
         writer.write_fragment(sample_fragment)
-        log_path = vault_path / "00-Creek-Meta" / "Processing-Log" / "provenance.json"
-        entries: list[dict[str, Any]] = json.loads(
-            log_path.read_text(encoding="utf-8"),
-        )
+        entries = read_provenance(vault_path)
         assert len(entries) == 1
         assert entries[0]["id"] == "frag-test0001"
         assert entries[0]["type"] == "fragment"
@@ -769,10 +970,7 @@ class TestProvenanceLogging:
         """Multiple writes append to the provenance log."""
         writer.write_fragment(sample_fragment)
         writer.write_thread(sample_thread)
-        log_path = vault_path / "00-Creek-Meta" / "Processing-Log" / "provenance.json"
-        entries: list[dict[str, Any]] = json.loads(
-            log_path.read_text(encoding="utf-8"),
-        )
+        entries = read_provenance(vault_path)
         assert len(entries) == 2
         ids = {e["id"] for e in entries}
         assert "frag-test0001" in ids
@@ -786,10 +984,7 @@ class TestProvenanceLogging:
     ) -> None:
         """Provenance log entry includes the written file path."""
         result = writer.write_fragment(sample_fragment)
-        log_path = vault_path / "00-Creek-Meta" / "Processing-Log" / "provenance.json"
-        entries: list[dict[str, Any]] = json.loads(
-            log_path.read_text(encoding="utf-8"),
-        )
+        entries = read_provenance(vault_path)
         assert entries[0]["path"] == str(result)
 
     def test_provenance_log_has_timestamp(
@@ -800,10 +995,7 @@ class TestProvenanceLogging:
     ) -> None:
         """Provenance log entry includes a timestamp."""
         writer.write_fragment(sample_fragment)
-        log_path = vault_path / "00-Creek-Meta" / "Processing-Log" / "provenance.json"
-        entries: list[dict[str, Any]] = json.loads(
-            log_path.read_text(encoding="utf-8"),
-        )
+        entries = read_provenance(vault_path)
         assert "written_at" in entries[0]
 
     def test_duplicate_not_logged_again(
@@ -815,8 +1007,5 @@ class TestProvenanceLogging:
         """Writing a duplicate does not add a second provenance entry."""
         writer.write_fragment(sample_fragment)
         writer.write_fragment(sample_fragment)
-        log_path = vault_path / "00-Creek-Meta" / "Processing-Log" / "provenance.json"
-        entries: list[dict[str, Any]] = json.loads(
-            log_path.read_text(encoding="utf-8"),
-        )
+        entries = read_provenance(vault_path)
         assert len(entries) == 1